@@ -0,0 +1,190 @@
+"""
+Deterministic synthetic datasets for benchmarking the validator.
+
+Tables mirror ``sample_data``: a ``health`` table with the same vital-sign
+and blood-panel columns, and a ``genomics`` table with gene expression
+measurements. Data is written in chunks, so row counts up to 10^8 only need
+memory for one chunk. The same seed and parameters, ``chunk_rows`` included,
+always produce the same bytes; each chunk draws its own random values, so a
+different chunk size gives a different file.
+
+Error injection is controlled per cell by four rates:
+
+* ``missing_rate``: empty cells in every column except ``id``
+* ``outlier_rate``: values outside the column's domain range
+* ``mixed_rate``: non-numeric tokens in numeric columns
+* ``bad_date_rate``: unparseable values in date columns
+
+    python benchmarks/generate.py health 1000000 data.csv --outlier-rate 0.01
+"""
+
+import argparse
+import json
+import os
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+CHUNK_ROWS = 1_000_000
+
+# name -> (low, high, decimals, out-of-range value); ranges follow sample_data.
+HEALTH_COLUMNS = {
+    "age": (18, 90, 0, 150),
+    "cholesterol": (120.0, 240.0, 1, 1000.0),
+    "blood_sugar": (70.0, 110.0, 1, 400.0),
+    "systolic_bp": (95, 135, 0, 250),
+    "diastolic_bp": (60, 90, 0, 250),
+    "heart_rate": (55, 100, 0, 300),
+    "bmi": (18.5, 32.0, 1, 95.0),
+    "temperature": (36.1, 37.2, 1, 45.0),
+    "hemoglobin": (12.0, 17.0, 1, 40.0),
+    "wbc_count": (4.0, 11.0, 1, 80.0),
+}
+GENOMICS_COLUMNS = {
+    "expression_level": (0.0, 5000.0, 3, -12.5),
+    "read_count": (0, 100000, 0, -1),
+    "age": (18, 90, 0, 150),
+}
+GENES = np.array(["BRCA1", "BRCA2", "TP53", "EGFR", "KRAS", "MYC", "PTEN", "APOE"])
+MIXED_TOKENS = np.array(["abc", "error", "high", "pending"])
+BAD_DATES = np.array(["2025-13-45", "not a date", "31/12/2024", "2024-02-30"])
+DATE_START = np.datetime64("2024-06-01")
+DATE_DAYS = 365
+
+TABLES = ("health", "genomics")
+
+
+def _inject(column: pd.Series, rng: np.random.Generator, rate: float, tokens: np.ndarray) -> pd.Series:
+    if rate <= 0:
+        return column
+    mask = rng.random(len(column)) < rate
+    if not mask.any():
+        return column
+    column = column.astype(object)
+    column[mask] = rng.choice(tokens, int(mask.sum()))
+    return column
+
+
+def _numeric_column(rng, n, spec, outlier_rate, mixed_rate):
+    low, high, decimals, outlier = spec
+    if decimals:
+        values = np.round(rng.uniform(low, high, n), decimals)
+    else:
+        values = rng.integers(low, high + 1, n).astype(np.int64)
+    if outlier_rate > 0:
+        values[rng.random(n) < outlier_rate] = outlier
+    return _inject(pd.Series(values), rng, mixed_rate, MIXED_TOKENS)
+
+
+def _dates(rng, n, bad_date_rate):
+    days = rng.integers(0, DATE_DAYS, n)
+    dates = pd.Series((DATE_START + days).astype(str))
+    return _inject(dates, rng, bad_date_rate, BAD_DATES)
+
+
+def make_chunk(table: str, start: int, rows: int, rng: np.random.Generator, missing_rate: float = 0.0,
+               outlier_rate: float = 0.0, mixed_rate: float = 0.0, bad_date_rate: float = 0.0) -> pd.DataFrame:
+    """Build rows ``[start, start + rows)`` of ``table``."""
+    if table not in TABLES:
+        raise ValueError(f"unknown table {table!r}; expected one of {TABLES}")
+
+    columns: Dict[str, pd.Series] = {"id": pd.Series(np.arange(start + 1, start + rows + 1))}
+    if table == "genomics":
+        columns["sample_id"] = pd.Series(np.char.add("S", (np.arange(start, start + rows) // 100).astype(str)))
+        columns["gene_name"] = pd.Series(rng.choice(GENES, rows))
+        specs = GENOMICS_COLUMNS
+        date_column = "collection_date"
+    else:
+        specs = HEALTH_COLUMNS
+        date_column = "sample_date"
+    for name, spec in specs.items():
+        columns[name] = _numeric_column(rng, rows, spec, outlier_rate, mixed_rate)
+    columns[date_column] = _dates(rng, rows, bad_date_rate)
+
+    df = pd.DataFrame(columns)
+    if missing_rate > 0:
+        for name in df.columns[1:]:
+            mask = rng.random(rows) < missing_rate
+            if mask.any():
+                df[name] = df[name].astype(object).where(~mask, None)
+    return df
+
+
+def generate_csv(path: str, rows: int, table: str = "health", seed: int = 0, chunk_rows: int = CHUNK_ROWS,
+                 **rates: float) -> str:
+    """Write ``rows`` rows of ``table`` to ``path`` as CSV and return the path.
+
+    ``rates`` accepts ``missing_rate``, ``outlier_rate``, ``mixed_rate`` and
+    ``bad_date_rate``.
+    """
+    rng = np.random.default_rng(seed)
+    with open(path, "w", newline="") as f:
+        for start in range(0, max(rows, 1), chunk_rows):
+            count = min(chunk_rows, rows - start)
+            make_chunk(table, start, count, rng, **rates).to_csv(f, header=start == 0, index=False)
+    return path
+
+
+def _record(row: dict, measurements: np.ndarray) -> dict:
+    record = {key: value for key, value in row.items() if value is not None and value == value}
+    record["measurements"] = measurements.tolist()
+    return record
+
+
+def generate_json(path: str, records: int, seed: int = 0, ndjson: bool = False, chunk_rows: int = 100_000,
+                  **rates: float) -> str:
+    """Write ``records`` genomics records as a JSON document or as NDJSON.
+
+    A JSON document is an object whose ``records`` array holds every record,
+    so list-consistency checks run on it; records missing ``id`` come from
+    ``missing_rate``. ``bad_date_rate`` does not apply.
+    """
+    rates.pop("bad_date_rate", None)
+    rng = np.random.default_rng(seed)
+    with open(path, "w") as f:
+        if not ndjson:
+            f.write('{"dataset": "synthetic", "records": [')
+        for start in range(0, records, chunk_rows):
+            count = min(chunk_rows, records - start)
+            df = make_chunk("genomics", start, count, rng, **rates)
+            # make_chunk never blanks ``id``; do it here for missing_rate.
+            drop_id = rng.random(count) < rates.get("missing_rate", 0.0)
+            measurements = np.round(rng.normal(size=(count, 3)), 4)
+            lines = []
+            for i, row in enumerate(df.to_dict("records")):
+                if drop_id[i]:
+                    del row["id"]
+                lines.append(json.dumps(_record(row, measurements[i])))
+            if ndjson:
+                f.write("\n".join(lines) + "\n")
+            else:
+                f.write(("," if start else "") + ",".join(lines))
+        if not ndjson:
+            f.write("]}")
+    return path
+
+
+def main(argv: Optional[list] = None) -> None:
+    parser = argparse.ArgumentParser(description="Generate a synthetic benchmark dataset.")
+    parser.add_argument("table", choices=TABLES + ("json", "ndjson"))
+    parser.add_argument("rows", type=float, help="Number of rows/records (1e6 style accepted)")
+    parser.add_argument("path")
+    parser.add_argument("--seed", type=int, default=0)
+    for rate in ("missing", "outlier", "mixed", "bad-date"):
+        parser.add_argument(f"--{rate}-rate", type=float, default=0.0)
+    args = parser.parse_args(argv)
+
+    rates = {
+        "missing_rate": args.missing_rate, "outlier_rate": args.outlier_rate,
+        "mixed_rate": args.mixed_rate, "bad_date_rate": args.bad_date_rate,
+    }
+    if args.table in ("json", "ndjson"):
+        generate_json(args.path, int(args.rows), args.seed, ndjson=args.table == "ndjson", **rates)
+    else:
+        generate_csv(args.path, int(args.rows), args.table, args.seed, **rates)
+    print(f"Wrote {int(args.rows):,} rows to {args.path} ({os.path.getsize(args.path) / 2**20:.1f} MiB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,221 @@
+"""
+Benchmark runner: times each ``report_*`` function and the end-to-end
+``validate_file`` and CLI paths on generated datasets.
+
+Every case runs in a fresh Python process, so its peak RSS is its own. The
+results are written as JSON and can be compared against a stored baseline.
+The comparison fails (exit status 1) when a case's rows/sec drops, or its
+peak RSS grows, by more than the thresholds.
+
+    python benchmarks/run.py --sizes 1e3,1e5 --output results.json
+    python benchmarks/run.py --baseline benchmarks/baseline.json
+    python benchmarks/run.py --save-baseline benchmarks/baseline.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from typing import Dict, List, Optional
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+SRC = os.path.join(HERE, "..", "src")
+sys.path.insert(0, SRC)
+sys.path.insert(0, HERE)
+
+from generate import generate_csv, generate_json
+
+DEFAULT_SIZES = "1e3,1e4,1e5"
+DEFAULT_RATES = {"missing_rate": 0.01, "outlier_rate": 0.005, "mixed_rate": 0.001, "bad_date_rate": 0.01}
+
+# case -> dataset kind
+CASES = {
+    "report_missing": "csv",
+    "report_outliers": "csv",
+    "report_type_errors": "csv",
+    "validate_file": "csv",
+    "validate_file_chunked": "csv",
+    "cli": "csv",
+    "validate_json": "json",
+    "validate_ndjson": "ndjson",
+}
+# Cases that hold the whole table in memory are skipped above this size.
+IN_MEMORY_LIMIT = 10_000_000
+IN_MEMORY_CASES = {"report_missing", "report_outliers", "report_type_errors", "validate_file"}
+
+
+def _peak_rss_mib(who: str = "self") -> Optional[float]:
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    usage = resource.getrusage(resource.RUSAGE_SELF if who == "self" else resource.RUSAGE_CHILDREN)
+    # ru_maxrss is KiB on Linux and bytes on macOS.
+    scale = 1 if sys.platform == "darwin" else 1024
+    return usage.ru_maxrss * scale / 2**20
+
+
+def _run_case(case: str, path: str) -> dict:
+    """Time one case in the current process (called in the child)."""
+    import pandas as pd
+    from data_validator import utils
+    from data_validator.validators import validate_file
+
+    if case.startswith("report_"):
+        df = pd.read_csv(path)
+        func = getattr(utils, case)
+        start = time.perf_counter()
+        func(df)
+        seconds = time.perf_counter() - start
+        return {"seconds": seconds, "peak_rss_mib": _peak_rss_mib()}
+
+    if case == "cli":
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, "-m", "data_validator", "validate", path, "--no-cache", "--jobs", "1"],
+            check=True, stdout=subprocess.DEVNULL, env=dict(os.environ, PYTHONPATH=SRC),
+        )
+        seconds = time.perf_counter() - start
+        return {"seconds": seconds, "peak_rss_mib": _peak_rss_mib("children")}
+
+    kwargs = {"chunksize": 100_000} if case == "validate_file_chunked" else {}
+    start = time.perf_counter()
+    report = validate_file(path, **kwargs)
+    seconds = time.perf_counter() - start
+    if report["status"] == "ERROR":
+        raise RuntimeError(report["error"])
+    return {"seconds": seconds, "peak_rss_mib": _peak_rss_mib()}
+
+
+def _dataset(data_dir: str, kind: str, rows: int, seed: int) -> str:
+    suffix = {"csv": ".csv", "json": ".json", "ndjson": ".jsonl"}[kind]
+    path = os.path.join(data_dir, f"{kind}-{rows}-seed{seed}{suffix}")
+    if not os.path.exists(path):
+        tmp = path + ".tmp"
+        if kind == "csv":
+            generate_csv(tmp, rows, "health", seed, **DEFAULT_RATES)
+        else:
+            generate_json(tmp, rows, seed, ndjson=kind == "ndjson", **DEFAULT_RATES)
+        os.replace(tmp, path)
+    return path
+
+
+def run(sizes: List[int], cases: List[str], data_dir: str, seed: int = 0, repeat: int = 1) -> dict:
+    """Run every case at every size and return the results document."""
+    import pandas as pd
+    from data_validator import __version__
+
+    os.makedirs(data_dir, exist_ok=True)
+    results = []
+    for rows in sizes:
+        for case in cases:
+            if case in IN_MEMORY_CASES and rows > IN_MEMORY_LIMIT:
+                continue
+            path = _dataset(data_dir, CASES[case], rows, seed)
+            best = None
+            for _ in range(repeat):
+                out = subprocess.run(
+                    [sys.executable, __file__, "--child", case, path],
+                    check=True, capture_output=True, text=True,
+                )
+                measured = json.loads(out.stdout.strip().splitlines()[-1])
+                if best is None or measured["seconds"] < best["seconds"]:
+                    best = measured
+            result = {
+                "case": case,
+                "rows": rows,
+                "seconds": round(best["seconds"], 6),
+                "rows_per_sec": round(rows / best["seconds"], 1) if best["seconds"] > 0 else None,
+                "peak_rss_mib": round(best["peak_rss_mib"], 1) if best["peak_rss_mib"] is not None else None,
+            }
+            results.append(result)
+            print(f"{case:>22} {rows:>12,} rows {result['seconds']:>10.3f}s "
+                  f"{result['rows_per_sec'] or 0:>14,.0f} rows/s {result['peak_rss_mib'] or 0:>8.1f} MiB", flush=True)
+
+    return {
+        "meta": {
+            "validator_version": __version__,
+            "python": platform.python_version(),
+            "pandas": pd.__version__,
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "seed": seed,
+            "rates": DEFAULT_RATES,
+        },
+        "results": results,
+    }
+
+
+def compare(current: dict, baseline: dict, speed_threshold: float, memory_threshold: float) -> List[str]:
+    """Return one message per case that regressed against ``baseline``."""
+    previous: Dict[tuple, dict] = {(r["case"], r["rows"]): r for r in baseline["results"]}
+    regressions = []
+    for result in current["results"]:
+        before = previous.get((result["case"], result["rows"]))
+        if before is None:
+            continue
+        label = f"{result['case']} @ {result['rows']:,} rows"
+        if before["rows_per_sec"] and result["rows_per_sec"] is not None:
+            change = result["rows_per_sec"] / before["rows_per_sec"] - 1
+            if change < -speed_threshold:
+                regressions.append(f"{label}: rows/sec {before['rows_per_sec']:,.0f} -> "
+                                   f"{result['rows_per_sec']:,.0f} ({change:+.0%})")
+        if before["peak_rss_mib"] and result["peak_rss_mib"] is not None:
+            change = result["peak_rss_mib"] / before["peak_rss_mib"] - 1
+            if change > memory_threshold:
+                regressions.append(f"{label}: peak RSS {before['peak_rss_mib']:.1f} -> "
+                                   f"{result['peak_rss_mib']:.1f} MiB ({change:+.0%})")
+    return regressions
+
+
+def main(argv: Optional[list] = None) -> int:
+    parser = argparse.ArgumentParser(description="Run the validator benchmark suite.")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help="Comma-separated row counts (1e6 style accepted)")
+    parser.add_argument("--cases", default=",".join(CASES), help="Comma-separated cases to run")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=1, help="Runs per case; the fastest is kept")
+    parser.add_argument("--data-dir", default=os.path.join(HERE, ".data"), help="Where generated datasets are kept")
+    parser.add_argument("--output", help="Write results JSON here")
+    parser.add_argument("--baseline", help="Compare against this results JSON")
+    parser.add_argument("--save-baseline", help="Write results JSON here as the new baseline")
+    parser.add_argument("--speed-threshold", type=float, default=0.25,
+                        help="Allowed fractional drop in rows/sec before failing")
+    parser.add_argument("--memory-threshold", type=float, default=0.25,
+                        help="Allowed fractional growth in peak RSS before failing")
+    parser.add_argument("--child", nargs=2, metavar=("CASE", "PATH"), help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        print(json.dumps(_run_case(*args.child)))
+        return 0
+
+    cases = args.cases.split(",")
+    unknown = set(cases) - set(CASES)
+    if unknown:
+        parser.error(f"unknown case(s): {', '.join(sorted(unknown))}")
+    sizes = [int(float(size)) for size in args.sizes.split(",")]
+
+    current = run(sizes, cases, args.data_dir, args.seed, args.repeat)
+    for path in (args.output, args.save_baseline):
+        if path:
+            with open(path, "w") as f:
+                json.dump(current, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(current, baseline, args.speed_threshold, args.memory_threshold)
+        if regressions:
+            print("\nRegressions against baseline:")
+            for message in regressions:
+                print(f"  - {message}")
+            return 1
+        print("\nNo regressions against baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+"""
+Compare the fused column scanner with the three separate report functions.
+
+Reports wall time, peak traced allocations, and how many times a column was
+walked for null handling (``isna``/``dropna`` calls), on a synthetic frame.
+
+    python benchmarks/scanner_benchmark.py --rows 1000000
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from data_validator.scanner import scan_frame
+from data_validator.utils import report_missing, report_outliers, report_type_errors
+
+
+def make_frame(rows: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    age = rng.integers(0, 125, rows).astype(float)
+    age[rng.random(rows) < 0.01] = np.nan
+    return pd.DataFrame({
+        "sample_id": np.arange(rows),
+        "age": age,
+        "heart_rate": rng.integers(40, 210, rows),
+        "expression_level": rng.lognormal(size=rows),
+        "gene_name": rng.choice(["BRCA1", "TP53", "EGFR", "12"], rows),
+        "collection_date": rng.choice(["2024-01-05", "2024-02-30", "01/05/2024"], rows),
+    })
+
+
+def separate(df):
+    return report_missing(df), report_outliers(df), report_type_errors(df)
+
+
+class _NullPassCounter:
+    """Count isna/dropna calls on Series while active."""
+
+    def __enter__(self):
+        self.calls = 0
+        self._originals = {name: getattr(pd.Series, name) for name in ("isna", "dropna")}
+        for name, original in self._originals.items():
+            setattr(pd.Series, name, self._wrap(original))
+        return self
+
+    def _wrap(self, original):
+        def wrapper(series, *args, **kwargs):
+            self.calls += 1
+            return original(series, *args, **kwargs)
+        return wrapper
+
+    def __exit__(self, *exc):
+        for name, original in self._originals.items():
+            setattr(pd.Series, name, original)
+
+
+def measure(func, df, repeat):
+    with _NullPassCounter() as counter:
+        result = func(df)
+    tracemalloc.start()
+    func(df)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(df)
+        best = min(best, time.perf_counter() - start)
+    return result, best, peak, counter.calls
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=500_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    df = make_frame(args.rows)
+    old, old_time, old_peak, old_passes = measure(separate, df, args.repeat)
+    new, new_time, new_peak, new_passes = measure(scan_frame, df, args.repeat)
+    assert old == new, "fused scan must reproduce the separate reports"
+
+    print(f"{args.rows:,} rows x {len(df.columns)} columns")
+    print(f"{'':>10} {'seconds':>10} {'peak MiB':>10} {'null passes':>12}")
+    print(f"{'separate':>10} {old_time:>10.3f} {old_peak / 2**20:>10.1f} {old_passes:>12}")
+    print(f"{'fused':>10} {new_time:>10.3f} {new_peak / 2**20:>10.1f} {new_passes:>12}")
+
+
+if __name__ == "__main__":
+    main()
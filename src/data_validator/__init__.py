@@ -12,7 +12,15 @@ __version__ = "1.0.0"
 __author__ = "Eric Duong"
 __email__ = "duongmeric@gmail.com"
 
-from .validators import validate_file
 from .cli import cli
 
 __all__ = ["validate_file", "cli"]
+
+
+def __getattr__(name):
+    # validators loads pandas, which the CLI only needs when it validates
+    # in-process rather than through the daemon, so it is imported on first use.
+    if name == "validate_file":
+        from .validators import validate_file
+        return validate_file
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
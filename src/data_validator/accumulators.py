@@ -0,0 +1,286 @@
+"""
+Per-column accumulators that turn a stream of DataFrame chunks into the same
+missing/outlier/type-error report that the in-memory checks in ``utils``
+produce for a whole DataFrame.
+
+Every accumulator is mergeable, so chunks (or byte ranges of a file) can be
+folded in any order. All counts are exact; only the IQR bounds behind the
+``*_statistical`` entries come from a ``QuantileSketch`` and carry its error
+bound once a column holds more than the sketch capacity.
+"""
+
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Optional, Tuple
+
+from .profiling import NULL_PROFILER
+from .sketch import DEFAULT_CAPACITY, QuantileSketch
+from .utils import (
+    DEFAULT_DOMAIN_RANGES,
+    _is_bool_values,
+    _is_date_column,
+    _resolve_domain_range,
+    _valid_date_mask,
+    _value_kinds,
+)
+
+
+def _is_numeric_chunk(series: pd.Series) -> bool:
+    return pd.api.types.is_numeric_dtype(series.dtype) and not pd.api.types.is_bool_dtype(series.dtype)
+
+
+class ColumnAccumulator:
+    """Running counts for a single column.
+
+    pandas infers one dtype per chunk, while the whole-file checks see one
+    dtype per column, so the accumulator tracks whether every chunk was
+    numeric and resolves numeric-only statistics when it finalizes.
+
+    Each count is the sum of a per-value mask. Subclasses that need to know
+    which rows were counted (``rowindex``) override ``_flag`` to keep them.
+    """
+
+    def __init__(self, name, bounds: Optional[Tuple[float, float]] = None,
+                 capacity: int = DEFAULT_CAPACITY):
+        self.name = name
+        self.bounds = bounds
+        self.is_date = _is_date_column(name)
+        self.all_numeric = True
+        self.all_bool = True
+        self.null_count = 0
+        self.numeric_count = 0
+        self.string_count = 0
+        self.bool_count = 0
+        self.invalid_dates = 0
+        self.invalid_dates_if_text = 0
+        self.domain_violations = 0
+        self.sketch = QuantileSketch(capacity)
+
+    _STATE_FIELDS = (
+        "name", "all_numeric", "all_bool", "null_count", "numeric_count", "string_count",
+        "bool_count", "invalid_dates", "invalid_dates_if_text", "domain_violations",
+    )
+
+    def update(self, series: pd.Series, offset: int = 0) -> None:
+        """Fold one chunk of this column into the running counts.
+
+        ``offset`` is the row id of the chunk's first row; only ``_flag`` uses it.
+        """
+        null_mask = series.isna().to_numpy()
+        self._count("null_count", null_mask, nulls=True)
+        values = series[~null_mask]
+        is_numeric = _is_numeric_chunk(series)
+        self.all_numeric = self.all_numeric and is_numeric
+        if len(values) == 0:
+            return
+        # A chunk of bools with blanks is object dtype but still all bool.
+        is_bool = _is_bool_values(values)
+        self.all_bool = self.all_bool and is_bool
+
+        if is_bool:
+            self._count("bool_count", np.ones(len(values), dtype=bool))
+        else:
+            numeric_mask, string_mask, codes, uniques = _value_kinds(values)
+            self._count("numeric_count", numeric_mask)
+            self._count("string_count", ~numeric_mask)
+
+        if self.is_date:
+            if is_numeric:
+                # Only checked if another chunk makes the column textual.
+                codes, uniques = pd.factorize(values.astype(str))
+                invalid = ~_valid_date_mask(np.asarray(uniques, dtype=object))[codes]
+                self._count("invalid_dates_if_text", invalid)
+            elif not is_bool:
+                invalid = np.zeros(len(values), dtype=bool)
+                invalid[string_mask] = ~_valid_date_mask(uniques)[codes]
+                self._count("invalid_dates", invalid)
+            # Bool chunks are counted in ``invalid_date_count``.
+
+        if is_numeric:
+            array = values.to_numpy()
+            if self.bounds is not None:
+                min_val, max_val = self.bounds
+                self._count("domain_violations", (array < min_val) | (array > max_val))
+            self._add_numeric(array)
+
+    def _count(self, field: str, mask: np.ndarray, nulls: bool = False) -> None:
+        """Add the values in ``mask`` to the count ``field``.
+
+        ``mask`` covers the chunk's non-null values, or every row if ``nulls``.
+        """
+        setattr(self, field, getattr(self, field) + int(mask.sum()))
+        self._flag(field, mask, nulls)
+
+    def _flag(self, field: str, mask: np.ndarray, nulls: bool) -> None:
+        """Hook for subclasses that record the rows behind each count."""
+
+    def _add_numeric(self, array: np.ndarray) -> None:
+        self.sketch.update(array.astype(np.float64))
+
+    def merge(self, other: "ColumnAccumulator") -> "ColumnAccumulator":
+        """Fold ``other`` (the same column, later rows) into this accumulator."""
+        self.all_numeric = self.all_numeric and other.all_numeric
+        self.all_bool = self.all_bool and other.all_bool
+        self.null_count += other.null_count
+        self.numeric_count += other.numeric_count
+        self.string_count += other.string_count
+        self.bool_count += other.bool_count
+        self.invalid_dates += other.invalid_dates
+        self.invalid_dates_if_text += other.invalid_dates_if_text
+        self.domain_violations += other.domain_violations
+        self.sketch.merge(other.sketch)
+        return self
+
+    def to_state(self) -> dict:
+        """Return a JSON-serializable snapshot of the running counts."""
+        state = {field: getattr(self, field) for field in self._STATE_FIELDS}
+        state["bounds"] = list(self.bounds) if self.bounds is not None else None
+        state["sketch"] = self.sketch.to_state()
+        return state
+
+    @classmethod
+    def from_state(cls, state: dict) -> "ColumnAccumulator":
+        """Rebuild an accumulator from ``to_state`` output."""
+        bounds = tuple(state["bounds"]) if state["bounds"] is not None else None
+        column = cls(state["name"], bounds)
+        for field in cls._STATE_FIELDS:
+            setattr(column, field, state[field])
+        column.sketch = QuantileSketch.from_state(state["sketch"])
+        return column
+
+    def type_fields(self) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+        """Return the count fields that make up the numeric and the non-numeric values."""
+        # A column that is boolean throughout is read as bool (numeric values);
+        # otherwise pandas keeps the True/False tokens as strings.
+        if self.all_bool:
+            return ("numeric_count", "bool_count"), ("string_count",)
+        return ("numeric_count",), ("string_count", "bool_count")
+
+    def type_counts(self) -> Tuple[int, int]:
+        numeric, text = self.type_fields()
+        return sum(getattr(self, field) for field in numeric), sum(getattr(self, field) for field in text)
+
+    def invalid_date_fields(self) -> Tuple[str, ...]:
+        """Return the count fields that make up the invalid dates."""
+        if not self.is_date or self.all_numeric or self.all_bool:
+            return ()
+        # In a textual column the True/False tokens of bool chunks are invalid dates.
+        return ("invalid_dates", "invalid_dates_if_text", "bool_count")
+
+    def invalid_date_count(self) -> int:
+        return sum(getattr(self, field) for field in self.invalid_date_fields())
+
+    def statistical_outliers(self, iqr_multiplier: float) -> int:
+        if self.sketch.count < 4:  # Need at least 4 values for meaningful IQR
+            return 0
+        q1, q3 = self.sketch.quantiles([0.25, 0.75])
+        iqr = q3 - q1
+        if iqr <= 0:
+            return 0
+        return self.sketch.count_outside(q1 - iqr_multiplier * iqr, q3 + iqr_multiplier * iqr)
+
+
+class CSVAccumulator:
+    """Mergeable accumulator for a whole tabular file."""
+
+    column_class = ColumnAccumulator
+
+    def __init__(self, domain_ranges: Optional[Dict[str, Tuple[float, float]]] = None,
+                 iqr_multiplier: float = 2.5, capacity: int = DEFAULT_CAPACITY):
+        self.ranges = domain_ranges or DEFAULT_DOMAIN_RANGES
+        self.iqr_multiplier = iqr_multiplier
+        self.capacity = capacity
+        self.rows = 0
+        self.columns: Dict[object, ColumnAccumulator] = {}
+
+    def _column(self, name) -> ColumnAccumulator:
+        column = self.columns.get(name)
+        if column is None:
+            column = self.column_class(name, _resolve_domain_range(name, self.ranges), self.capacity)
+            self.columns[name] = column
+        return column
+
+    def update(self, df: pd.DataFrame, profiler=NULL_PROFILER) -> None:
+        """Fold one chunk of rows into the accumulator."""
+        offset = self.rows
+        self.rows += len(df)
+        for col in df.columns:
+            with profiler.stage("accumulate", col, len(df)):
+                self._column(col).update(df[col], offset)
+
+    def merge(self, other: "CSVAccumulator") -> "CSVAccumulator":
+        """Fold the accumulator of a later part of the same file into this one."""
+        self.rows += other.rows
+        for name, column in other.columns.items():
+            if name in self.columns:
+                self.columns[name].merge(column)
+            else:
+                self.columns[name] = column
+        return self
+
+    def to_state(self) -> dict:
+        """Return a JSON-serializable snapshot; column order is preserved."""
+        return {
+            "ranges": {name: list(bounds) for name, bounds in self.ranges.items()},
+            "iqr_multiplier": self.iqr_multiplier,
+            "capacity": self.capacity,
+            "rows": self.rows,
+            "columns": [column.to_state() for column in self.columns.values()],
+        }
+
+    @classmethod
+    def from_state(cls, state: dict) -> "CSVAccumulator":
+        """Rebuild an accumulator from ``to_state`` output."""
+        ranges = {name: tuple(bounds) for name, bounds in state["ranges"].items()}
+        accumulator = cls(ranges, state["iqr_multiplier"], state["capacity"])
+        accumulator.rows = state["rows"]
+        for column_state in state["columns"]:
+            column = ColumnAccumulator.from_state(column_state)
+            accumulator.columns[column.name] = column
+        return accumulator
+
+    def violation_counts(self) -> Dict[str, int]:
+        """Return the violations found so far per report entry, without statistical outliers.
+
+        Cheap enough to call after every chunk: no quantiles are computed.
+        """
+        counts: Dict[str, int] = {}
+        for name, column in self.columns.items():
+            if column.null_count:
+                counts[str(name)] = column.null_count
+            if column.all_numeric and column.domain_violations:
+                counts[f"{name}_domain_range"] = column.domain_violations
+            numeric_count, string_count = column.type_counts()
+            if numeric_count > 0 and string_count > 0:
+                counts[f"{name}_mixed_types"] = min(numeric_count, string_count)
+            invalid_dates = column.invalid_date_count()
+            if invalid_dates:
+                counts[f"{name}_date_format"] = invalid_dates
+        return counts
+
+    def finalize(self) -> Tuple[list, list, list]:
+        """Return ``(missing, outliers, type_errors)`` shaped like the ``report_*`` functions."""
+        missing: List[tuple] = []
+        outliers: List[tuple] = []
+        type_errors: List[tuple] = []
+
+        for name, column in self.columns.items():
+            if column.null_count:
+                missing.append((name, column.null_count))
+
+            if column.all_numeric:
+                if column.domain_violations > 0:
+                    outliers.append((f"{name}_domain_range", column.domain_violations))
+                statistical_outliers = column.statistical_outliers(self.iqr_multiplier)
+                if statistical_outliers > 0 and column.domain_violations == 0:  # Don't double-count
+                    outliers.append((f"{name}_statistical", statistical_outliers))
+
+            numeric_count, string_count = column.type_counts()
+            if numeric_count > 0 and string_count > 0:
+                type_errors.append((name, f"Mixed types: {numeric_count} numeric, {string_count} non-numeric"))
+
+            invalid_dates = column.invalid_date_count()
+            if invalid_dates > 0:
+                type_errors.append((f"{name}_date_format", f"{invalid_dates} invalid date formats"))
+
+        return missing, outliers, type_errors
@@ -0,0 +1,57 @@
+"""
+Violation budgets for stopping a validation run early.
+
+A ``ViolationBudget`` is handed to the chunked CSV and NDJSON readers, which
+check it after every chunk or batch and stop reading once it is used up. If
+rows remain past the chunk or batch that used it up, the budget records this
+in ``truncated``, so reports can say that their counts cover only the rows
+read. A budget used up by the file's last rows leaves ``truncated`` False.
+
+Only violations that cannot disappear as more rows arrive are counted:
+missing values, domain-range violations, mixed types and invalid dates.
+Statistical outliers are left out, because their IQR fences move with every
+chunk; they still appear in the (truncated) report.
+"""
+
+from typing import Dict, Iterable, Optional
+
+# Chunk size for budgeted CSV runs without --chunksize: small enough that a
+# bad file is rejected soon after its first bad rows, whatever its size.
+BUDGET_CHUNKSIZE = 10_000
+
+
+class ViolationBudget:
+    """Stop once ``max_violations`` in total, or ``max_per_check`` in one check, are found."""
+
+    def __init__(self, max_violations: Optional[int] = None, max_per_check: Optional[int] = None):
+        for name, value in (("max_violations", max_violations), ("max_per_check", max_per_check)):
+            if value is not None and value < 1:
+                raise ValueError(f"{name} must be a positive integer")
+        self.max_violations = max_violations
+        self.max_per_check = max_per_check
+        self.truncated = False
+
+    @classmethod
+    def fail_fast(cls) -> "ViolationBudget":
+        """Return a budget that is used up by the first violation."""
+        return cls(max_violations=1)
+
+    def exhausted(self, counts: Dict[str, int]) -> bool:
+        """Return True if the violation ``counts`` per check use up the budget."""
+        if self.max_violations is not None and sum(counts.values()) >= self.max_violations:
+            return True
+        if self.max_per_check is not None:
+            return any(count >= self.max_per_check for count in counts.values())
+        return False
+
+    def exhausted_by_messages(self, messages: Iterable[str]) -> bool:
+        """Like ``exhausted`` for format error messages, one violation each.
+
+        Messages that differ only in their ``"Line N: "`` prefix count as the
+        same check.
+        """
+        counts: Dict[str, int] = {}
+        for message in messages:
+            check = message.split(": ", 1)[1] if message.startswith("Line ") else message
+            counts[check] = counts.get(check, 0) + 1
+        return self.exhausted(counts)
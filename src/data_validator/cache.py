@@ -0,0 +1,199 @@
+"""
+On-disk cache of ``validate_file`` reports.
+
+Entries are keyed by a hash of the file's bytes, the schema and the tool
+version (plus any option that can change the report), so an unchanged file is
+never parsed twice. Hashing is itself skipped when the file's size and
+modification time match what the index recorded for that path on an earlier
+run. The cache directory is bounded: once its entries exceed ``max_bytes`` the
+least recently used ones are evicted. The index keeps the entries in LRU order
+with their sizes, so a put never rescans the directory.
+
+Reports are stored as JSON, never pickles, so a planted cache entry cannot run
+code. Like reports from the daemon, cached reports come back with lists where
+the in-process report had tuples.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from . import __version__
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+# Bumped whenever the entry or index format changes, so older entries miss.
+CACHE_VERSION = 2
+_HASH_BLOCK = 1 << 20
+_INDEX = "index.json"
+_ENTRIES = "entries"
+
+
+def default_cache_dir() -> str:
+    """Return ``$XDG_CACHE_HOME/data-validator`` (``~/.cache/data-validator`` by default)."""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "data-validator")
+
+
+def file_digest(path: str) -> str:
+    """Return the BLAKE2b hex digest of a file's contents."""
+    digest = hashlib.blake2b(digest_size=20)
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(_HASH_BLOCK), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _atomic_write(path: str, data: bytes) -> None:
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+
+
+class ResultCache:
+    """Content-addressed, size-bounded LRU cache of validation reports."""
+
+    def __init__(self, directory: Optional[str] = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.directory = directory or default_cache_dir()
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = os.path.join(self.directory, _ENTRIES)
+        os.makedirs(self._entries, exist_ok=True)
+        self._index_path = os.path.join(self.directory, _INDEX)
+        self._index: Dict[str, list] = {}
+        # Entry key -> size in bytes, least recently used first.
+        self._lru: "OrderedDict[str, int]" = OrderedDict()
+        self._bytes = 0
+        self._dirty = False
+        self._load_index()
+
+    def _load_index(self) -> None:
+        try:
+            with open(self._index_path) as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            index = None
+        if isinstance(index, dict) and index.get("format") == CACHE_VERSION:
+            self._index = index["files"]
+            self._lru = OrderedDict(index["entries"])
+        else:
+            self._rebuild_entries()
+        self._bytes = sum(self._lru.values())
+
+    def _rebuild_entries(self) -> None:
+        """Recover the LRU list from the entries directory, dropping older formats."""
+        entries = []
+        for entry in os.scandir(self._entries):
+            if not entry.name.endswith(".json"):
+                os.unlink(entry.path)
+                continue
+            st = entry.stat()
+            entries.append((st.st_mtime_ns, entry.name[:-len(".json")], st.st_size))
+        self._lru = OrderedDict((key, size) for _, key, size in sorted(entries))
+        self._dirty = True
+
+    def content_hash(self, path: str) -> str:
+        """Hash ``path``, reusing the recorded hash while its size and mtime are unchanged."""
+        real = os.path.realpath(path)
+        st = os.stat(real)
+        recorded = self._index.get(real)
+        if recorded and recorded[0] == st.st_mtime_ns and recorded[1] == st.st_size:
+            return recorded[2]
+        digest = file_digest(real)
+        self._index[real] = [st.st_mtime_ns, st.st_size, digest]
+        self._dirty = True
+        return digest
+
+    def key(self, path: str, schema: Optional[dict] = None, **options: Any) -> str:
+        """Return the cache key for validating ``path`` with ``schema`` and ``options``."""
+        parts = {
+            "content": self.content_hash(path),
+            "schema": schema or None,
+            "version": __version__,
+            "format": CACHE_VERSION,
+            "suffix": os.path.splitext(path)[1].lower(),
+            "options": {name: value for name, value in options.items() if value is not None},
+        }
+        encoded = json.dumps(parts, sort_keys=True, default=repr).encode()
+        return hashlib.blake2b(encoded, digest_size=20).hexdigest()
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self._entries, key + ".json")
+
+    def get(self, path: str, schema: Optional[dict] = None, **options: Any) -> Optional[dict]:
+        """Return the cached report for ``path`` or None, updating hit/miss counts."""
+        key = self.key(path, schema, **options)
+        try:
+            with open(self._entry_path(key), "rb") as f:
+                data = f.read()
+            report = json.loads(data)
+        except (OSError, ValueError):
+            self._forget(key)
+            self.misses += 1
+            return None
+        self._track(key, len(data))
+        self.hits += 1
+        return report
+
+    def put(self, path: str, schema: Optional[dict], report: dict, **options: Any) -> None:
+        """Store ``report`` for ``path``; ERROR reports are not cached."""
+        if report.get("status") == "ERROR":
+            return
+        key = self.key(path, schema, **options)
+        data = json.dumps(report, default=str).encode()
+        _atomic_write(self._entry_path(key), data)
+        self._track(key, len(data))
+        self._evict()
+
+    def _track(self, key: str, size: int) -> None:
+        """Record ``key`` as the most recently used entry."""
+        self._bytes += size - self._lru.pop(key, 0)
+        self._lru[key] = size
+        self._dirty = True
+
+    def _forget(self, key: str) -> None:
+        if key in self._lru:
+            self._bytes -= self._lru.pop(key)
+            self._dirty = True
+
+    def _evict(self) -> None:
+        while self._bytes > self.max_bytes and self._lru:
+            key, size = self._lru.popitem(last=False)
+            self._bytes -= size
+            try:
+                os.unlink(self._entry_path(key))
+            except FileNotFoundError:
+                # Another process sharing the directory already evicted it.
+                pass
+            self.evictions += 1
+            self._dirty = True
+
+    def save(self) -> None:
+        """Persist the mtime/size index and LRU list, dropping paths that no longer exist."""
+        if not self._dirty:
+            return
+        self._index = {path: value for path, value in self._index.items() if os.path.exists(path)}
+        index = {"format": CACHE_VERSION, "files": self._index, "entries": list(self._lru.items())}
+        _atomic_write(self._index_path, json.dumps(index).encode())
+        self._dirty = False
+
+    def clear(self) -> None:
+        """Remove every cached report and the index."""
+        for entry in os.scandir(self._entries):
+            os.unlink(entry.path)
+        if os.path.exists(self._index_path):
+            os.unlink(self._index_path)
+        self._index = {}
+        self._lru.clear()
+        self._bytes = 0
+        self._dirty = False
@@ -1,6 +1,253 @@
 import click
 import json
-from .validators import validate_file
+import os
+import time
+from . import __version__
+from .cache import ResultCache, default_cache_dir
+from .client import DaemonClient, DaemonError, default_address
+from .profiling import Profiler, aggregate_metrics
+
+# pandas-backed modules (validators, schema) are imported where they are used,
+# so --help and calls answered by a running daemon start without loading them.
+
+
+def _error_report(e):
+    return {
+        "error": f"Validation failed: {str(e)}",
+        "summary": "Validation error",
+        "status": "ERROR",
+        "file_type": "UNKNOWN"
+    }
+
+
+def _validate_path(path, schema, chunksize, workers=None, state_dir=None, profile=False, extra=None):
+    """Validate one file, turning unexpected failures into an ERROR report.
+
+    ``extra`` holds further ``validate_file`` keyword arguments (sampling,
+    violation budget and row tracking settings). ``quarantine_dir`` and
+    ``clean_dir`` in it become per-file output paths named after ``path``.
+    """
+    from .validators import validate_file
+
+    profiler = Profiler() if profile else None
+    kwargs = dict(extra or {})
+    for directory, option in (("quarantine_dir", "quarantine_out"), ("clean_dir", "clean_out")):
+        if kwargs.get(directory):
+            kwargs[option] = os.path.join(kwargs[directory], os.path.basename(path))
+        kwargs.pop(directory, None)
+    try:
+        return validate_file(path, schema, chunksize=chunksize, workers=workers,
+                             incremental=state_dir is not None, state_dir=state_dir, profiler=profiler,
+                             **kwargs)
+    except Exception as e:
+        return _error_report(e)
+    finally:
+        if profiler is not None:
+            profiler.close()
+
+
+def _run_reports(files, schema, chunksize, jobs, workers=None, state_dir=None, profile=False, extra=None):
+    """Yield ``(path, report)`` in the order given, validating up to ``jobs`` files at once."""
+    if workers and workers > 1:
+        # Each file already fans out across ``workers`` processes.
+        jobs = 1
+    if jobs <= 1 or len(files) <= 1:
+        for path in files:
+            yield path, _validate_path(path, schema, chunksize, workers, state_dir, profile, extra)
+        return
+    
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=min(jobs, len(files))) as executor:
+        futures = [executor.submit(_validate_path, path, schema, chunksize, None, state_dir, profile, extra)
+                   for path in files]
+        try:
+            for path, future in zip(files, futures):
+                try:
+                    report = future.result()
+                except Exception as e:  # e.g. a worker process died
+                    report = _error_report(e)
+                yield path, report
+        finally:
+            # If the caller stops early, drop the files still queued; only
+            # those already running are waited for.
+            for future in futures:
+                future.cancel()
+
+
+def _cache_options(chunksize, workers=None, state_dir=None, extra=None):
+    """Return the options that, with the file and schema, key a cached report."""
+    return {"chunksize": chunksize, "workers": workers, "incremental": state_dir is not None, **(extra or {})}
+
+
+def _cache_lookup(cache, path, schema, options):
+    try:
+        return cache.get(path, schema, **options)
+    except OSError:
+        cache.misses += 1
+        return None
+
+
+def _iter_reports(files, schema, chunksize, jobs, workers=None, cache=None, state_dir=None, profile=False,
+                  extra=None):
+    """Like ``_run_reports``, but serve unchanged files from ``cache`` and store new reports."""
+    if cache is None:
+        yield from _run_reports(files, schema, chunksize, jobs, workers, state_dir, profile, extra)
+        return
+    
+    options = _cache_options(chunksize, workers, state_dir, extra)
+    cached = [_cache_lookup(cache, path, schema, options) for path in files]
+    fresh = _run_reports([path for path, report in zip(files, cached) if report is None],
+                         schema, chunksize, jobs, workers, state_dir, profile, extra)
+    try:
+        for path, report in zip(files, cached):
+            if report is None:
+                _, report = next(fresh)
+                try:
+                    cache.put(path, schema, report, **options)
+                except OSError:
+                    pass
+            yield path, report
+    finally:
+        fresh.close()
+
+
+def _current_daemon(client):
+    """Return ``client`` if its daemon runs this version of the tool; otherwise close it and return None."""
+    try:
+        version = client.ping().get("version")
+    except DaemonError as e:
+        click.echo(f"Warning: daemon unavailable ({e}); validating locally", err=True)
+        version = None
+    else:
+        if version != __version__:
+            # A daemon left running from an older install would answer with old code.
+            click.echo(f"Warning: daemon runs data-validator {version}, not {__version__}; validating locally",
+                       err=True)
+    if version != __version__:
+        client.close()
+        return None
+    return client
+
+
+def _schema_error(schema, client=None):
+    """Return why ``schema`` does not compile, or None; the daemon checks it if ``client`` is given."""
+    if client is not None:
+        return client.check_schema(schema)
+    from .schema import compile_schema
+    try:
+        compile_schema(schema)
+    except Exception as e:
+        return str(e)
+    return None
+
+
+def _daemon_reports(client, files, schema, stop_on_failure, **options):
+    """Yield ``(path, report, cached)`` from the daemon, in the order given.
+
+    All files are sent at once so the daemon validates them in parallel;
+    with ``stop_on_failure`` they are sent one at a time instead, so nothing
+    past the first failure is validated.
+    """
+    batches = [[path] for path in files] if stop_on_failure else [list(files)]
+    for batch in batches:
+        yield from client.validate(batch, schema, **options)
+
+
+def _unique_across_files(files, full_report, schema, memory_limit, chunksize):
+    """Check the schema's ``unique_keys`` over all readable delimited ``files`` together."""
+    from .schema import compile_schema
+    from .sources import detect_source
+    from .uniqueness import check_unique_keys, key_frames
+
+    keys = compile_schema(schema).unique_keys
+    sources = []
+    for path in files:
+        if full_report[path].get("status") in ("ERROR", "SKIPPED"):
+            continue
+        source = detect_source(path)
+        if source is not None and source.is_delimited:
+            sources.append(source)
+    columns = sorted({col for key in keys for col in key})
+    frames = ((i, frame) for i, source in enumerate(sources) for frame in key_frames(source, columns, chunksize))
+    return check_unique_keys(frames, keys, memory_limit, sources=[source.path for source in sources])
+
+
+def _print_duplicates(results, verbose, indent="  "):
+    for label, result in results.items():
+        if "missing_columns" in result:
+            click.echo(f"{indent}- {label}: not checked, missing column(s) {', '.join(result['missing_columns'])}")
+            continue
+        click.echo(f"{indent}- {label}: {result['duplicate_rows']} duplicate row(s) over "
+                   f"{result['duplicate_keys']} key value(s) in {result['rows']} row(s)")
+        if verbose:
+            for sample in result["samples"]:
+                where = f" in {', '.join(sample['sources'])}" if "sources" in sample else ""
+                click.echo(f"{indent}    {sample['key']!r} x{sample['count']}{where}")
+
+
+def _print_report(path, report, verbose):
+    status_color = "green" if report.get("status") == "PASS" else "red"
+    click.echo(f"\nFile: {path}")
+    click.echo(f"Status: ", nl=False)
+    click.secho(f"{report.get('status', 'UNKNOWN')}", fg=status_color)
+    click.echo(f"Summary: {report.get('summary', 'No summary available')}")
+    
+    if verbose and report.get("status") != "ERROR":
+        if "missing" in report and report["missing"]:
+            click.echo("  Missing values:")
+            for col, count in report["missing"]:
+                click.echo(f"    - {col}: {count} missing values")
+        
+        if "outliers" in report and report["outliers"]:
+            click.echo("  Outliers/Range violations:")
+            for col, count in report["outliers"]:
+                click.echo(f"    - {col}: {count} outlier(s)")
+        
+        if "type_errors" in report and report["type_errors"]:
+            click.echo("  Data type errors:")
+            for col, error in report["type_errors"]:
+                click.echo(f"    - {col}: {error}")
+        
+        if "format_errors" in report and report["format_errors"]:
+            click.echo("  Format errors:")
+            for error in report["format_errors"]:
+                click.echo(f"    - {error}")
+        
+        if report.get("unique_keys"):
+            click.echo("  Unique keys:")
+            _print_duplicates(report["unique_keys"], verbose, indent="    ")
+    
+    if report.get("status") == "ERROR":
+        click.echo(f"  Error: {report.get('error', 'Unknown error')}")
+    
+    if "sampling" in report:
+        sampling = report["sampling"]
+        total = f"~{sampling['rows_total']}" if sampling["rows_total_is_estimate"] else sampling["rows_total"]
+        click.echo(f"  Sample: {sampling['rows_sampled']} of {total} rows ({sampling['method']}); "
+                   f"exact columns: {', '.join(sampling['escalated_columns']) or 'none'}")
+        if verbose:
+            for estimate in sampling["estimates"]:
+                if estimate["sample_violations"]:
+                    low, high = estimate["count_interval"]
+                    click.echo(f"    ~ {estimate['column']} {estimate['check']}: estimated "
+                               f"{estimate['estimated_count']} ({low}-{high} at {sampling['confidence']:.0%})")
+    
+    if verbose and report.get("row_ids"):
+        click.echo("  Flagged rows:")
+        for section, entries in report["row_ids"].items():
+            for name, rows in entries.items():
+                shown = ", ".join(map(str, rows)) if rows is not None else "not tracked in chunked mode"
+                click.echo(f"    - {name} [{section}]: {shown}")
+    
+    if "quarantine" in report:
+        quarantine = report["quarantine"]
+        click.echo(f"  Quarantine: {quarantine['rejected_rows']} rejected row(s), "
+                   f"{quarantine['clean_rows']} clean row(s)")
+    
+    if "metrics" in report:
+        stages = ", ".join(f"{stage['stage']} {stage['wall_seconds']:.3f}s" for stage in report["metrics"]["stages"])
+        click.echo(f"  Profile: {stages}")
+
 
 @click.group()
 def cli():
@@ -11,9 +258,58 @@ def cli():
 @click.option("--json-output", "-j", type=click.Path(), help="Write detailed report to JSON file")
 @click.option("--verbose", "-v", is_flag=True, help="Show detailed validation results")
 @click.option("--schema", "-s", type=click.Path(exists=True), help="JSON schema file for validation")
-def validate(files, json_output, verbose, schema):
+@click.option("--chunksize", type=click.IntRange(min=1), help="Stream CSV files in chunks of N rows to keep memory flat")
+@click.option("--jobs", "-J", type=click.IntRange(min=1), default=lambda: os.cpu_count() or 1,
+              show_default="CPU count", help="Number of files to validate in parallel (1 = serial)")
+@click.option("--workers", "-w", type=click.IntRange(min=1),
+              help="Split each CSV into byte ranges validated by N processes (files then run one at a time)")
+@click.option("--no-cache", is_flag=True, help="Re-validate every file instead of reusing cached reports")
+@click.option("--cache-dir", type=click.Path(file_okay=False), show_default="$XDG_CACHE_HOME/data-validator",
+              help="Directory for cached validation reports")
+@click.option("--incremental", is_flag=True,
+              help="Re-parse only rows appended to CSV files since the last --incremental run")
+@click.option("--profile", is_flag=True,
+              help="Record time, CPU, rows and peak memory per stage and column (implies --no-cache)")
+@click.option("--sample", "sample_rows", type=click.IntRange(min=1),
+              help="Pre-flight CSV files on a sample of about N rows, escalating undecided columns to exact checks")
+@click.option("--sample-method", type=click.Choice(["block", "reservoir"]), default="block", show_default=True,
+              help="Random byte blocks (reads only the sample) or a reservoir over a full streaming pass")
+@click.option("--sample-tolerance", type=click.FloatRange(min=0, max=1), default=0.001, show_default=True,
+              help="Accept a column with no sampled violations when its rates' upper bounds are at most this "
+                   "(0 escalates every such column)")
+@click.option("--no-escalate", is_flag=True, help="With --sample, report estimates only and skip exact checks")
+@click.option("--fail-fast", is_flag=True, help="Stop reading a CSV/NDJSON file at its first violation")
+@click.option("--max-violations", type=click.IntRange(min=1),
+              help="Stop reading a CSV/NDJSON file once N violations are found in total")
+@click.option("--max-violations-per-check", type=click.IntRange(min=1),
+              help="Stop reading a CSV/NDJSON file once one check reaches N violations")
+@click.option("--stop-on-failure", is_flag=True,
+              help="Skip the remaining files after the first file that does not pass")
+@click.option("--row-ids", type=click.IntRange(min=1),
+              help="List up to N flagged CSV row ids (0-based data rows) per check in the report")
+@click.option("--quarantine-out", type=click.Path(file_okay=False),
+              help="Write each CSV file's flagged rows to a file of the same name in this directory")
+@click.option("--clean-out", type=click.Path(file_okay=False),
+              help="Write each CSV file's unflagged rows to a file of the same name in this directory")
+@click.option("--daemon", "daemon_address", metavar="ADDRESS",
+              help="Send files to the daemon at this socket path or host:port "
+                   "(default: $DATA_VALIDATOR_DAEMON or the serve default, if one is running)")
+@click.option("--no-daemon", is_flag=True, help="Validate in this process even if a daemon is running")
+@click.option("--unique-memory", type=click.IntRange(min=1), default=256, show_default=True, metavar="MB",
+              help="Memory for the schema's unique_keys check before it spills to disk")
+@click.option("--unique-across-files", is_flag=True,
+              help="Also check the schema's unique_keys across all CSV/TSV files together")
+@click.option("--shard", metavar="I/N",
+              help="Validate only shard I of N (1-based) and write a partial state for `merge`")
+@click.option("--shard-out", type=click.Path(dir_okay=False), show_default="partial_I-of-N.state",
+              help="Partial-state file written by --shard")
+def validate(files, json_output, verbose, schema, chunksize, jobs, workers, no_cache, cache_dir, incremental, profile,
+             sample_rows, sample_method, sample_tolerance, no_escalate, fail_fast, max_violations,
+             max_violations_per_check, stop_on_failure, row_ids, quarantine_out, clean_out, daemon_address,
+             no_daemon, unique_memory, unique_across_files, shard, shard_out):
     """
-    Validate one or more CSV/JSON data FILES for missing values, data type errors, 
+    Validate one or more CSV/TSV/JSON/Parquet/Arrow data FILES (CSV, TSV and JSON may be
+    gzip/bz2/xz/zstd compressed) for missing values, data type errors, 
     out-of-range values, and format consistency issues.
     
     Designed for genomics and health data quality control in data pipelines.
@@ -31,6 +327,80 @@ def validate(files, json_output, verbose, schema):
             click.echo(f"Error loading schema file: {e}", err=True)
             return
     
+    if shard:
+        unsupported = [flag for flag, value in (
+            ("--incremental", incremental), ("--sample", sample_rows), ("--fail-fast", fail_fast),
+            ("--max-violations", max_violations), ("--max-violations-per-check", max_violations_per_check),
+            ("--row-ids", row_ids), ("--quarantine-out", quarantine_out), ("--clean-out", clean_out),
+            ("--unique-across-files", unique_across_files), ("--daemon", daemon_address)) if value]
+        if unsupported:
+            raise click.UsageError(f"--shard cannot be combined with {', '.join(unsupported)}")
+        _validate_shard(files, shard, shard_out, validation_schema, chunksize, unique_memory)
+        return
+    
+    client = None if no_daemon else DaemonClient.connect(daemon_address)
+    if client is None and daemon_address and not no_daemon:
+        click.echo(f"Warning: no daemon at {daemon_address}; validating locally", err=True)
+    if client is not None:
+        client = _current_daemon(client)
+    
+    if validation_schema is not None:
+        try:
+            schema_error = _schema_error(validation_schema, client)
+        except DaemonError as e:
+            click.echo(f"Warning: daemon unavailable ({e}); validating locally", err=True)
+            client.close()
+            client = None
+            schema_error = _schema_error(validation_schema)
+        if schema_error:
+            click.echo(f"Error loading schema file: {schema_error}", err=True)
+            if client is not None:
+                client.close()
+            return
+    
+    for directory in (quarantine_out, clean_out):
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+    
+    # Cached reports would skip writing the quarantine and clean files. An
+    # incremental run already skips unchanged rows via its own fingerprint;
+    # the cache would hash the whole file again on every append.
+    use_cache = not no_cache and not profile and not incremental and not (quarantine_out or clean_out)
+    cache = None
+    if use_cache and client is None:
+        try:
+            cache = ResultCache(cache_dir)
+        except OSError as e:
+            click.echo(f"Warning: result cache disabled: {e}", err=True)
+    
+    state_dir = os.path.join(cache_dir or default_cache_dir(), "incremental") if incremental else None
+    if state_dir is not None:
+        state_dir = os.path.abspath(state_dir)
+    
+    extra = {}
+    if sample_rows:
+        extra.update(sample_rows=sample_rows, sample_method=sample_method,
+                     sample_tolerance=sample_tolerance, escalate=not no_escalate)
+    if fail_fast or max_violations or max_violations_per_check:
+        extra.update(fail_fast=fail_fast, max_violations=max_violations,
+                     max_violations_per_check=max_violations_per_check)
+    if row_ids or quarantine_out or clean_out:
+        extra.update(row_ids=row_ids,
+                     quarantine_dir=quarantine_out and os.path.abspath(quarantine_out),
+                     clean_dir=clean_out and os.path.abspath(clean_out))
+    unique_memory *= 1024 * 1024
+    if validation_schema and validation_schema.get("unique_keys"):
+        extra["unique_memory"] = unique_memory
+    
+    if client is not None:
+        reports = _daemon_reports(client, files, validation_schema, stop_on_failure, chunksize=chunksize,
+                                  workers=workers, state_dir=state_dir, profile=profile, extra=extra,
+                                  use_cache=use_cache)
+    else:
+        reports = ((path, report, None) for path, report in
+                   _iter_reports(files, validation_schema, chunksize, jobs, workers, cache, state_dir, profile,
+                                 extra))
+    
     full_report = {}
     total_files = len(files)
     passed_files = 0
@@ -38,42 +408,33 @@ def validate(files, json_output, verbose, schema):
     click.echo(f"Validating {total_files} file(s)...")
     click.echo("=" * 50)
     
-    for path in files:
-        report = validate_file(path, validation_schema)
-        full_report[path] = report
-        
-        status_color = "green" if report.get("status") == "PASS" else "red"
-        click.echo(f"\nFile: {path}")
-        click.echo(f"Status: ", nl=False)
-        click.secho(f"{report.get('status', 'UNKNOWN')}", fg=status_color)
-        click.echo(f"Summary: {report.get('summary', 'No summary available')}")
-        
-        if report.get("status") == "PASS":
-            passed_files += 1
-        
-        if verbose and report.get("status") != "ERROR":
-            if "missing" in report and report["missing"]:
-                click.echo("  Missing values:")
-                for col, count in report["missing"]:
-                    click.echo(f"    - {col}: {count} missing values")
-            
-            if "outliers" in report and report["outliers"]:
-                click.echo("  Outliers/Range violations:")
-                for col, count in report["outliers"]:
-                    click.echo(f"    - {col}: {count} outlier(s)")
+    cache_hits = cache_misses = 0
+    try:
+        for path, report, cached in reports:
+            full_report[path] = report
+            if cached is not None:
+                cache_hits += cached
+                cache_misses += not cached
+            _print_report(path, report, verbose)
             
-            if "type_errors" in report and report["type_errors"]:
-                click.echo("  Data type errors:")
-                for col, error in report["type_errors"]:
-                    click.echo(f"    - {col}: {error}")
-            
-            if "format_errors" in report and report["format_errors"]:
-                click.echo("  Format errors:")
-                for error in report["format_errors"]:
-                    click.echo(f"    - {error}")
-        
-        if report.get("status") == "ERROR":
-            click.echo(f"  Error: {report.get('error', 'Unknown error')}")
+            if report.get("status") == "PASS":
+                passed_files += 1
+            elif stop_on_failure:
+                break
+    except DaemonError as e:
+        click.echo(f"Error: {e}", err=True)
+    finally:
+        reports.close()
+        if client is not None:
+            client.close()
+    
+    skipped = [path for path in files if path not in full_report]
+    for path in skipped:
+        full_report[path] = {
+            "summary": "Skipped after an earlier file failed",
+            "status": "SKIPPED",
+            "file_type": "UNKNOWN"
+        }
     
     click.echo("\n" + "=" * 50)
     click.echo(f"Validation Summary: {passed_files}/{total_files} files passed")
@@ -81,8 +442,119 @@ def validate(files, json_output, verbose, schema):
     if passed_files == total_files:
         click.secho("✓ All files passed validation!", fg="green")
     else:
-        failed_files = total_files - passed_files
+        failed_files = total_files - passed_files - len(skipped)
         click.secho(f"✗ {failed_files} file(s) failed validation", fg="red")
+    if skipped:
+        click.echo(f"{len(skipped)} file(s) skipped after the first failure")
+    
+    if unique_across_files and validation_schema and validation_schema.get("unique_keys"):
+        try:
+            full_report["_unique_keys"] = _unique_across_files(files, full_report, validation_schema,
+                                                               unique_memory, chunksize)
+        except Exception as e:
+            click.echo(f"Error checking unique keys across files: {e}", err=True)
+        else:
+            click.echo("Unique keys across files:")
+            _print_duplicates(full_report["_unique_keys"], verbose)
+    
+    if client is not None and use_cache:
+        click.echo(f"Cache: {cache_hits} hit(s), {cache_misses} miss(es)")
+    if cache is not None:
+        click.echo(f"Cache: {cache.hits} hit(s), {cache.misses} miss(es)")
+        try:
+            cache.save()
+        except OSError as e:
+            click.echo(f"Warning: could not save cache index: {e}", err=True)
+    
+    if json_output:
+        try:
+            if profile:
+                full_report["_metrics"] = aggregate_metrics(full_report)
+            start = time.perf_counter()
+            with open(json_output, "w") as fp:
+                json.dump(full_report, fp, indent=2)
+            elapsed = time.perf_counter() - start
+            click.echo(f"\nDetailed report written to: {json_output}")
+            if profile:
+                # The report cannot hold the time taken to write itself.
+                click.echo(f"Profile: json_write {elapsed:.3f}s")
+        except Exception as e:
+            click.echo(f"Error writing JSON report: {e}", err=True)
+
+
+def _validate_shard(files, shard, shard_out, schema, chunksize, unique_memory):
+    from .shards import parse_shard, validate_shard, write_state
+    
+    try:
+        index, count = parse_shard(shard)
+    except ValueError as e:
+        raise click.BadParameter(str(e), param_hint="--shard")
+    schema_error = _schema_error(schema) if schema is not None else None
+    if schema_error:
+        click.echo(f"Error loading schema file: {schema_error}", err=True)
+        return
+    extra = {}
+    if schema and schema.get("unique_keys"):
+        extra["unique_memory"] = unique_memory * 1024 * 1024
+        click.echo("Note: unique_keys are checked only in files validated whole by one shard", err=True)
+    
+    shard_out = shard_out or f"partial_{index}-of-{count}.state"
+    state = validate_shard(list(files), index, count, schema, chunksize, extra)
+    try:
+        write_state(shard_out, state)
+    except OSError as e:
+        raise click.ClickException(f"could not write partial state: {e}")
+    ranges = sum("pieces" in entry for entry in state["files"].values())
+    whole = len(state["files"]) - ranges
+    click.echo(f"Shard {index}/{count}: {ranges} CSV range(s), {whole} whole file(s); "
+               f"partial state written to {shard_out}")
+
+
+@cli.command()
+@click.argument("states", nargs=-1, required=True, type=click.Path(exists=True, dir_okay=False))
+@click.option("--output", "-o", type=click.Path(dir_okay=False),
+              help="Write the merged partial state here (for merging in a tree)")
+@click.option("--json-output", "-j", type=click.Path(), help="Write detailed report to JSON file")
+@click.option("--verbose", "-v", is_flag=True, help="Show detailed validation results")
+def merge(states, output, json_output, verbose):
+    """
+    Merge partial STATES written by `validate --shard` into the final report.
+    
+    Partial states can be merged in any grouping: with --output the merged state is
+    written for a later merge, and the report is printed only once every shard is in.
+    """
+    from .shards import ShardStateError, final_report, merge_all, missing_shards, read_state, write_state
+    
+    try:
+        state = merge_all(read_state(path) for path in states)
+    except ShardStateError as e:
+        raise click.ClickException(str(e))
+    if output:
+        try:
+            write_state(output, state)
+        except OSError as e:
+            raise click.ClickException(f"could not write partial state: {e}")
+        click.echo(f"Merged {len(states)} partial state(s) into {output}")
+    missing = missing_shards(state)
+    if missing:
+        message = f"shard(s) {', '.join(map(str, missing))} of {state['shard_count']}"
+        if output:
+            click.echo(f"Still missing {message}")
+            return
+        raise click.ClickException(f"{message} not merged yet")
+    
+    full_report = final_report(state)
+    click.echo(f"Merged {len(state['shards'])} shard(s) covering {len(full_report)} file(s)")
+    click.echo("=" * 50)
+    for path, report in full_report.items():
+        _print_report(path, report, verbose)
+    passed_files = sum(report.get("status") == "PASS" for report in full_report.values())
+    click.echo("\n" + "=" * 50)
+    click.echo(f"Validation Summary: {passed_files}/{len(full_report)} files passed")
+    if passed_files == len(full_report):
+        click.secho("✓ All files passed validation!", fg="green")
+    else:
+        click.secho(f"✗ {len(full_report) - passed_files} file(s) failed validation", fg="red")
     
     if json_output:
         try:
@@ -91,3 +563,112 @@ def validate(files, json_output, verbose, schema):
             click.echo(f"\nDetailed report written to: {json_output}")
         except Exception as e:
             click.echo(f"Error writing JSON report: {e}", err=True)
+
+
+@cli.command()
+@click.option("--socket", "socket_path", type=click.Path(dir_okay=False),
+              show_default="$DATA_VALIDATOR_DAEMON or $XDG_RUNTIME_DIR/data-validator.sock",
+              help="Unix socket to listen on")
+@click.option("--port", type=click.IntRange(min=1, max=65535), help="Listen on this localhost TCP port instead")
+@click.option("--workers", "-w", type=click.IntRange(min=1), default=lambda: os.cpu_count() or 1,
+              show_default="CPU count", help="Number of worker processes validating files")
+@click.option("--no-cache", is_flag=True, help="Re-validate every file instead of reusing cached reports")
+@click.option("--cache-dir", type=click.Path(file_okay=False), show_default="$XDG_CACHE_HOME/data-validator",
+              help="Directory for cached validation reports")
+def serve(socket_path, port, workers, no_cache, cache_dir):
+    """
+    Run a validation daemon that answers `validate` calls without per-call startup cost.
+    
+    Worker processes keep pandas imported and schemas compiled between requests;
+    `validate` sends its files here whenever the daemon is reachable.
+    """
+    if socket_path and port:
+        raise click.UsageError("--socket and --port are mutually exclusive")
+    from .server import ValidationServer
+    
+    address = f"127.0.0.1:{port}" if port else socket_path or default_address()
+    try:
+        server = ValidationServer(workers, cache_dir, use_cache=not no_cache)
+    except OSError as e:
+        raise click.ClickException(f"result cache unavailable: {e}")
+    try:
+        server.run(address, on_ready=lambda: click.echo(f"Listening on {address} with {workers} worker(s)"))
+    except OSError as e:
+        raise click.ClickException(str(e))
+    click.echo("Daemon stopped")
+
+
+@cli.command()
+@click.argument("directory", type=click.Path(exists=True, file_okay=False))
+@click.option("--reports-dir", type=click.Path(file_okay=False), show_default="DIRECTORY/reports",
+              help="Directory for per-file JSON reports and stats.json")
+@click.option("--move", is_flag=True, help="Move validated files into DIRECTORY/passed and DIRECTORY/failed")
+@click.option("--pass-dir", type=click.Path(file_okay=False), help="Move passing files here")
+@click.option("--fail-dir", type=click.Path(file_okay=False), help="Move failing or unreadable files here")
+@click.option("--settle", type=click.FloatRange(min=0), default=2.0, show_default=True,
+              help="Seconds a file's size and mtime must stay unchanged before it is validated")
+@click.option("--interval", type=click.FloatRange(min=0.01), default=1.0, show_default=True,
+              help="Seconds between directory polls")
+@click.option("--workers", "-w", type=click.IntRange(min=1), default=lambda: os.cpu_count() or 1,
+              show_default="CPU count", help="Number of worker processes validating files")
+@click.option("--queue-size", type=click.IntRange(min=1), default=64, show_default=True,
+              help="Files waiting for a worker before new files are left in the directory")
+@click.option("--schema", "-s", type=click.Path(exists=True), help="JSON schema file for validation")
+@click.option("--chunksize", type=click.IntRange(min=1), help="Stream CSV files in chunks of N rows")
+@click.option("--fail-fast", is_flag=True, help="Stop reading a CSV/NDJSON file at its first violation")
+@click.option("--once", is_flag=True, help="Exit once every settled file has been validated")
+@click.option("--stats-interval", type=click.FloatRange(min=0.1), default=10.0, show_default=True,
+              help="Seconds between status lines and stats.json updates")
+@click.option("--verbose", "-v", is_flag=True, help="Print a line for every validated file")
+def watch(directory, reports_dir, move, pass_dir, fail_dir, settle, interval, workers, queue_size, schema, chunksize,
+          fail_fast, once, stats_interval, verbose):
+    """
+    Watch DIRECTORY and validate files as they land, writing a JSON report per file.
+    
+    Files are picked up once their size and modification time have been stable for
+    --settle seconds, queued on a bounded queue and validated by a worker pool.
+    Runs until interrupted (SIGINT/SIGTERM finish the files in flight).
+    """
+    import signal
+    from .watch import Watcher
+    
+    validation_schema = None
+    if schema:
+        try:
+            with open(schema, 'r') as f:
+                validation_schema = json.load(f)
+        except Exception as e:
+            click.echo(f"Error loading schema file: {e}", err=True)
+            return
+        schema_error = _schema_error(validation_schema)
+        if schema_error:
+            click.echo(f"Error loading schema file: {schema_error}", err=True)
+            return
+    if move:
+        pass_dir = pass_dir or os.path.join(directory, "passed")
+        fail_dir = fail_dir or os.path.join(directory, "failed")
+    
+    def report_line(path, report):
+        if verbose:
+            click.echo(f"{report.get('status', 'UNKNOWN')}: {path} - {report.get('summary', '')}")
+    
+    watcher = Watcher(directory, reports_dir, pass_dir, fail_dir, settle, interval, workers, queue_size,
+                      validation_schema, chunksize, {"fail_fast": True} if fail_fast else None, report_line)
+    
+    def tick(current):
+        stats = current.stats.snapshot()
+        click.echo(f"Watch: {current.stats.summary(stats)}")
+        try:
+            with open(os.path.join(current.reports_dir, "stats.json"), "w") as fp:
+                json.dump(stats, fp, indent=2)
+        except OSError as e:
+            click.echo(f"Warning: could not write stats: {e}", err=True)
+    
+    previous = {signum: signal.signal(signum, lambda *_: watcher.stop.set())
+                for signum in (signal.SIGINT, signal.SIGTERM)}
+    click.echo(f"Watching {directory} with {workers} worker(s); reports in {watcher.reports_dir}")
+    try:
+        watcher.run(until_idle=once, on_tick=tick, tick_seconds=stats_interval)
+    finally:
+        for signum, handler in previous.items():
+            signal.signal(signum, handler)
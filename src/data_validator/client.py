@@ -0,0 +1,139 @@
+"""
+Thin client for the validation daemon (``data-validator serve``).
+
+Only the standard library is imported here, so a CLI call that is served by
+a running daemon never loads pandas or NumPy. Requests and responses are one
+JSON object per line; a client sends all of its requests up front and the
+daemon answers each one, tagged with its ``id``, as soon as it is done.
+
+The daemon address is a Unix socket path or ``host:port``. The default is
+``data-validator.sock`` in ``$XDG_RUNTIME_DIR`` (or the cache directory),
+overridable with the ``DATA_VALIDATOR_DAEMON`` environment variable.
+"""
+
+import json
+import os
+import socket
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from .cache import default_cache_dir
+
+ADDRESS_ENV = "DATA_VALIDATOR_DAEMON"
+CONNECT_TIMEOUT = 0.5
+
+Address = Union[str, Tuple[str, int]]
+
+
+class DaemonError(RuntimeError):
+    """Raised when the daemon cannot be reached or answers with an error."""
+
+
+def default_address() -> str:
+    """Return the daemon address from the environment or the default socket path."""
+    configured = os.environ.get(ADDRESS_ENV)
+    if configured:
+        return configured
+    directory = os.environ.get("XDG_RUNTIME_DIR") or default_cache_dir()
+    return os.path.join(directory, "data-validator.sock")
+
+
+def parse_address(address: str) -> Address:
+    """Return a socket path, or ``(host, port)`` for ``host:port`` and bare port numbers."""
+    if address.isdigit():
+        return ("127.0.0.1", int(address))
+    host, _, port = address.rpartition(":")
+    if port.isdigit() and os.sep not in address:
+        return (host or "127.0.0.1", int(port))
+    return address
+
+
+class DaemonClient:
+    """Blocking connection to a running daemon."""
+
+    def __init__(self, address: Optional[str] = None, timeout: Optional[float] = None):
+        target = parse_address(address or default_address())
+        family = socket.AF_INET if isinstance(target, tuple) else socket.AF_UNIX
+        self._socket = socket.socket(family, socket.SOCK_STREAM)
+        self._socket.settimeout(CONNECT_TIMEOUT)
+        try:
+            self._socket.connect(target)
+        except OSError as e:
+            self._socket.close()
+            raise DaemonError(f"no daemon at {address or default_address()}: {e}") from None
+        self._socket.settimeout(timeout)
+        self._reader = self._socket.makefile("rb")
+        self._next_id = 0
+
+    @classmethod
+    def connect(cls, address: Optional[str] = None) -> Optional["DaemonClient"]:
+        """Return a client, or None if no daemon is listening at ``address``."""
+        target = parse_address(address or default_address())
+        if isinstance(target, str) and not os.path.exists(target):
+            return None
+        try:
+            return cls(address)
+        except DaemonError:
+            return None
+
+    def close(self) -> None:
+        self._reader.close()
+        self._socket.close()
+
+    def __enter__(self) -> "DaemonClient":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _send(self, requests: List[Dict[str, Any]]) -> List[int]:
+        ids = []
+        lines = []
+        for request in requests:
+            self._next_id += 1
+            ids.append(self._next_id)
+            lines.append(json.dumps(dict(request, id=self._next_id)).encode() + b"\n")
+        self._socket.sendall(b"".join(lines))
+        return ids
+
+    def _receive(self) -> Dict[str, Any]:
+        line = self._reader.readline()
+        if not line:
+            raise DaemonError("daemon closed the connection")
+        response = json.loads(line)
+        if "error" in response and "report" not in response:
+            raise DaemonError(response["error"])
+        return response
+
+    def request(self, op: str, **fields: Any) -> Dict[str, Any]:
+        """Send one request and return its response."""
+        self._send([dict(fields, op=op)])
+        return self._receive()
+
+    def ping(self) -> Dict[str, Any]:
+        return self.request("ping")
+
+    def check_schema(self, schema: Optional[dict]) -> Optional[str]:
+        """Return the daemon's error message for ``schema``, or None if it compiles."""
+        return self.request("check_schema", schema=schema).get("schema_error")
+
+    def shutdown(self) -> None:
+        self.request("shutdown")
+
+    def validate(self, paths: List[str], schema: Optional[dict] = None,
+                 **options: Any) -> Iterator[Tuple[str, dict, bool]]:
+        """
+        Validate ``paths`` on the daemon, yielding ``(path, report, cached)`` in order.
+
+        All requests are sent at once so the daemon can run them in parallel.
+        ``options`` are the daemon's validate fields (``chunksize``,
+        ``workers``, ``state_dir``, ``profile``, ``extra``, ``use_cache``).
+        """
+        requests = [dict(options, op="validate", path=os.path.abspath(path), schema=schema) for path in paths]
+        ids = self._send(requests)
+        pending: Dict[int, Dict[str, Any]] = {}
+        for path, request_id in zip(paths, ids):
+            while request_id not in pending:
+                response = self._receive()
+                pending[response["id"]] = response
+            response = pending.pop(request_id)
+            yield path, response["report"], response.get("cached", False)
@@ -0,0 +1,251 @@
+"""
+Parquet and Arrow IPC/Feather inputs.
+
+The file is never converted wholesale to a DataFrame. Each column is handled
+according to its Arrow type, and a column is only decoded when a check
+actually needs its values:
+
+* Integer, boolean and date/time columns take their missing counts from the
+  row-group statistics (Parquet) or the Arrow validity bitmaps (IPC).
+* Integer columns with a domain range use row-group min/max to skip row
+  groups that are provably inside the range (or count, without decoding,
+  those provably outside it). Only the remaining row groups are decoded. The
+  IQR check needs every value, so it still reads the whole column, but it is
+  skipped when there are domain violations, exactly as in ``report_outliers``.
+* Boolean and date/time columns can never produce type errors, so they are
+  not decoded at all.
+* Float columns (NaN also counts as missing, and statistics do not record
+  it), string columns and anything else are decoded one column at a time and
+  checked by the ``report_*`` functions.
+
+The report is identical to running the ``report_*`` functions on
+``pd.read_parquet(path)`` / ``pd.read_feather(path)``.
+
+``pyarrow`` is an optional dependency and is imported only when a columnar
+file is validated. Arrow IPC files are memory-mapped and read one column at a
+time, so an uncompressed column is not copied and a compressed file only
+decompresses the column being checked.
+"""
+
+import os
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from .utils import DEFAULT_DOMAIN_RANGES, _resolve_domain_range, report_missing, report_outliers, report_type_errors
+
+PARQUET_SUFFIXES = ('.parquet', '.pq')
+ARROW_SUFFIXES = ('.arrow', '.feather', '.ipc')
+
+
+class _ChunkStats(NamedTuple):
+    null_count: int
+    value_count: int
+    min: object
+    max: object
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError("pyarrow is required for Parquet and Arrow files: pip install pyarrow") from None
+    return pyarrow
+
+
+class _ParquetSource:
+    """Column reads and per-row-group statistics from a Parquet file."""
+
+    def __init__(self, path: str):
+        _import_pyarrow()
+        import pyarrow.parquet as pq
+
+        self.file = pq.ParquetFile(path, memory_map=True)
+        self.schema = self.file.schema_arrow
+        metadata = self.file.metadata
+        self.num_chunks = metadata.num_row_groups
+        self._leaves = {
+            metadata.schema.column(i).path: i for i in range(metadata.num_columns)
+        }
+
+    def stats(self, name: str) -> Optional[List[_ChunkStats]]:
+        """Return per-row-group statistics, or None if any row group lacks them."""
+        index = self._leaves.get(name)
+        if index is None:
+            return None
+        stats = []
+        for rg in range(self.num_chunks):
+            statistics = self.file.metadata.row_group(rg).column(index).statistics
+            if statistics is None or not statistics.has_null_count:
+                return None
+            has_min_max = statistics.has_min_max
+            stats.append(_ChunkStats(
+                statistics.null_count, statistics.num_values,
+                statistics.min if has_min_max else None, statistics.max if has_min_max else None,
+            ))
+        return stats
+
+    def read(self, name: str, chunks: Optional[Sequence[int]] = None):
+        if chunks is None:
+            return self.file.read(columns=[name]).column(0)
+        return self.file.read_row_groups(list(chunks), columns=[name]).column(0)
+
+
+class _ArrowSource:
+    """Column reads and per-batch statistics from a memory-mapped Arrow IPC/Feather file."""
+
+    def __init__(self, path: str):
+        pa = _import_pyarrow()
+        import pyarrow.ipc as ipc
+
+        self.path = path
+        self._table = None
+        self._column = None
+        try:
+            with pa.memory_map(path) as source:
+                self.schema = ipc.open_file(source).schema
+        except pa.ArrowInvalid:
+            # Feather V1 is not an IPC file, but it is never compressed, so
+            # mapping the whole table copies nothing.
+            import pyarrow.feather as feather
+
+            self._table = feather.read_table(path, memory_map=True)
+            self.schema = self._table.schema
+
+    def _read_column(self, name: str):
+        """Read one column, decompressing (if the file is compressed) only that column."""
+        if self._table is not None:
+            return self._table.column(name)
+        if self._column is not None and self._column[0] == name:
+            return self._column[1]
+        pa = _import_pyarrow()
+        import pyarrow.ipc as ipc
+
+        options = ipc.IpcReadOptions(included_fields=[self.schema.get_field_index(name)])
+        reader = ipc.open_file(pa.memory_map(self.path), options=options)
+        batches = [reader.get_batch(i).column(0) for i in range(reader.num_record_batches)]
+        column = pa.chunked_array(batches, type=self.schema.field(name).type)
+        # stats() and read() ask for the same column in turn; keep only that one.
+        self._column = (name, column)
+        return column
+
+    def stats(self, name: str) -> Optional[List[_ChunkStats]]:
+        import pyarrow.compute as pc
+
+        column = self._read_column(name)
+        numeric = _kind(column.type) == "integer"
+        stats = []
+        for chunk in column.chunks:
+            low = high = None
+            if numeric and chunk.null_count < len(chunk):
+                extremes = pc.min_max(chunk)
+                low, high = extremes["min"].as_py(), extremes["max"].as_py()
+            stats.append(_ChunkStats(chunk.null_count, len(chunk) - chunk.null_count, low, high))
+        return stats
+
+    def read(self, name: str, chunks: Optional[Sequence[int]] = None):
+        column = self._read_column(name)
+        if chunks is None:
+            return column
+        import pyarrow as pa
+
+        return pa.chunked_array([column.chunk(i) for i in chunks], type=column.type)
+
+
+def _kind(arrow_type) -> str:
+    import pyarrow.types as types
+
+    if types.is_integer(arrow_type):
+        return "integer"
+    if types.is_boolean(arrow_type) or types.is_timestamp(arrow_type) or types.is_date(arrow_type):
+        return "inert"
+    return "other"
+
+
+def _domain_violations(source, name: str, stats: List[_ChunkStats], bounds: Tuple[float, float]) -> int:
+    """Count domain violations, decoding only row groups the statistics cannot settle."""
+    min_val, max_val = bounds
+    violations = 0
+    undecided = []
+    for i, chunk in enumerate(stats):
+        if chunk.value_count == 0:
+            continue
+        if chunk.min is None or chunk.max is None:
+            undecided.append(i)
+        elif chunk.min >= min_val and chunk.max <= max_val:
+            continue
+        elif chunk.max < min_val or chunk.min > max_val:
+            violations += chunk.value_count
+        else:
+            undecided.append(i)
+    if undecided:
+        series = source.read(name, undecided).to_pandas().dropna()
+        violations += int(((series < min_val) | (series > max_val)).sum())
+    return violations
+
+
+def _open(path: str):
+    if path.lower().endswith(PARQUET_SUFFIXES):
+        return _ParquetSource(path)
+    return _ArrowSource(path)
+
+
+def validate_columnar(path: str, domain_ranges: Optional[Dict[str, Tuple[float, float]]] = None,
+                      iqr_multiplier: float = 2.5) -> Tuple[list, list, list]:
+    """
+    Validate a Parquet or Arrow IPC/Feather file column by column.
+
+    Args:
+        path: Path to a ``.parquet``/``.pq`` or ``.arrow``/``.feather``/``.ipc`` file
+        domain_ranges: Optional domain ranges, as accepted by ``report_outliers``
+        iqr_multiplier: IQR multiplier for statistical outliers
+
+    Returns:
+        ``(missing, outliers, type_errors)`` as the ``report_*`` functions return them
+
+    Raises:
+        ImportError: If pyarrow is not installed
+    """
+    source = _open(path)
+    ranges = domain_ranges or DEFAULT_DOMAIN_RANGES
+    missing: List[tuple] = []
+    outliers: List[tuple] = []
+    type_errors: List[tuple] = []
+
+    # pandas stores a non-default index as extra columns; they are not data.
+    pandas_metadata = source.schema.pandas_metadata or {}
+    index_columns = {name for name in pandas_metadata.get("index_columns", []) if isinstance(name, str)}
+
+    for name in source.schema.names:
+        if name in index_columns:
+            continue
+        kind = _kind(source.schema.field(name).type)
+        stats = source.stats(name) if kind != "other" else None
+        if stats is None:
+            frame = source.read(name).to_pandas().to_frame(name)
+            missing.extend(report_missing(frame))
+            outliers.extend(report_outliers(frame, ranges, iqr_multiplier))
+            type_errors.extend(report_type_errors(frame))
+            continue
+
+        null_count = sum(chunk.null_count for chunk in stats)
+        if null_count:
+            missing.append((name, null_count))
+        if kind != "integer":
+            continue
+
+        bounds = _resolve_domain_range(name, ranges)
+        if bounds is not None:
+            violations = _domain_violations(source, name, stats, bounds)
+            if violations:
+                # Statistical outliers are only reported for columns without
+                # domain violations, so the rest of the column stays unread.
+                outliers.append((f"{name}_domain_range", violations))
+                continue
+        if sum(chunk.value_count for chunk in stats) >= 4:
+            outliers.extend(report_outliers(source.read(name).to_pandas().to_frame(name), ranges, iqr_multiplier))
+
+    return missing, outliers, type_errors
+
+
+def is_columnar_path(path: str) -> bool:
+    """True if ``path`` has a Parquet or Arrow IPC/Feather extension."""
+    return os.path.splitext(path)[1].lower() in PARQUET_SUFFIXES + ARROW_SUFFIXES
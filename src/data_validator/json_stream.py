@@ -0,0 +1,241 @@
+"""
+Incremental JSON and newline-delimited JSON validation.
+
+``stream_format_errors`` produces exactly the messages ``report_format_errors``
+gives for ``json.load(f)``, but never holds more than one array element (plus
+the fields the schema looks at) in memory. Arrays in a top-level object are
+walked item by item and checked against the first item's type and keys as
+they arrive; a top-level array is streamed through the same way.
+"""
+
+import json
+import re
+from typing import Any, Dict, Iterator, List, Optional, TextIO, Union
+
+from .budget import ViolationBudget
+from .profiling import NULL_PROFILER
+from .schema import SchemaPlan, compile_schema
+
+_READ_SIZE = 1 << 16
+_BATCH_SIZE = 1024
+_WHITESPACE = " \t\n\r"
+_DELIMITER = re.compile(r'[\s,\]}]')
+
+
+class _JSONStream:
+    """Sliding-buffer tokenizer that decodes one JSON value at a time."""
+
+    def __init__(self, handle: TextIO):
+        self.handle = handle
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+        self.consumed = 0
+        self.consumed_lines = 0
+        self.consumed_column = 0
+        self.decoder = json.JSONDecoder()
+
+    def _fill(self) -> bool:
+        if self.eof:
+            return False
+        if self.pos:
+            dropped = self.buffer[:self.pos]
+            newlines = dropped.count("\n")
+            self.consumed += self.pos
+            self.consumed_lines += newlines
+            self.consumed_column = len(dropped) - dropped.rfind("\n") - 1 if newlines else self.consumed_column + len(dropped)
+            self.buffer = self.buffer[self.pos:]
+            self.pos = 0
+        # Grow reads with the pending value so retries stay linear overall.
+        chunk = self.handle.read(max(_READ_SIZE, len(self.buffer)))
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer += chunk
+        return True
+
+    def _error(self, msg: str, pos: int) -> json.JSONDecodeError:
+        error = json.JSONDecodeError(msg, self.buffer, pos)
+        if error.lineno == 1:
+            error.colno += self.consumed_column
+        error.lineno += self.consumed_lines
+        error.pos += self.consumed
+        error.args = (f"{msg}: line {error.lineno} column {error.colno} (char {error.pos})",)
+        return error
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character without consuming it ('' at EOF)."""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise self._error(f"Expecting '{char}' delimiter", self.pos)
+        self.pos += 1
+
+    def next_item(self, closer: str) -> bool:
+        """Consume the separator after a container item; False once ``closer`` is reached."""
+        found = self.peek()
+        self.pos += 1
+        if found == ",":
+            return True
+        if found == closer:
+            return False
+        self.pos -= 1
+        raise self._error("Expecting ',' delimiter", self.pos)
+
+    def value(self) -> Any:
+        """Decode and consume the next complete JSON value."""
+        if not self.peek():
+            raise self._error("Expecting value", self.pos)
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError as e:
+                if not self.eof:
+                    self._fill()
+                    continue
+                raise self._error(e.msg, e.pos)
+            # A number cut at the buffer edge ("2." of "2.5") still decodes, so
+            # refill unless a delimiter shows where the token really ended.
+            if isinstance(value, (int, float)) and not self.eof and not _DELIMITER.search(self.buffer, end):
+                self._fill()
+                continue
+            self.pos = end
+            return value
+
+    def items(self) -> Iterator[Any]:
+        """Yield the elements of the array starting at the current position."""
+        self.expect("[")
+        if self.peek() == "]":
+            self.pos += 1
+            return
+        while True:
+            yield self.value()
+            if not self.next_item("]"):
+                return
+
+
+def _list_errors(key: str, items: Iterator[Any]) -> List[str]:
+    """Mirror the list consistency checks of ``report_format_errors`` one item at a time."""
+    errors = []
+    first = next(items, None)
+    first_item_type = type(first)
+    first_keys = set(first.keys()) if isinstance(first, dict) else None
+    for i, item in enumerate(items, 1):
+        if first_keys is not None:
+            if not isinstance(item, dict):
+                errors.append(f"Inconsistent list item type in '{key}' at index {i}")
+            elif set(item.keys()) != first_keys:
+                errors.append(f"Inconsistent object structure in '{key}' at index {i}")
+        elif type(item) != first_item_type:
+            errors.append(f"Inconsistent list item type in '{key}' at index {i}")
+    return errors
+
+
+def stream_format_errors(handle: TextIO, schema: Union[None, Dict[str, Any], SchemaPlan] = None) -> list:
+    """
+    Validate a JSON document read incrementally from ``handle``.
+
+    Args:
+        handle: Text file object positioned at the start of the document
+        schema: Optional schema or compiled plan, as accepted by ``compile_schema``
+
+    Returns:
+        The same list of error messages ``report_format_errors`` returns for the
+        fully loaded document
+    """
+    plan = compile_schema(schema)
+    if plan.json_validator is not None:
+        # JSON Schema keywords can constrain the document as a whole.
+        return plan.validate(json.load(handle))
+
+    stream = _JSONStream(handle)
+    first = stream.peek()
+
+    if first == "{":
+        # Keep only what the schema checks look at; arrays are checked as they
+        # stream past and replaced by an empty list, which has the same type.
+        fields = plan.fields
+        kept: Dict[str, Any] = {}
+        list_errors: List[str] = []
+        stream.expect("{")
+        if stream.peek() == "}":
+            stream.pos += 1
+        else:
+            while True:
+                if stream.peek() != '"':
+                    raise stream._error("Expecting property name enclosed in double quotes", stream.pos)
+                key = stream.value()
+                stream.expect(":")
+                if stream.peek() == "[":
+                    list_errors.extend(_list_errors(key, stream.items()))
+                    value = []
+                else:
+                    value = stream.value()
+                if key in fields:
+                    kept[key] = value
+                if not stream.next_item("}"):
+                    break
+        errors = plan.validate(kept) + list_errors
+    elif first == "[":
+        # A top-level array only meets the required-field check, which tests
+        # membership of the field name among the items.
+        found = set()
+        for item in stream.items():
+            if isinstance(item, str) and item in plan.required:
+                found.add(item)
+        errors = [f"Missing required field: {field}" for field in plan.required if field not in found]
+    else:
+        data = stream.value()
+        if stream.peek():
+            raise stream._error("Extra data", stream.pos)
+        errors = plan.validate(data)
+
+    if stream.peek():
+        raise stream._error("Extra data", stream.pos)
+    return errors
+
+
+def ndjson_format_errors(handle: TextIO, schema: Union[None, Dict[str, Any], SchemaPlan] = None,
+                         profiler=NULL_PROFILER, budget: Optional[ViolationBudget] = None) -> list:
+    """
+    Validate newline-delimited JSON, one record per line.
+
+    Records are validated in batches with ``SchemaPlan.validate_batch``;
+    messages are prefixed with the 1-based line number. Blank lines are skipped.
+    With a ``budget``, reading stops after the batch that uses it up.
+    """
+    plan = compile_schema(schema)
+    errors: List[str] = []
+    linenos: List[int] = []
+    records: List[Any] = []
+
+    def flush():
+        with profiler.stage("validate_batch", rows=len(records)):
+            batch_errors = plan.validate_batch(records)
+        for lineno, record_errors in zip(linenos, batch_errors):
+            errors.extend(f"Line {lineno}: {error}" for error in record_errors)
+        linenos.clear()
+        records.clear()
+
+    for lineno, line in enumerate(handle, 1):
+        if not line.strip():
+            continue
+        try:
+            records.append(json.loads(line))
+        except json.JSONDecodeError as e:
+            raise json.JSONDecodeError(f"{e.msg} on line {lineno}", e.doc, e.pos) from None
+        linenos.append(lineno)
+        if len(records) >= _BATCH_SIZE:
+            flush()
+            if budget is not None and budget.exhausted_by_messages(errors):
+                budget.truncated = any(rest.strip() for rest in handle)
+                return errors
+    flush()
+    return errors
@@ -0,0 +1,187 @@
+"""
+Intra-file parallelism: split one CSV into record-aligned byte ranges and
+validate each range in its own process.
+
+Splitting first counts quote characters per range, in parallel, so every
+split point knows whether it falls inside a quoted field; a short scan then
+moves each split point forward to the next newline that ends a record. Each
+worker then parses its range with the header names from the first line and
+returns a ``CSVAccumulator``; the parent merges them.
+"""
+
+import io
+import os
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple
+
+from .accumulators import CSVAccumulator
+from .streaming import DEFAULT_CHUNKSIZE
+
+_BLOCK_SIZE = 1 << 20
+_QUOTE = b'"'
+
+
+class _ByteRange(io.RawIOBase):
+    """Read-only view of ``[start, end)`` of a file."""
+
+    def __init__(self, path: str, start: int, end: int):
+        self._file = open(path, 'rb')
+        self._file.seek(start)
+        self._remaining = end - start
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        if self._remaining <= 0:
+            return 0
+        view = memoryview(buffer)[:self._remaining]
+        n = self._file.readinto(view)
+        self._remaining -= n
+        return n
+
+    def close(self) -> None:
+        self._file.close()
+        super().close()
+
+
+def _count_quotes(path: str, start: int, end: int) -> int:
+    count = 0
+    with open(path, 'rb') as f:
+        f.seek(start)
+        remaining = end - start
+        while remaining > 0:
+            block = f.read(min(_BLOCK_SIZE, remaining))
+            if not block:
+                break
+            count += block.count(_QUOTE)
+            remaining -= len(block)
+    return count
+
+
+def _next_record_start(path: str, offset: int, in_quotes: bool) -> int:
+    """Return the offset just past the first record-ending newline at or after ``offset``."""
+    with open(path, 'rb') as f:
+        f.seek(offset)
+        position = offset
+        while True:
+            block = f.read(_BLOCK_SIZE)
+            if not block:
+                return position
+            start = 0
+            while True:
+                newline = block.find(b'\n', start)
+                if newline < 0:
+                    in_quotes ^= block.count(_QUOTE, start) % 2 == 1
+                    break
+                in_quotes ^= block.count(_QUOTE, start, newline) % 2 == 1
+                if not in_quotes:
+                    return position + newline + 1
+                start = newline + 1
+            position += len(block)
+
+
+def split_csv(path: str, parts: int, executor=None, sep: str = ",") -> Tuple[List[str], List[Tuple[int, int]]]:
+    """
+    Split a CSV file into at most ``parts`` record-aligned byte ranges.
+
+    Quoted fields may contain newlines (RFC 4180 ``""`` escapes included).
+
+    Args:
+        path: Path to the CSV file
+        parts: Desired number of ranges
+        executor: Optional executor used for the quote-counting pass
+        sep: Field delimiter
+
+    Returns:
+        ``(columns, ranges)`` where ``ranges`` lists ``(start, end)`` offsets
+        of the data rows, header excluded
+    """
+    columns = list(pd.read_csv(path, nrows=0, sep=sep).columns)
+    size = os.path.getsize(path)
+    targets = [size * i // parts for i in range(parts)]
+    spans = list(zip(targets, targets[1:] + [size]))
+
+    if executor is not None:
+        counts = list(executor.map(_count_quotes, [path] * len(spans), *zip(*spans)))
+    else:
+        counts = [_count_quotes(path, start, end) for start, end in spans]
+
+    # The first target (offset 0) resolves to the end of the header row.
+    starts, quotes = [], 0
+    for target, count in zip(targets, counts):
+        starts.append(_next_record_start(path, target, quotes % 2 == 1))
+        quotes += count
+    starts.append(size)
+
+    ranges = [(start, end) for start, end in zip(starts, starts[1:]) if end > start]
+    return columns, ranges
+
+
+def shard_range(path: str, index: int, count: int, sep: str = ",") -> Tuple[List[str], int, int]:
+    """
+    Return the ``index``-th (0-based) of ``count`` record-aligned byte ranges of a CSV file.
+
+    The ranges are those ``split_csv`` would produce, but only the quotes
+    before the end of this range are counted, and empty ranges are kept, so
+    ``count`` independent calls cover the data rows exactly once.
+
+    Returns:
+        ``(columns, start, end)``; ``start == end`` for an empty range
+    """
+    if not 0 <= index < count:
+        raise ValueError(f"shard index {index} out of range for {count} shard(s)")
+    columns = list(pd.read_csv(path, nrows=0, sep=sep).columns)
+    size = os.path.getsize(path)
+    first, last = size * index // count, size * (index + 1) // count
+    quotes = _count_quotes(path, 0, first)
+    start = _next_record_start(path, first, quotes % 2 == 1)
+    if index == count - 1:
+        return columns, start, size
+    quotes += _count_quotes(path, first, last)
+    return columns, start, max(start, _next_record_start(path, last, quotes % 2 == 1))
+
+
+def accumulate_csv_range(path: str, start: int, end: int, columns: List[str],
+                         chunksize: int = DEFAULT_CHUNKSIZE, sep: str = ",", **kwargs) -> CSVAccumulator:
+    """Accumulate the rows stored in bytes ``[start, end)`` of a CSV file."""
+    accumulator = CSVAccumulator(**kwargs)
+    with io.BufferedReader(_ByteRange(path, start, end), _BLOCK_SIZE) as handle:
+        with pd.read_csv(handle, header=None, names=columns, chunksize=chunksize, sep=sep) as reader:
+            for chunk in reader:
+                accumulator.update(chunk)
+    return accumulator
+
+
+def accumulate_csv_parallel(path: str, workers: Optional[int] = None,
+                            chunksize: int = DEFAULT_CHUNKSIZE, sep: str = ",", **kwargs) -> CSVAccumulator:
+    """
+    Validate one CSV file across ``workers`` processes and merge the results.
+
+    Args:
+        path: Path to the CSV file
+        workers: Number of worker processes (defaults to the CPU count)
+        chunksize: Rows parsed per chunk inside each worker
+        sep: Field delimiter
+        **kwargs: Accumulator options (``domain_ranges``, ``iqr_multiplier``, ``capacity``)
+
+    Returns:
+        The merged ``CSVAccumulator``
+    """
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        columns, ranges = split_csv(path, workers, executor, sep)
+        futures = [
+            executor.submit(accumulate_csv_range, path, start, end, columns, chunksize, sep, **kwargs)
+            for start, end in ranges
+        ]
+        accumulator = CSVAccumulator(**kwargs)
+        for future in futures:
+            accumulator.merge(future.result())
+    return accumulator
+
+
+def validate_csv_parallel(path: str, workers: Optional[int] = None, **kwargs) -> Tuple[list, list, list]:
+    """Return ``(missing, outliers, type_errors)`` for a CSV validated across processes."""
+    return accumulate_csv_parallel(path, workers, **kwargs).finalize()
@@ -0,0 +1,203 @@
+"""
+Per-stage and per-column instrumentation for validation runs.
+
+Code paths wrap their work in ``profiler.stage(name, column=...)``. Each stage
+records its wall time, CPU time, rows processed and peak memory. Stages with
+the same name and column are summed, so a stage that runs once per chunk
+reports one total.
+
+Callbacks registered on a ``Profiler`` receive every finished stage as a
+``StageMetrics``, for forwarding to an external metrics system.
+
+When profiling is off the code paths use ``NULL_PROFILER``, whose ``stage``
+returns one shared no-op context manager, so disabled profiling costs a
+method call per stage and nothing else.
+
+Peak memory comes from ``tracemalloc`` (Python and NumPy allocations) and is
+only measured with ``trace_memory=True``, because tracing itself slows the
+run down.
+"""
+
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+Callback = Callable[["StageMetrics"], None]
+
+
+@dataclass
+class StageMetrics:
+    """Measurements for one run of a stage."""
+
+    stage: str
+    column: Any = None
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    rows: Optional[int] = None
+    peak_memory_bytes: Optional[int] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = {
+            "stage": self.stage,
+            "wall_seconds": round(self.wall_seconds, 6),
+            "cpu_seconds": round(self.cpu_seconds, 6),
+        }
+        if self.column is not None:
+            data["column"] = str(self.column)
+        if self.rows is not None:
+            data["rows"] = self.rows
+        if self.peak_memory_bytes is not None:
+            data["peak_memory_bytes"] = self.peak_memory_bytes
+        return data
+
+    def add(self, other: "StageMetrics") -> None:
+        self.wall_seconds += other.wall_seconds
+        self.cpu_seconds += other.cpu_seconds
+        if other.rows is not None:
+            self.rows = (self.rows or 0) + other.rows
+        if other.peak_memory_bytes is not None:
+            self.peak_memory_bytes = max(self.peak_memory_bytes or 0, other.peak_memory_bytes)
+
+
+class _Stage:
+    """Context manager for one running stage; set ``rows`` while inside it."""
+
+    __slots__ = ("profiler", "metrics", "_wall", "_cpu", "_memory", "_peak")
+
+    def __init__(self, profiler: "Profiler", name: str, column: Any, rows: Optional[int]):
+        self.profiler = profiler
+        self.metrics = StageMetrics(name, column, rows=rows)
+
+    @property
+    def rows(self) -> Optional[int]:
+        return self.metrics.rows
+
+    @rows.setter
+    def rows(self, value: int) -> None:
+        self.metrics.rows = value
+
+    def __enter__(self) -> "_Stage":
+        if self.profiler.trace_memory:
+            self._memory = tracemalloc.get_traced_memory()[0]
+            self._peak = 0
+            tracemalloc.reset_peak()
+            self.profiler._open.append(self)
+        self._wall = time.perf_counter()
+        self._cpu = time.process_time()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.metrics.wall_seconds = time.perf_counter() - self._wall
+        self.metrics.cpu_seconds = time.process_time() - self._cpu
+        if self.profiler.trace_memory:
+            # reset_peak() in a nested stage hides earlier peaks from this one,
+            # so nested stages report their peaks back up the stack.
+            peak = max(tracemalloc.get_traced_memory()[1], self._peak)
+            self.metrics.peak_memory_bytes = max(0, peak - self._memory)
+            self.profiler._open.pop()
+            if self.profiler._open:
+                parent = self.profiler._open[-1]
+                parent._peak = max(parent._peak, peak)
+        self.profiler._record(self.metrics)
+
+
+class _NullStage:
+    """Shared no-op stage used when profiling is off."""
+
+    rows = None
+
+    def __enter__(self) -> "_NullStage":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        return None
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        pass
+
+
+_NULL_STAGE = _NullStage()
+
+
+class NullProfiler:
+    """Profiler stand-in that records nothing."""
+
+    enabled = False
+
+    def stage(self, name: str, column: Any = None, rows: Optional[int] = None) -> _NullStage:
+        return _NULL_STAGE
+
+
+NULL_PROFILER = NullProfiler()
+
+
+class Profiler:
+    """Records stage metrics and forwards each finished stage to callbacks."""
+
+    enabled = True
+
+    def __init__(self, callbacks: Optional[List[Callback]] = None, trace_memory: bool = True):
+        self.callbacks: List[Callback] = list(callbacks or [])
+        self.trace_memory = trace_memory
+        self.stages: Dict[Tuple[str, Any], StageMetrics] = {}
+        self._open: List[_Stage] = []
+        self._started_tracing = False
+        if trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+
+    def add_callback(self, callback: Callback) -> None:
+        """Call ``callback(metrics)`` for every stage that finishes from now on."""
+        self.callbacks.append(callback)
+
+    def stage(self, name: str, column: Any = None, rows: Optional[int] = None) -> _Stage:
+        """Return a context manager that measures one run of stage ``name``."""
+        return _Stage(self, name, column, rows)
+
+    def _record(self, metrics: StageMetrics) -> None:
+        key = (metrics.stage, metrics.column)
+        total = self.stages.get(key)
+        if total is None:
+            self.stages[key] = StageMetrics(metrics.stage, metrics.column, rows=None)
+            total = self.stages[key]
+        total.add(metrics)
+        for callback in self.callbacks:
+            callback(metrics)
+
+    def close(self) -> None:
+        """Stop tracemalloc if this profiler started it."""
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the summed metrics: file-level ``stages`` and per-column ``columns``."""
+        stages = []
+        columns: Dict[str, List[Dict[str, Any]]] = {}
+        for (_, column), metrics in self.stages.items():
+            data = metrics.to_dict()
+            if column is None:
+                stages.append(data)
+            else:
+                del data["column"]
+                columns.setdefault(str(column), []).append(data)
+        return {"stages": stages, "columns": columns}
+
+
+def aggregate_metrics(reports: Dict[str, dict]) -> Dict[str, Any]:
+    """Combine the ``metrics`` of several reports into one block of per-stage totals."""
+    stages: Dict[str, StageMetrics] = {}
+    files = 0
+    for report in reports.values():
+        metrics = report.get("metrics") if isinstance(report, dict) else None
+        if not metrics:
+            continue
+        files += 1
+        for data in metrics["stages"]:
+            total = stages.setdefault(data["stage"], StageMetrics(data["stage"]))
+            total.add(StageMetrics(
+                data["stage"], wall_seconds=data["wall_seconds"], cpu_seconds=data["cpu_seconds"],
+                rows=data.get("rows"), peak_memory_bytes=data.get("peak_memory_bytes"),
+            ))
+    return {"files": files, "stages": [metrics.to_dict() for metrics in stages.values()]}
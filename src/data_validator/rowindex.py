@@ -0,0 +1,331 @@
+"""
+Row-level violation index for CSV validation.
+
+The report counts violations per check; a ``RowIndex`` also records which
+rows each check flagged. Row ids are 0-based positions among the data rows
+(the header is not a row), the same as the default pandas index.
+
+Flagged rows are kept in ``RowSet`` objects: sorted runs of consecutive ids
+stored as two NumPy arrays, so a column where a million rows are missing, or
+where every row is numeric, costs a few bytes rather than a million Python
+ints. Sets are built from boolean masks one chunk at a time and combined
+with vectorized run merging.
+
+A ``RowIndex`` is a ``CSVAccumulator`` whose columns keep the rows behind
+every count they add, so its report is the accumulator's and each row set
+holds exactly the rows that were counted. Statistical outlier rows need the
+column's final IQR fences: they are recorded when the whole file is read as
+one frame, and are ``None`` (count only) when it is read in chunks.
+
+``quarantine_csv`` streams the original records of a file into a quarantine file
+(rejected rows) and a clean file (the rest), byte for byte, in one pass.
+"""
+
+import numpy as np
+import pandas as pd
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .accumulators import ColumnAccumulator, CSVAccumulator
+from .sketch import DEFAULT_CAPACITY
+from .sources import open_binary, open_output
+
+SECTIONS = ("missing", "outliers", "type_errors")
+
+_EMPTY = np.empty(0, dtype=np.int64)
+
+
+class RowSet:
+    """Immutable sorted set of row ids, stored as half-open runs ``[start, end)``."""
+
+    __slots__ = ("starts", "ends")
+
+    def __init__(self, starts: np.ndarray = _EMPTY, ends: np.ndarray = _EMPTY):
+        self.starts = np.asarray(starts, dtype=np.int64)
+        self.ends = np.asarray(ends, dtype=np.int64)
+
+    @classmethod
+    def from_mask(cls, mask, offset: int = 0) -> "RowSet":
+        """Return the rows where ``mask`` is True, numbered from ``offset``."""
+        mask = np.asarray(mask, dtype=bool)
+        if not mask.any():
+            return cls()
+        edges = np.diff(np.concatenate(([0], mask.view(np.int8), [0])))
+        return cls(np.flatnonzero(edges == 1) + offset, np.flatnonzero(edges == -1) + offset)
+
+    @classmethod
+    def from_ids(cls, ids) -> "RowSet":
+        """Return the set of the given row ids (any order, duplicates allowed)."""
+        ids = np.unique(np.asarray(ids, dtype=np.int64))
+        if len(ids) == 0:
+            return cls()
+        breaks = np.flatnonzero(np.diff(ids) != 1) + 1
+        return cls(ids[np.concatenate(([0], breaks))], ids[np.concatenate((breaks - 1, [len(ids) - 1]))] + 1)
+
+    @classmethod
+    def union_all(cls, sets: List["RowSet"]) -> "RowSet":
+        """Return the union of ``sets``."""
+        sets = [row_set for row_set in sets if len(row_set.starts)]
+        if not sets:
+            return cls()
+        if len(sets) == 1:
+            return sets[0]
+        starts = np.concatenate([row_set.starts for row_set in sets])
+        ends = np.concatenate([row_set.ends for row_set in sets])
+        order = np.argsort(starts, kind="stable")
+        starts, ends = starts[order], np.maximum.accumulate(ends[order])
+        # A run starts a new group unless it touches the runs before it.
+        new = np.concatenate(([True], starts[1:] > ends[:-1]))
+        group_ends = np.concatenate((np.flatnonzero(new)[1:] - 1, [len(starts) - 1]))
+        return cls(starts[new], ends[group_ends])
+
+    def __or__(self, other: "RowSet") -> "RowSet":
+        return RowSet.union_all([self, other])
+
+    def __len__(self) -> int:
+        return int((self.ends - self.starts).sum())
+
+    def __bool__(self) -> bool:
+        return len(self.starts) > 0
+
+    def __contains__(self, row: int) -> bool:
+        i = int(np.searchsorted(self.starts, row, side="right")) - 1
+        return i >= 0 and row < self.ends[i]
+
+    def __iter__(self) -> Iterator[int]:
+        for start, end in zip(self.starts.tolist(), self.ends.tolist()):
+            yield from range(start, end)
+
+    def __eq__(self, other: object) -> bool:
+        return (isinstance(other, RowSet) and np.array_equal(self.starts, other.starts)
+                and np.array_equal(self.ends, other.ends))
+
+    def __repr__(self) -> str:
+        return f"RowSet({len(self)} rows in {len(self.starts)} runs)"
+
+    @property
+    def nbytes(self) -> int:
+        return self.starts.nbytes + self.ends.nbytes
+
+    def first(self, n: int) -> List[int]:
+        """Return the ``n`` smallest row ids."""
+        out: List[int] = []
+        for start, end in zip(self.starts.tolist(), self.ends.tolist()):
+            out.extend(range(start, min(end, start + n - len(out))))
+            if len(out) >= n:
+                break
+        return out
+
+    def to_mask(self, length: int) -> np.ndarray:
+        """Return a boolean array of ``length`` rows, True for rows in the set."""
+        edges = np.zeros(length + 1, dtype=np.int64)
+        np.add.at(edges, np.minimum(self.starts, length), 1)
+        np.add.at(edges, np.minimum(self.ends, length), -1)
+        return np.cumsum(edges[:-1]) > 0
+
+    def to_state(self) -> dict:
+        return {"starts": self.starts.tolist(), "ends": self.ends.tolist()}
+
+    @classmethod
+    def from_state(cls, state: dict) -> "RowSet":
+        return cls(state["starts"], state["ends"])
+
+
+def _masked_rows(mask: np.ndarray, positions: np.ndarray) -> RowSet:
+    """Return the rows ``positions[mask]``; ``positions`` is sorted and non-empty."""
+    first = int(positions[0])
+    if positions[-1] - first + 1 != len(positions):
+        # Spread the mask over the chunk's rows, leaving the nulls out.
+        spread = np.zeros(positions[-1] - first + 1, dtype=bool)
+        spread[positions - first] = mask
+        mask = spread
+    return RowSet.from_mask(mask, first)
+
+
+class _ColumnRows(ColumnAccumulator):
+    """A ``ColumnAccumulator`` that also keeps the rows behind each of its counts."""
+
+    def __init__(self, name: Any, bounds: Optional[Tuple[float, float]] = None, capacity: int = DEFAULT_CAPACITY):
+        super().__init__(name, bounds, capacity)
+        self.chunks = 0
+        self.parts: Dict[str, List[RowSet]] = {}
+        # The numeric values of the first chunk and their rows, kept until a
+        # second chunk arrives: while there is one chunk, IQR fences are exact.
+        self._first_values: Optional[Tuple[np.ndarray, np.ndarray]] = None
+
+    def update(self, series: pd.Series, offset: int = 0) -> None:
+        self.chunks += 1
+        null_mask = series.isna().to_numpy()
+        self._offset = offset
+        self._value_rows = np.flatnonzero(~null_mask) + offset
+        super().update(series, offset)
+
+    def _flag(self, field: str, mask: np.ndarray, nulls: bool) -> None:
+        if not mask.any():
+            return
+        rows = RowSet.from_mask(mask, self._offset) if nulls else _masked_rows(mask, self._value_rows)
+        self.parts.setdefault(field, []).append(rows)
+
+    def _add_numeric(self, array: np.ndarray) -> None:
+        if self.chunks == 1:
+            # The sketch is only needed once a second chunk arrives.
+            self._first_values = (array, self._value_rows)
+            return
+        if self._first_values is not None:
+            super()._add_numeric(self._first_values[0])
+            self._first_values = None
+        super()._add_numeric(array)
+
+    def rows(self, *fields: str) -> RowSet:
+        """Return the rows counted in any of ``fields``."""
+        # Parts of one field come from consecutive chunks, so they are in order.
+        return RowSet.union_all([rows for field in fields for rows in self.parts.get(field, [])])
+
+    def statistical_rows(self, iqr_multiplier: float) -> Tuple[int, Optional[RowSet]]:
+        if self.chunks > 1 or self._first_values is None:
+            return super().statistical_outliers(iqr_multiplier), None
+        array, rows = self._first_values
+        if len(array) < 4:
+            return 0, None
+        q1, q3 = np.percentile(array, [25, 75])
+        iqr = q3 - q1
+        if iqr <= 0:
+            return 0, None
+        statistical = _masked_rows((array < q1 - iqr_multiplier * iqr) | (array > q3 + iqr_multiplier * iqr), rows)
+        return len(statistical), statistical
+
+    def statistical_outliers(self, iqr_multiplier: float) -> int:
+        return self.statistical_rows(iqr_multiplier)[0]
+
+
+class RowIndex(CSVAccumulator):
+    """A ``CSVAccumulator`` that records the rows each check flags, chunk by chunk.
+
+    Its ``finalize`` is the accumulator's, so the report counts are the same
+    counts the row sets are built from.
+    """
+
+    column_class = _ColumnRows
+
+    def row_sets(self) -> Dict[str, Dict[str, Optional[RowSet]]]:
+        """Return the flagged rows per report entry, by section.
+
+        Keys match the first element of the report tuples. A value is None
+        when the check's rows are not known (statistical outliers of a file
+        read in chunks).
+        """
+        sets: Dict[str, Dict[str, Optional[RowSet]]] = {section: {} for section in SECTIONS}
+        for name, column in self.columns.items():
+            nulls = column.rows("null_count")
+            if nulls:
+                sets["missing"][name] = nulls
+
+            if column.all_numeric:
+                domain = column.rows("domain_violations")
+                if domain:
+                    sets["outliers"][f"{name}_domain_range"] = domain
+                else:
+                    count, statistical = column.statistical_rows(self.iqr_multiplier)
+                    if count:
+                        sets["outliers"][f"{name}_statistical"] = statistical
+
+            numeric_fields, text_fields = column.type_fields()
+            numeric, text = column.rows(*numeric_fields), column.rows(*text_fields)
+            if numeric and text:
+                # The minority type is the one out of place.
+                sets["type_errors"][name] = numeric if len(numeric) < len(text) else text
+
+            invalid = column.rows(*column.invalid_date_fields())
+            if invalid:
+                sets["type_errors"][f"{name}_date_format"] = invalid
+        return sets
+
+    def rejected(self) -> RowSet:
+        """Return every row flagged by at least one check with known rows."""
+        return RowSet.union_all([row_set for section in self.row_sets().values()
+                                 for row_set in section.values() if row_set is not None])
+
+
+def index_csv(path, chunksize: Optional[int] = None,
+              domain_ranges: Optional[Dict[str, Tuple[float, float]]] = None,
+              iqr_multiplier: float = 2.5, **read_csv_kwargs) -> RowIndex:
+    """Build a ``RowIndex`` for a CSV file (a path or stream), whole or ``chunksize`` rows at a time."""
+    index = RowIndex(domain_ranges, iqr_multiplier)
+    if not chunksize:
+        index.update(pd.read_csv(path, **read_csv_kwargs))
+        return index
+    with pd.read_csv(path, chunksize=chunksize, **read_csv_kwargs) as reader:
+        for chunk in reader:
+            index.update(chunk)
+    return index
+
+
+def row_id_report(sets: Dict[str, Dict[str, Optional[RowSet]]], limit: int) -> Dict[str, Dict[str, Any]]:
+    """Return the first ``limit`` row ids per report entry, JSON-ready.
+
+    Entries whose rows are unknown map to None.
+    """
+    return {
+        section: {str(name): (row_set.first(limit) if row_set is not None else None)
+                  for name, row_set in entries.items()}
+        for section, entries in sets.items()
+    }
+
+
+def _records(handle) -> Iterator[bytes]:
+    """Yield raw CSV records; a quoted field may span several lines."""
+    pending: List[bytes] = []
+    in_quotes = False
+    for line in handle:
+        pending.append(line)
+        in_quotes ^= line.count(b'"') % 2 == 1
+        if not in_quotes:
+            yield b"".join(pending)
+            pending.clear()
+    if pending:
+        yield b"".join(pending)
+
+
+def quarantine_csv(path: str, rejected: RowSet, quarantine_out: Optional[str] = None,
+                   clean_out: Optional[str] = None, compression: Optional[str] = None) -> Tuple[int, int]:
+    """
+    Copy the records of a CSV file into quarantine and clean files in one pass.
+
+    Both outputs get the header. Records are copied unchanged; blank lines,
+    which pandas does not count as rows, are dropped.
+
+    Args:
+        path: Path to the CSV file
+        rejected: Data rows that go to ``quarantine_out``
+        quarantine_out: Output path for rejected rows (or None to drop them)
+        clean_out: Output path for the other rows (or None to drop them)
+        compression: Compression of the input, also applied to both outputs
+
+    Returns:
+        ``(rejected_rows, clean_rows)`` written
+    """
+    outputs = [open_output(out, compression) if out else None for out in (quarantine_out, clean_out)]
+    counts = [0, 0]
+    try:
+        with open_binary(path, compression) as f:
+            records = _records(f)
+            header = next(records, b"")
+            for out in outputs:
+                if out is not None:
+                    out.write(header)
+            starts, ends = rejected.starts.tolist(), rejected.ends.tolist()
+            run, row = 0, 0
+            for record in records:
+                if not record.strip(b"\r\n"):
+                    continue
+                while run < len(ends) and ends[run] <= row:
+                    run += 1
+                target = 0 if run < len(starts) and starts[run] <= row else 1
+                if outputs[target] is not None:
+                    outputs[target].write(record)
+                counts[target] += 1
+                row += 1
+    finally:
+        for out in outputs:
+            if out is not None:
+                out.close()
+    return counts[0], counts[1]
@@ -0,0 +1,146 @@
+"""
+Compiled domain rules and matrix-wide outlier checks.
+
+A column gets the domain range of the first range key contained in its
+lower-cased name. ``compile_rules`` resolves that once for a whole header
+(one vectorized substring test per range key, not one per column and key)
+and caches the resulting ``RulePlan`` by header signature, so every chunk and
+every file with the same columns reuses it.
+
+``matrix_outliers`` then checks all numeric columns together: the numeric
+block is converted to one float64 matrix (a slab of columns at a time, to
+bound memory), domain bounds are compared by broadcasting, and the IQR
+fences come from per-column quartiles computed along axis 0. Statistical
+outliers are still only reported for columns without domain violations.
+"""
+
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+_CACHE_SIZE = 128
+# Cells per float64 slab converted at once (128 MiB).
+_SLAB_CELLS = 1 << 24
+
+
+class RulePlan:
+    """Per-column domain bounds for one header, as arrays aligned with ``columns``."""
+
+    def __init__(self, columns: Sequence[Any], ranges: Dict[str, Tuple[float, float]]):
+        self.columns = list(columns)
+        names = np.array([str(col).lower() for col in self.columns], dtype=str)
+        self.lower = np.full(len(names), -np.inf)
+        self.upper = np.full(len(names), np.inf)
+        self.has_rule = np.zeros(len(names), dtype=bool)
+        # Earlier keys win, so only columns without a rule yet are assigned.
+        for domain_key, (min_val, max_val) in ranges.items():
+            if not len(names):
+                break
+            matched = ~self.has_rule & (np.char.find(names, domain_key) >= 0)
+            self.lower[matched] = min_val
+            self.upper[matched] = max_val
+            self.has_rule |= matched
+
+    def bounds(self, i: int) -> Optional[Tuple[float, float]]:
+        """Return the ``(min, max)`` range of column ``i``, or None."""
+        return (self.lower[i], self.upper[i]) if self.has_rule[i] else None
+
+
+_plan_cache: "OrderedDict[tuple, RulePlan]" = OrderedDict()
+
+
+def compile_rules(columns: Sequence[Any], ranges: Dict[str, Tuple[float, float]]) -> RulePlan:
+    """Return the cached ``RulePlan`` for this header and set of ranges."""
+    key = (tuple(map(str, columns)), tuple((name, tuple(bounds)) for name, bounds in ranges.items()))
+    plan = _plan_cache.get(key)
+    if plan is None:
+        plan = RulePlan(columns, ranges)
+        _plan_cache[key] = plan
+        if len(_plan_cache) > _CACHE_SIZE:
+            _plan_cache.popitem(last=False)
+    else:
+        _plan_cache.move_to_end(key)
+    return plan
+
+
+def numeric_columns(df: pd.DataFrame) -> List[Any]:
+    """Return the columns ``df.select_dtypes(include=[np.number])`` would select, in order."""
+    return [col for col, dtype in df.dtypes.items()
+            if pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype)]
+
+
+def _quartiles(block: np.ndarray, counts: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Linear-interpolated 25th/75th percentiles of each column, ignoring NaN.
+
+    ``np.nanpercentile`` falls back to a per-column loop once a NaN is
+    present, so NaN-bearing blocks are sorted instead (NaN sorts last) and
+    interpolated the way ``np.percentile`` does, giving identical values.
+    """
+    if counts.min(initial=block.shape[0]) == block.shape[0]:
+        q1, q3 = np.percentile(block, [25, 75], axis=0)
+        return q1, q3
+    ordered = np.sort(block, axis=0)
+    result = []
+    for q in (0.25, 0.75):
+        position = q * np.maximum(counts - 1, 0)
+        below = np.floor(position).astype(np.int64)
+        above = np.minimum(below + 1, np.maximum(counts - 1, 0))
+        t = position - below
+        a = np.take_along_axis(ordered, below[None, :], axis=0)[0]
+        b = np.take_along_axis(ordered, above[None, :], axis=0)[0]
+        diff = b - a
+        result.append(np.where(t >= 0.5, b - diff * (1 - t), a + diff * t))
+    return result[0], result[1]
+
+
+def matrix_outliers(df: pd.DataFrame, domain_ranges: Dict[str, Tuple[float, float]],
+                    iqr_multiplier: float = 2.5) -> Dict[Any, List[tuple]]:
+    """
+    Run the domain-range and IQR checks on every numeric column of ``df`` at once.
+
+    Args:
+        df: DataFrame to check; non-numeric and boolean columns are ignored
+        domain_ranges: Domain ranges keyed by column-name substring
+        iqr_multiplier: IQR multiplier for statistical outliers
+
+    Returns:
+        The outlier entries per numeric column (columns without any are
+        omitted), in the format and order of ``report_outliers``
+    """
+    columns = numeric_columns(df)
+    out: Dict[Any, List[tuple]] = {}
+    if not columns or not len(df):
+        return out
+
+    numeric = df[columns]
+    plan = compile_rules(columns, domain_ranges)
+    slab = max(1, _SLAB_CELLS // len(df))
+    for start in range(0, len(columns), slab):
+        stop = min(start + slab, len(columns))
+        block = numeric.iloc[:, start:stop].to_numpy(dtype=np.float64, na_value=np.nan)
+        counts = block.shape[0] - np.isnan(block).sum(axis=0)
+
+        lower, upper = plan.lower[start:stop], plan.upper[start:stop]
+        # NaN compares False on both sides, so missing values never count.
+        domain = ((block < lower) | (block > upper)).sum(axis=0)
+        domain[~plan.has_rule[start:stop]] = 0
+
+        statistical = np.zeros(stop - start, dtype=np.int64)
+        candidates = np.flatnonzero((counts >= 4) & (domain == 0))
+        if len(candidates):
+            sub = block[:, candidates]
+            q1, q3 = _quartiles(sub, counts[candidates])
+            iqr = q3 - q1
+            fences_lower, fences_upper = q1 - iqr_multiplier * iqr, q3 + iqr_multiplier * iqr
+            counted = ((sub < fences_lower) | (sub > fences_upper)).sum(axis=0)
+            statistical[candidates] = np.where(iqr > 0, counted, 0)
+
+        for offset in np.flatnonzero(domain | statistical):
+            col = columns[start + offset]
+            if domain[offset]:
+                out[col] = [(f"{col}_domain_range", int(domain[offset]))]
+            else:
+                out[col] = [(f"{col}_statistical", int(statistical[offset]))]
+    return out
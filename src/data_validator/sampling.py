@@ -0,0 +1,350 @@
+"""
+Sampling pre-flight validation for large CSV files.
+
+The usual checks run on a sample of rows, and each per-column violation rate
+is reported with a Wilson score confidence interval. Two sampling methods are
+available:
+
+* ``block`` (default): the data region is split into equal byte strata and a
+  run of whole records is read from a random offset in each. Only the sampled
+  bytes are parsed, so the cost is independent of file size. Offsets are
+  aligned to the next record boundary. Once the sampled bytes show the file
+  uses quotes, boundaries follow quote parity as in ``parallel.split_csv``,
+  which counts the quotes before each block (a byte scan, not a parse), so
+  a quoted field with embedded newlines never splits a block. Blocks that
+  still fail to parse are skipped and counted.
+* ``reservoir``: the file is streamed in chunks and a uniform sample is kept
+  by retaining the rows with the smallest random keys. Every row is parsed,
+  but checks only run on the sample.
+
+A violation seen in the sample is a real violation, so the column's verdict
+is settled and its counts are estimates. Statistical (IQR) outliers are the
+exception: their fences come from the sample, not the file, so they are
+reported as estimates but never settle a column. Finding nothing in a column
+cannot rule violations out either. A column is accepted on the sample alone
+when the upper confidence bound of every other check is at most ``tolerance``
+(0.1% by default, which a clean 10,000-row sample meets at 95% confidence);
+otherwise it is escalated: it is validated exactly over the whole file
+(reading only the escalated columns), and every number for it is exact.
+The ``sampling`` block of the report lists which entries are estimates.
+"""
+
+import io
+import math
+import os
+import numpy as np
+import pandas as pd
+from typing import Any, Dict, List, Optional, Tuple
+
+from .parallel import _BLOCK_SIZE, _QUOTE, _ByteRange, _count_quotes, _next_record_start
+from .scanner import _is_numeric_column, scan_frame
+from .sources import TextSource, csv_input
+from .streaming import DEFAULT_CHUNKSIZE, accumulate_csv
+from .utils import (
+    DEFAULT_DOMAIN_RANGES,
+    _count_invalid_dates,
+    _count_value_types,
+    _is_date_column,
+    _resolve_domain_range,
+)
+
+DEFAULT_SAMPLE_ROWS = 10_000
+DEFAULT_TOLERANCE = 0.001
+DEFAULT_BLOCKS = 32
+SAMPLE_METHODS = ("block", "reservoir")
+
+# Standard normal quantiles for the supported confidence levels.
+_Z = {0.90: 1.6449, 0.95: 1.9600, 0.99: 2.5758}
+
+
+def wilson_interval(violations: int, n: int, confidence: float = 0.95) -> Tuple[float, float]:
+    """Return the Wilson score interval for ``violations`` successes in ``n`` trials."""
+    if n == 0:
+        return 0.0, 1.0
+    if confidence not in _Z:
+        raise ValueError(f"confidence must be one of {sorted(_Z)}")
+    z = _Z[confidence]
+    p = violations / n
+    denominator = 1 + z * z / n
+    center = (p + z * z / (2 * n)) / denominator
+    margin = z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / denominator
+    return max(0.0, center - margin), min(1.0, center + margin)
+
+
+def block_sample_csv(path: str, rows: int = DEFAULT_SAMPLE_ROWS, blocks: int = DEFAULT_BLOCKS,
+                     seed: int = 0, sep: str = ",") -> Tuple[pd.DataFrame, int, bool, int]:
+    """
+    Sample about ``rows`` records as runs of consecutive records from random offsets.
+
+    Returns:
+        ``(sample, estimated_total_rows, covers_file, skipped_blocks)``
+    """
+    columns = list(pd.read_csv(path, nrows=0, sep=sep).columns)
+    header_end = _next_record_start(path, 0, False)
+    size = os.path.getsize(path)
+    data_size = size - header_end
+
+    with open(path, 'rb') as f:
+        f.seek(header_end)
+        head = f.read(_BLOCK_SIZE)
+    row_bytes = len(head) / max(head.count(b'\n'), 1)
+    if data_size <= rows * row_bytes * 1.5:
+        sample = pd.read_csv(path, sep=sep)
+        return sample, len(sample), True, 0
+
+    rng = np.random.default_rng(seed)
+    block_bytes = max(1, int(rows * row_bytes / blocks))
+    stratum = data_size / blocks
+    quoted = _QUOTE in head
+    # Quotes in [0, counted); moved forward (or back) as blocks need parity.
+    counted, quotes = 0, 0
+
+    def in_quotes(offset: int) -> bool:
+        nonlocal counted, quotes
+        if offset >= counted:
+            quotes += _count_quotes(path, counted, offset)
+        else:
+            quotes -= _count_quotes(path, offset, counted)
+        counted = offset
+        return quotes % 2 == 1
+
+    frames, sampled_bytes, skipped, previous_end = [], 0, 0, header_end
+    for i in range(blocks):
+        low = header_end + int(i * stratum)
+        high = header_end + int((i + 1) * stratum)
+        offset = int(rng.integers(low, max(low + 1, high - block_bytes)))
+        if not quoted:
+            with open(path, 'rb') as f:
+                f.seek(offset)
+                quoted = _QUOTE in f.read(2 * block_bytes)
+        # A block may run past its stratum; never read the same record twice.
+        start = max(_next_record_start(path, offset, quoted and in_quotes(offset)), previous_end)
+        target = start + block_bytes
+        end = _next_record_start(path, target, quoted and in_quotes(min(target, size)))
+        if end <= start:
+            continue
+        previous_end = end
+        try:
+            with io.BufferedReader(_ByteRange(path, start, end), _BLOCK_SIZE) as handle:
+                frame = pd.read_csv(handle, header=None, names=columns, sep=sep)
+        except (pd.errors.ParserError, ValueError):
+            skipped += 1
+            continue
+        frames.append(frame)
+        sampled_bytes += end - start
+
+    sample = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=columns)
+    total = int(round(len(sample) * data_size / sampled_bytes)) if sampled_bytes else 0
+    return sample, total, False, skipped
+
+
+def reservoir_sample_csv(path: str, rows: int = DEFAULT_SAMPLE_ROWS, chunksize: int = DEFAULT_CHUNKSIZE,
+                         seed: int = 0, sep: str = ",", compression: Optional[str] = None) -> Tuple[pd.DataFrame, int]:
+    """Return a uniform sample of ``rows`` records and the exact row count, streaming the file."""
+    rng = np.random.default_rng(seed)
+    sample: Optional[pd.DataFrame] = None
+    keys = np.empty(0)
+    threshold = 1.0
+    total = 0
+    with csv_input(TextSource(path, compression, sep)) as (source, read_kwargs), \
+            pd.read_csv(source, chunksize=chunksize, **read_kwargs) as reader:
+        for chunk in reader:
+            total += len(chunk)
+            chunk_keys = rng.random(len(chunk))
+            # Rows keyed above the current k-th smallest key can never enter the sample.
+            keep = chunk_keys < threshold
+            chunk, chunk_keys = chunk[keep], chunk_keys[keep]
+            if sample is None:
+                sample, keys = chunk, chunk_keys
+            else:
+                sample = pd.concat([sample, chunk], ignore_index=True)
+                keys = np.concatenate([keys, chunk_keys])
+            if len(sample) > rows:
+                keep = np.sort(np.argpartition(keys, rows - 1)[:rows])
+                sample, keys = sample.iloc[keep].reset_index(drop=True), keys[keep]
+                threshold = keys.max()
+    if sample is None:
+        with csv_input(TextSource(path, compression, sep)) as (source, read_kwargs):
+            sample = pd.read_csv(source, nrows=0, **read_kwargs)
+    return sample.infer_objects(), total
+
+
+def _sample_checks(df: pd.DataFrame, ranges, iqr_multiplier: float) -> Dict[Any, List[dict]]:
+    """Count violations per column and check on the sample."""
+    checks: Dict[Any, List[dict]] = {}
+    n = len(df)
+    for col in df.columns:
+        series = df[col]
+        values = series.dropna()
+        m = len(values)
+        column = [{"check": "missing", "violations": int(n - m), "sample_size": n, "base": "rows"}]
+
+        if _is_numeric_column(values):
+            domain_violations = 0
+            bounds = _resolve_domain_range(col, ranges)
+            if bounds is not None:
+                min_val, max_val = bounds
+                domain_violations = int(((values < min_val) | (values > max_val)).sum())
+                column.append({"check": "domain_range", "violations": domain_violations, "sample_size": m})
+            if domain_violations == 0:
+                statistical = 0
+                if m >= 4:
+                    q1, q3 = np.percentile(values, [25, 75])
+                    iqr = q3 - q1
+                    if iqr > 0:
+                        lower, upper = q1 - iqr_multiplier * iqr, q3 + iqr_multiplier * iqr
+                        statistical = int(((values < lower) | (values > upper)).sum())
+                column.append({"check": "statistical", "violations": statistical, "sample_size": m})
+
+        if m:
+            numeric_count, string_count = _count_value_types(values)
+            mixed = {"check": "mixed_types", "violations": min(numeric_count, string_count), "sample_size": m,
+                     "numeric": numeric_count, "non_numeric": string_count}
+            column.append(mixed)
+            if _is_date_column(col):
+                column.append({"check": "date_format", "violations": _count_invalid_dates(values), "sample_size": m})
+        checks[col] = column
+    return checks
+
+
+def _estimated_entry(col: Any, check: dict, scale: float) -> Tuple[str, tuple]:
+    count = int(round(check["violations"] * scale))
+    name = check["check"]
+    if name == "missing":
+        return "missing", (col, count)
+    if name in ("domain_range", "statistical"):
+        return "outliers", (f"{col}_{name}", count)
+    if name == "mixed_types":
+        numeric = int(round(check["numeric"] * scale))
+        non_numeric = int(round(check["non_numeric"] * scale))
+        return "type_errors", (col, f"Mixed types: {numeric} numeric, {non_numeric} non-numeric")
+    return "type_errors", (f"{col}_date_format", f"{count} invalid date formats")
+
+
+def _column_entries(entries: List[tuple], col: Any) -> List[tuple]:
+    names = {col, f"{col}_domain_range", f"{col}_statistical", f"{col}_date_format"}
+    return [entry for entry in entries if entry[0] in names]
+
+
+def validate_csv_sampled(path: str, sample_rows: int = DEFAULT_SAMPLE_ROWS, method: str = "block",
+                         confidence: float = 0.95, escalate: bool = True,
+                         tolerance: float = DEFAULT_TOLERANCE,
+                         seed: int = 0, chunksize: Optional[int] = None,
+                         domain_ranges: Optional[Dict[str, Tuple[float, float]]] = None,
+                         iqr_multiplier: float = 2.5, sep: str = ",",
+                         compression: Optional[str] = None) -> Tuple[list, list, list, dict]:
+    """
+    Validate a CSV file from a sample, escalating undecided columns to exact checks.
+
+    Args:
+        path: Path to the CSV file
+        sample_rows: Target number of sampled rows
+        method: ``"block"`` or ``"reservoir"``
+        confidence: Confidence level of the intervals (0.90, 0.95 or 0.99)
+        escalate: Validate undecided columns exactly; if False, return the
+            sample-only estimates (a quick pre-flight verdict)
+        tolerance: A column with no sampled violations is accepted without
+            escalation when every check's upper rate bound is at most this
+            value; 0 escalates every such column
+        seed: Random seed for the sample
+        chunksize: Stream the exact pass (and the reservoir pass) in chunks of this many rows
+        domain_ranges: Optional domain ranges, as accepted by ``report_outliers``
+        iqr_multiplier: IQR multiplier for statistical outliers
+        sep: Field delimiter
+        compression: Compression of the file (see ``data_validator.sources``).
+            Compressed files cannot be read at random offsets, so the block
+            method falls back to a reservoir sample
+
+    Returns:
+        ``(missing, outliers, type_errors, sampling)`` where ``sampling``
+        describes the sample and lists every estimated entry
+    """
+    if method not in SAMPLE_METHODS:
+        raise ValueError(f"method must be one of {SAMPLE_METHODS}")
+    ranges = domain_ranges or DEFAULT_DOMAIN_RANGES
+    if compression is not None:
+        method = "reservoir"
+
+    skipped = 0
+    if method == "block":
+        sample, total, covers_file, skipped = block_sample_csv(path, sample_rows, seed=seed, sep=sep)
+    else:
+        sample, total = reservoir_sample_csv(path, sample_rows, chunksize or DEFAULT_CHUNKSIZE, seed, sep, compression)
+        covers_file = len(sample) == total
+
+    sampling: Dict[str, Any] = {
+        "method": method,
+        "seed": seed,
+        "confidence": confidence,
+        "rows_sampled": len(sample),
+        "rows_total": total,
+        "rows_total_is_estimate": method == "block" and not covers_file,
+        "skipped_blocks": skipped,
+        "escalated_columns": [],
+        "estimates": [],
+    }
+    if covers_file:
+        # The sample is the whole file, so every number is exact.
+        missing, outliers, type_errors = scan_frame(sample, ranges, iqr_multiplier)
+        return missing, outliers, type_errors, sampling
+
+    checks = _sample_checks(sample, ranges, iqr_multiplier)
+    estimated: Dict[Any, Dict[str, List[tuple]]] = {}
+    estimates: List[dict] = []
+    for col, column in checks.items():
+        # A violation in the sample settles the column's verdict. A column with
+        # none is only accepted when every check's upper bound is within
+        # tolerance. Statistical fences come from the sample, so that check
+        # neither settles nor escalates a column.
+        intervals = [wilson_interval(check["violations"], check["sample_size"], confidence) for check in column]
+        decisive = [(check, high) for check, (_, high) in zip(column, intervals) if check["check"] != "statistical"]
+        undecided = not any(check["violations"] for check, _ in decisive) and \
+            any(high > tolerance for _, high in decisive)
+        entries: Dict[str, List[tuple]] = {"missing": [], "outliers": [], "type_errors": []}
+        for check, (low, high) in zip(column, intervals):
+            n = check["sample_size"]
+            base = total if check.get("base") == "rows" else total * n / max(len(sample), 1)
+            estimate = {
+                "column": str(col),
+                "check": check["check"],
+                "sample_violations": check["violations"],
+                "sample_size": n,
+                "rate": round(check["violations"] / n, 6) if n else 0.0,
+                "rate_interval": [round(low, 6), round(high, 6)],
+                "estimated_count": int(round(check["violations"] / n * base)) if n else 0,
+                "count_interval": [int(math.floor(low * base)), int(math.ceil(high * base))],
+            }
+            estimates.append(estimate)
+            if check["violations"]:
+                kind, entry = _estimated_entry(col, check, base / n)
+                entries[kind].append(entry)
+        if undecided and escalate:
+            sampling["escalated_columns"].append(col)
+        else:
+            estimated[col] = entries
+
+    exact: Tuple[list, list, list] = ([], [], [])
+    escalated = sampling["escalated_columns"]
+    if escalated:
+        with csv_input(TextSource(path, compression, sep)) as (source, read_kwargs):
+            if chunksize:
+                exact = accumulate_csv(source, chunksize, ranges, iqr_multiplier, usecols=escalated,
+                                       **read_kwargs).finalize()
+            else:
+                exact = scan_frame(pd.read_csv(source, usecols=escalated, **read_kwargs), ranges, iqr_multiplier)
+
+    missing, outliers, type_errors = [], [], []
+    for col in sample.columns:
+        if col in estimated:
+            missing.extend(estimated[col]["missing"])
+            outliers.extend(estimated[col]["outliers"])
+            type_errors.extend(estimated[col]["type_errors"])
+        elif col in escalated:
+            missing.extend(_column_entries(exact[0], col))
+            outliers.extend(_column_entries(exact[1], col))
+            type_errors.extend(_column_entries(exact[2], col))
+
+    sampling["escalated_columns"] = [str(col) for col in escalated]
+    exact_names = set(sampling["escalated_columns"])
+    sampling["estimates"] = [estimate for estimate in estimates if estimate["column"] not in exact_names]
+    return missing, outliers, type_errors, sampling
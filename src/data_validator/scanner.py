@@ -0,0 +1,158 @@
+"""
+Single-pass column scanner for in-memory CSV validation.
+
+``report_missing``, ``report_outliers`` and ``report_type_errors`` each walk
+every column and drop its nulls on their own. ``scan_frame`` visits each
+column once instead: the null mask is computed a single time and one
+factorization of the string values serves both the type and date checks.
+The domain and IQR checks run once over the whole numeric block (see
+``rules.matrix_outliers``). The result is identical to calling the three
+functions in turn.
+
+``read_csv_with_hints`` passes what a schema declares to ``pd.read_csv``:
+fields whose declared types are all numeric are parsed straight to float64,
+and a ``columns`` list restricts parsing to those columns. If a hinted column
+does not parse as a number after all, the file is read again without hints,
+so hints never change a report. A compressed stream is reopened for that
+retry rather than buffered in memory.
+"""
+
+import os
+import time
+import numpy as np
+import pandas as pd
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, Tuple
+
+from .profiling import NULL_PROFILER
+from .rules import matrix_outliers
+from .schema import compile_schema
+from .utils import (
+    DEFAULT_DOMAIN_RANGES,
+    _invalid_date_count,
+    _is_date_column,
+    _numeric_string_count,
+    _string_uniques,
+)
+
+
+def _is_numeric_column(series: pd.Series) -> bool:
+    # Matches df.select_dtypes(include=[np.number]) as used by report_outliers.
+    return pd.api.types.is_numeric_dtype(series.dtype) and not pd.api.types.is_bool_dtype(series.dtype)
+
+
+def scan_frame(df: pd.DataFrame, domain_ranges: Optional[Dict[str, Tuple[float, float]]] = None,
+               iqr_multiplier: float = 2.5, timings: Optional[Dict[Any, float]] = None,
+               profiler=NULL_PROFILER) -> Tuple[list, list, list]:
+    """
+    Run the missing, outlier and type checks in one pass over the columns.
+
+    Args:
+        df: DataFrame to validate
+        domain_ranges: Optional domain ranges, as accepted by ``report_outliers``
+        iqr_multiplier: IQR multiplier for statistical outliers
+        timings: If given, filled with the seconds spent per column (the
+            block-wide outlier check is not included)
+        profiler: Optional ``Profiler``; the outlier check is recorded for the
+            whole frame and the other checks per column
+
+    Returns:
+        ``(missing, outliers, type_errors)``, equal to ``report_missing(df)``,
+        ``report_outliers(df, ...)`` and ``report_type_errors(df)``
+    """
+    ranges = domain_ranges or DEFAULT_DOMAIN_RANGES
+    missing: List[tuple] = []
+    outliers: List[tuple] = []
+    type_errors: List[tuple] = []
+
+    # Domain and IQR checks run across the whole numeric block up front.
+    with profiler.stage("outliers", rows=len(df)):
+        column_outliers = matrix_outliers(df, ranges, iqr_multiplier)
+
+    for col in df.columns:
+        start = time.perf_counter()
+        series = df[col]
+        with profiler.stage("missing", col, len(series)):
+            null_mask = series.isna()
+            null_count = int(null_mask.sum())
+            if null_count:
+                missing.append((col, null_count))
+                series = series[~null_mask]
+
+        outliers.extend(column_outliers.get(col, ()))
+
+        if len(series):
+            with profiler.stage("type_errors", col, len(series)):
+                # One factorization of the string values serves both type checks.
+                uniques, frequency, numeric_count, string_count = _string_uniques(series)
+                numeric_strings = _numeric_string_count(uniques, frequency)
+                numeric_count += numeric_strings
+                string_count += int(frequency.sum()) - numeric_strings
+                if numeric_count > 0 and string_count > 0:
+                    type_errors.append((col, f"Mixed types: {numeric_count} numeric, {string_count} non-numeric"))
+
+            if _is_date_column(col):
+                with profiler.stage("dates", col, len(series)):
+                    invalid_dates = _invalid_date_count(uniques, frequency)
+                    if invalid_dates > 0:
+                        type_errors.append((f"{col}_date_format", f"{invalid_dates} invalid date formats"))
+
+        if timings is not None:
+            timings[col] = time.perf_counter() - start
+
+    return missing, outliers, type_errors
+
+
+def csv_read_hints(schema: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Translate a validation schema into ``pd.read_csv`` keyword arguments.
+
+    Fields whose declared types are all numeric (bool excluded) become
+    ``float64`` dtype hints; a top-level ``columns`` list becomes ``usecols``.
+    JSON Schema documents and the default schema give no hints.
+    """
+    if not schema:
+        return {}
+    plan = compile_schema(schema)
+    if plan.json_validator is not None:
+        return {}
+
+    hints: Dict[str, Any] = {}
+    dtype = {
+        field: "float64" for field, types in plan.types
+        if all(issubclass(t, (int, float)) and not issubclass(t, bool) for t in types)
+    }
+    if dtype:
+        hints["dtype"] = dtype
+    if schema.get("columns"):
+        hints["usecols"] = list(schema["columns"])
+    return hints
+
+
+def read_csv_with_hints(path, schema: Optional[Dict[str, Any]] = None,
+                        reopen: Optional[Callable[[], BinaryIO]] = None, **read_csv_kwargs) -> pd.DataFrame:
+    """
+    Read a CSV file (a path or a binary stream) with the dtype and column hints ``schema`` implies.
+
+    A stream can be read only once, so retrying without dtype hints opens a
+    fresh one with ``reopen``; without it, streams are read without dtype hints.
+    """
+    hints = csv_read_hints(schema)
+    if "usecols" in hints:
+        # Declared columns the file lacks are ignored rather than an error.
+        hints["usecols"] = set(hints["usecols"]).__contains__
+    if "dtype" not in hints:
+        return pd.read_csv(path, **hints, **read_csv_kwargs)
+    if isinstance(path, (str, os.PathLike)):
+        reopen = None
+    elif reopen is None:
+        del hints["dtype"]
+        return pd.read_csv(path, **hints, **read_csv_kwargs)
+    try:
+        return pd.read_csv(path, **hints, **read_csv_kwargs)
+    except (ValueError, TypeError):
+        # A stray token in a declared numeric column: let pandas infer.
+        del hints["dtype"]
+    if reopen is None:
+        return pd.read_csv(path, **hints, **read_csv_kwargs)
+    with reopen() as stream:
+        return pd.read_csv(stream, **hints, **read_csv_kwargs)
@@ -0,0 +1,284 @@
+"""
+Schema compilation for JSON record validation.
+
+``compile_schema`` turns a schema dict into a reusable ``SchemaPlan`` once:
+type specs are normalized to tuples, range bounds are unpacked, and full JSON
+Schema documents get a ``jsonschema`` validator built and checked up front.
+Plans are cached, so validating millions of records against the same schema
+pays the compilation cost a single time.
+
+Two schema flavours are accepted:
+
+* The validator's own format, with ``required_fields``, ``field_types`` and
+  ``field_ranges`` keys. Types may be Python types or, as in a ``--schema``
+  JSON file, type names such as ``"int"``, ``"number"`` or ``"string"``.
+  For CSV files, numeric ``field_types`` become dtype hints for the reader
+  and an optional ``columns`` list limits which columns are validated.
+* A JSON Schema document (one with ``$schema``, ``type`` or ``properties``),
+  validated with the ``jsonschema`` package.
+
+Either flavour may add ``unique_keys``: a list of column names, or of lists
+of names for composite keys, whose values must not repeat in tabular files
+(see ``data_validator.uniqueness``).
+"""
+
+import json
+import numpy as np
+from collections import OrderedDict
+from itertools import chain
+from operator import methodcaller
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+_CUSTOM_KEYS = ('required_fields', 'field_types', 'field_ranges')
+_JSON_SCHEMA_KEYS = ('$schema', 'type', 'properties')
+_CACHE_SIZE = 128
+
+TYPE_NAMES: Dict[str, type] = {
+    'int': int, 'integer': int,
+    'float': float,
+    'str': str, 'string': str,
+    'bool': bool, 'boolean': bool,
+    'list': list, 'array': list,
+    'dict': dict, 'object': dict,
+    'null': type(None), 'none': type(None),
+}
+
+_MISSING = object()
+
+DEFAULT_SCHEMA: Dict[str, Any] = {
+    'required_fields': ['id'],
+    'field_types': {
+        'id': (int, str),
+        'age': (int, float),
+        'expression_level': (int, float),
+        'gene_name': str,
+        'sample_id': (int, str)
+    },
+    'field_ranges': {
+        'age': (0, 120),
+        'expression_level': (0, float('inf'))
+    }
+}
+
+
+class SchemaError(ValueError):
+    """Raised when a schema cannot be compiled."""
+
+
+def _resolve_types(field: str, spec: Any) -> Tuple[type, ...]:
+    if not isinstance(spec, (tuple, list)):
+        spec = (spec,)
+    resolved = []
+    for item in spec:
+        if isinstance(item, type):
+            resolved.append(item)
+        elif isinstance(item, str) and item.lower() == 'number':
+            resolved.extend((int, float))
+        elif isinstance(item, str) and item.lower() in TYPE_NAMES:
+            resolved.append(TYPE_NAMES[item.lower()])
+        else:
+            raise SchemaError(f"Unknown type {item!r} for field '{field}'")
+    return tuple(resolved)
+
+
+def _unique_keys(spec: Any) -> List[Tuple[str, ...]]:
+    if not isinstance(spec, (list, tuple)):
+        raise SchemaError("unique_keys must be a list of column names or lists of column names")
+    keys = []
+    for key in spec:
+        columns = (key,) if isinstance(key, str) else key
+        if (not isinstance(columns, (list, tuple)) or not columns
+                or not all(isinstance(col, str) and col for col in columns)):
+            raise SchemaError(f"Invalid unique key {key!r}: expected a column name or a list of column names")
+        keys.append(tuple(columns))
+    return keys
+
+
+def is_json_schema(schema: Dict[str, Any]) -> bool:
+    """True if ``schema`` is a JSON Schema document rather than the custom format."""
+    return not any(key in schema for key in _CUSTOM_KEYS) and any(key in schema for key in _JSON_SCHEMA_KEYS)
+
+
+class SchemaPlan:
+    """A compiled schema ready to validate single records or batches of records."""
+
+    def __init__(self, schema: Dict[str, Any]):
+        self.schema = schema
+        self.json_validator = None
+        self.required: Tuple[str, ...] = ()
+        self.types: List[Tuple[str, Tuple[type, ...]]] = []
+        self.ranges: List[Tuple[str, Any, Any]] = []
+        self.unique_keys = _unique_keys(schema.get('unique_keys', []))
+
+        if is_json_schema(schema):
+            import jsonschema
+
+            validator_cls = jsonschema.validators.validator_for(schema)
+            try:
+                validator_cls.check_schema(schema)
+            except jsonschema.SchemaError as e:
+                raise SchemaError(f"Invalid JSON Schema: {e.message}") from None
+            self.json_validator = validator_cls(schema)
+            self.fields = None
+            return
+
+        self.required = tuple(schema.get('required_fields', ()))
+        self.types = [(field, _resolve_types(field, spec)) for field, spec in schema.get('field_types', {}).items()]
+        try:
+            self.ranges = [(field, min_val, max_val) for field, (min_val, max_val) in schema.get('field_ranges', {}).items()]
+        except (TypeError, ValueError):
+            raise SchemaError("field_ranges values must be [min, max] pairs") from None
+        self.fields = set(self.required) | {field for field, _ in self.types} | {field for field, _, _ in self.ranges}
+
+    def validate(self, data: Any) -> List[str]:
+        """Return the error messages for one record."""
+        if self.json_validator is not None:
+            return self._json_schema_errors(data)
+
+        errors = []
+        for field in self.required:
+            if field not in data:
+                errors.append(f"Missing required field: {field}")
+
+        for field, expected_types in self.types:
+            if field in data:
+                value = data[field]
+                if not isinstance(value, expected_types):
+                    errors.append(f"Field '{field}' has incorrect type: expected {expected_types}, got {type(value)}")
+
+        for field, min_val, max_val in self.ranges:
+            if field in data:
+                value = data[field]
+                if isinstance(value, (int, float)):
+                    if value < min_val or value > max_val:
+                        errors.append(f"Field '{field}' value {value} outside valid range [{min_val}, {max_val}]")
+
+        if isinstance(data, dict):
+            errors.extend(_list_errors(data))
+        return errors
+
+    def validate_batch(self, records: Sequence[Any]) -> List[List[str]]:
+        """
+        Validate many records at once, column by column.
+
+        Each schema field is gathered into one array across the batch so type
+        and range checks run once per distinct type and as vectorized
+        comparisons. The result holds one message list per record, identical
+        to calling ``validate`` on each record in turn.
+        """
+        if self.json_validator is not None or not all(type(record) is dict for record in records):
+            return [self.validate(record) for record in records]
+
+        errors: List[List[str]] = [[] for _ in records]
+        columns: Dict[str, List[Any]] = {
+            field: list(map(methodcaller('get', field, _MISSING), records)) for field in self.fields
+        }
+        column_types = {field: set(map(type, column)) for field, column in columns.items()}
+
+        for field in self.required:
+            column = columns[field]
+            if type(_MISSING) in column_types[field]:
+                for i in np.flatnonzero([value is _MISSING for value in column]):
+                    errors[i].append(f"Missing required field: {field}")
+
+        for field, expected_types in self.types:
+            rejected = {
+                value_type for value_type in column_types[field]
+                if value_type is not type(_MISSING) and not issubclass(value_type, expected_types)
+            }
+            if not rejected:
+                continue
+            column = columns[field]
+            for i in np.flatnonzero([type(value) in rejected for value in column]):
+                errors[i].append(
+                    f"Field '{field}' has incorrect type: expected {expected_types}, got {type(column[i])}"
+                )
+
+        for field, min_val, max_val in self.ranges:
+            numeric_types = {value_type for value_type in column_types[field] if issubclass(value_type, (int, float))}
+            if not numeric_types:
+                continue
+            column = columns[field]
+            if numeric_types == column_types[field]:
+                numeric = np.arange(len(column))
+                values = np.array(column, dtype=object)
+            else:
+                numeric = np.flatnonzero([type(value) in numeric_types for value in column])
+                values = np.array([column[i] for i in numeric], dtype=object)
+            # Object arrays compare with Python semantics, so big ints stay exact.
+            outside = ((values < min_val) | (values > max_val)).astype(bool)
+            for i in numeric[outside]:
+                errors[i].append(f"Field '{field}' value {column[i]} outside valid range [{min_val}, {max_val}]")
+
+        # Only records holding a list need the per-record structure checks.
+        value_types = set(map(type, chain.from_iterable(map(dict.values, records))))
+        if any(issubclass(value_type, list) for value_type in value_types):
+            for i, record in enumerate(records):
+                errors[i].extend(_list_errors(record))
+        return errors
+
+    def _json_schema_errors(self, data: Any) -> List[str]:
+        errors = sorted(self.json_validator.iter_errors(data), key=lambda error: list(map(str, error.absolute_path)))
+        return [f"Schema violation at '{error.json_path}': {error.message}" for error in errors]
+
+
+def _list_errors(data: dict) -> List[str]:
+    errors = []
+    for key, value in data.items():
+        if isinstance(value, list):
+            if len(value) > 1:
+                first_item_type = type(value[0])
+                if isinstance(value[0], dict):
+                    first_keys = set(value[0].keys())
+                    for i, item in enumerate(value[1:], 1):
+                        if not isinstance(item, dict):
+                            errors.append(f"Inconsistent list item type in '{key}' at index {i}")
+                        elif set(item.keys()) != first_keys:
+                            errors.append(f"Inconsistent object structure in '{key}' at index {i}")
+                else:
+                    for i, item in enumerate(value[1:], 1):
+                        if type(item) != first_item_type:
+                            errors.append(f"Inconsistent list item type in '{key}' at index {i}")
+    return errors
+
+
+def _cache_key(schema: Dict[str, Any]) -> str:
+    return json.dumps(schema, sort_keys=True, default=repr)
+
+
+_plan_cache: "OrderedDict[str, SchemaPlan]" = OrderedDict()
+_default_plan: Optional[SchemaPlan] = None
+
+
+def compile_schema(schema: Union[None, Dict[str, Any], SchemaPlan] = None) -> SchemaPlan:
+    """
+    Compile ``schema`` (or the default schema) into a cached ``SchemaPlan``.
+
+    Args:
+        schema: Schema dict, an already compiled plan, or None/empty for the default
+
+    Returns:
+        The compiled plan
+
+    Raises:
+        SchemaError: If the schema uses unknown types or is not a valid JSON Schema
+    """
+    global _default_plan
+
+    if isinstance(schema, SchemaPlan):
+        return schema
+    if not schema:
+        if _default_plan is None:
+            _default_plan = SchemaPlan(DEFAULT_SCHEMA)
+        return _default_plan
+
+    key = _cache_key(schema)
+    plan = _plan_cache.get(key)
+    if plan is None:
+        plan = SchemaPlan(schema)
+        _plan_cache[key] = plan
+        if len(_plan_cache) > _CACHE_SIZE:
+            _plan_cache.popitem(last=False)
+    else:
+        _plan_cache.move_to_end(key)
+    return plan
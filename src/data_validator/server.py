@@ -0,0 +1,228 @@
+"""
+Validation daemon behind ``data-validator serve``.
+
+A short ``validate`` call spends most of its time starting Python and
+importing pandas. The daemon pays that once: it listens on a Unix socket (or
+a localhost port), keeps a pool of worker processes with the validators
+imported and their compiled schemas cached, and holds the result cache index
+in memory between requests. ``client.DaemonClient`` speaks its protocol, one
+JSON object per line:
+
+* ``{"op": "validate", "path": ..., "schema": ..., ...}`` answers
+  ``{"report": ..., "cached": bool}``; the remaining fields are the
+  arguments of ``cli._validate_path`` plus ``use_cache``.
+* ``check_schema``, ``ping``, ``stats`` and ``shutdown``.
+
+Every response carries the request's ``id``. Requests on one connection run
+concurrently and are answered as they finish.
+"""
+
+import asyncio
+import json
+import os
+import signal
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Optional
+
+from . import __version__
+from .cache import ResultCache
+from .cli import _cache_lookup, _cache_options, _error_report, _validate_path
+from .client import DaemonClient, parse_address
+
+# Seconds between writes of the result cache index.
+SAVE_INTERVAL = 30.0
+# Longest request line accepted (inline schemas can be large).
+_LINE_LIMIT = 64 * 1024 * 1024
+
+
+def _warm_up(_: int) -> int:
+    """Import the validators in a pool worker so the first request does not pay for it."""
+    from . import validators  # noqa: F401
+    return os.getpid()
+
+
+def _cache_put(cache: ResultCache, path: str, schema: Optional[dict], report: dict, options: dict) -> None:
+    try:
+        cache.put(path, schema, report, **options)
+    except OSError:
+        pass
+
+
+class ValidationServer:
+    """Serve validation requests from a warm worker pool."""
+
+    def __init__(self, workers: Optional[int] = None, cache_dir: Optional[str] = None, use_cache: bool = True):
+        self.workers = workers or os.cpu_count() or 1
+        self.cache = ResultCache(cache_dir) if use_cache else None
+        self.requests = 0
+        self.started = time.time()
+        self._pool: Optional[ProcessPoolExecutor] = None
+        # The result cache is not thread-safe; one thread does all its I/O.
+        self._cache_io: Optional[ThreadPoolExecutor] = None
+        self._stopping: Optional[asyncio.Event] = None
+
+    def _start_pool(self) -> None:
+        self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        list(self._pool.map(_warm_up, range(self.workers)))
+
+    def run(self, address: str, on_ready: Optional[Callable[[], None]] = None) -> None:
+        """Listen on ``address`` until a ``shutdown`` request, SIGINT or SIGTERM."""
+        # Fork the workers before the event loop and cache thread exist.
+        self._start_pool()
+        try:
+            asyncio.run(self.serve(address, on_ready))
+        finally:
+            self._pool.shutdown(cancel_futures=True)
+
+    async def serve(self, address: str, on_ready: Optional[Callable[[], None]] = None) -> None:
+        if self._pool is None:
+            self._start_pool()
+        self._stopping = asyncio.Event()
+        self._cache_io = ThreadPoolExecutor(max_workers=1)
+        target = parse_address(address)
+        if isinstance(target, tuple):
+            server = await asyncio.start_server(self._handle, target[0], target[1], limit=_LINE_LIMIT)
+        else:
+            if os.path.exists(target):
+                if DaemonClient.connect(target) is not None:
+                    raise OSError(f"a daemon is already listening on {target}")
+                os.unlink(target)  # Left behind by a daemon that was killed.
+            os.makedirs(os.path.dirname(os.path.abspath(target)), exist_ok=True)
+            server = await asyncio.start_unix_server(self._handle, target, limit=_LINE_LIMIT)
+
+        loop = asyncio.get_running_loop()
+        if threading.current_thread() is threading.main_thread():
+            for signum in (signal.SIGINT, signal.SIGTERM):
+                loop.add_signal_handler(signum, self._stopping.set)
+        saver = asyncio.create_task(self._save_periodically())
+        try:
+            async with server:
+                if on_ready is not None:
+                    on_ready()
+                await self._stopping.wait()
+        finally:
+            saver.cancel()
+            if self.cache is not None:
+                await loop.run_in_executor(self._cache_io, self._save_cache)
+            self._cache_io.shutdown()
+            if isinstance(target, str) and os.path.exists(target):
+                os.unlink(target)
+
+    def _save_cache(self) -> None:
+        try:
+            self.cache.save()
+        except OSError:
+            pass
+
+    async def _save_periodically(self) -> None:
+        if self.cache is None:
+            return
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(SAVE_INTERVAL)
+            await loop.run_in_executor(self._cache_io, self._save_cache)
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        tasks = set()
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except (ConnectionError, ValueError):
+                    break
+                if not line:
+                    break
+                task = asyncio.create_task(self._respond(line, writer))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.gather(*tasks)
+        finally:
+            writer.close()
+
+    async def _respond(self, line: bytes, writer: asyncio.StreamWriter) -> None:
+        op = request_id = None
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError("a request must be a JSON object")
+            op, request_id = request.get("op"), request.get("id")
+            response = await self._dispatch(request)
+        except Exception as e:
+            response = {"error": str(e)}
+        response["id"] = request_id
+        try:
+            writer.write(json.dumps(response, default=str).encode() + b"\n")
+            await writer.drain()
+        except ConnectionError:
+            pass  # The client went away; its report is still cached.
+        if op == "shutdown":
+            # Stop only once the acknowledgement has been sent.
+            self._stopping.set()
+
+    async def _dispatch(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        op = request.get("op")
+        if op == "validate":
+            report, cached = await self._validate(request)
+            return {"report": report, "cached": cached}
+        if op == "check_schema":
+            return {"schema_error": self._check_schema(request.get("schema"))}
+        if op == "ping":
+            return {"version": __version__, "pid": os.getpid()}
+        if op == "stats":
+            return self.stats()
+        if op == "shutdown":
+            return {}
+        raise ValueError(f"unknown op: {op!r}")
+
+    @staticmethod
+    def _check_schema(schema: Optional[dict]) -> Optional[str]:
+        if schema is None:
+            return None
+        from .schema import compile_schema
+        try:
+            compile_schema(schema)
+        except Exception as e:
+            return str(e)
+        return None
+
+    def stats(self) -> Dict[str, Any]:
+        """Return request and cache counters since the daemon started."""
+        stats = {"requests": self.requests, "workers": self.workers,
+                 "uptime_seconds": round(time.time() - self.started, 3)}
+        if self.cache is not None:
+            stats.update(cache_hits=self.cache.hits, cache_misses=self.cache.misses)
+        return stats
+
+    async def _validate(self, request: Dict[str, Any]):
+        self.requests += 1
+        loop = asyncio.get_running_loop()
+        path, schema = request["path"], request.get("schema")
+        args = (request.get("chunksize"), request.get("workers"), request.get("state_dir"),
+                request.get("profile", False), request.get("extra"))
+        # Incremental runs keep their own state; see ``use_cache`` in ``cli.validate``.
+        use_cache = self.cache is not None and request.get("use_cache", True) and args[2] is None
+        options = _cache_options(args[0], args[1], args[2], args[4])
+        if use_cache:
+            report = await loop.run_in_executor(self._cache_io, _cache_lookup, self.cache, path, schema, options)
+            if report is not None:
+                return report, True
+
+        pool = self._pool
+        try:
+            report = await loop.run_in_executor(pool, _validate_path, path, schema, *args)
+        except BrokenProcessPool as e:
+            # A worker died (e.g. killed for memory); later requests get a fresh pool.
+            if self._pool is pool:
+                pool.shutdown(wait=False)
+                self._pool = ProcessPoolExecutor(max_workers=self.workers)
+            return _error_report(e), False
+        except Exception as e:
+            return _error_report(e), False
+
+        if use_cache:
+            await loop.run_in_executor(self._cache_io, _cache_put, self.cache, path, schema, report, options)
+        return report, False
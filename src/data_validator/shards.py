@@ -0,0 +1,223 @@
+"""
+Sharded validation across machines, with mergeable partial-state files.
+
+``validate_shard`` validates shard ``i`` of ``N`` of a list of inputs:
+
+* Uncompressed CSV/TSV files are split into ``N`` record-aligned byte ranges
+  (``parallel.shard_range``); every shard accumulates its range of every
+  such file. Nothing is reported yet: the shard keeps the
+  ``CSVAccumulator`` state (counts, type tallies and quantile sketches).
+* Other inputs (compressed, JSON, Parquet/Arrow) cannot be split by rows, so
+  whole files are dealt out round-robin in sorted path order and validated
+  by their shard as usual.
+
+The result is a partial state, written gzip-compressed JSON by
+``write_state``. ``merge_states`` combines any two partial states of the same
+run (same inputs, schema and shard count, disjoint shards) into another
+partial state, so shards can be merged in any grouping; once every shard is
+present ``final_report`` turns the state into the ``{path: report}`` shape
+``validate`` reports. Counts are exact; statistical outliers go through the
+merged quantile sketches, as with ``--workers``.
+
+The per-file ``unique_keys`` check needs every key of a file in one place, so
+it is not run on CSV ranges.
+"""
+
+import gzip
+import json
+import os
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from . import __version__
+from .accumulators import CSVAccumulator
+from .cli import _validate_path
+from .parallel import accumulate_csv_range, shard_range
+from .sources import detect_source
+from .streaming import DEFAULT_CHUNKSIZE
+
+STATE_FORMAT = "data-validator-partial"
+STATE_VERSION = 1
+
+
+class ShardStateError(ValueError):
+    """Raised when partial-state files cannot be read or merged."""
+
+
+def parse_shard(text: str) -> Tuple[int, int]:
+    """Parse ``"i/N"`` (1-based ``i``) into ``(i, N)``."""
+    try:
+        index, count = (int(part) for part in text.split("/"))
+    except ValueError:
+        raise ValueError(f"invalid shard {text!r}: expected i/N, e.g. 1/4") from None
+    if count < 1 or not 1 <= index <= count:
+        raise ValueError(f"invalid shard {text!r}: i must be between 1 and N")
+    return index, count
+
+
+def _splittable(path: str):
+    source = detect_source(path)
+    if source is not None and source.is_delimited and source.compression is None:
+        return source
+    return None
+
+
+def _fingerprint(path: str) -> List[int]:
+    st = os.stat(path)
+    return [st.st_size, st.st_mtime_ns]
+
+
+def validate_shard(files: List[str], index: int, count: int, schema: Optional[dict] = None,
+                   chunksize: Optional[int] = None, extra: Optional[dict] = None) -> Dict[str, Any]:
+    """
+    Validate shard ``index`` (1-based) of ``count`` over ``files``.
+
+    Args:
+        files: Every input of the run, identical (and in the same order) on all shards
+        index: This shard, from 1 to ``count``
+        count: Number of shards
+        schema: Optional validation schema
+        chunksize: Rows parsed per chunk of a CSV range
+        extra: Further ``validate_file`` options for whole files, as for ``cli._validate_path``
+
+    Returns:
+        The partial state of this shard
+    """
+    entries: Dict[str, Dict[str, Any]] = {}
+    whole = sorted(path for path in set(files) if _splittable(path) is None)
+    for path in files:
+        if path in entries:
+            continue
+        source = _splittable(path)
+        if source is None:
+            if whole.index(path) % count == index - 1:
+                entries[path] = {"fingerprint": _fingerprint(path),
+                                 "report": _validate_path(path, schema, chunksize, extra=extra)}
+            continue
+        entry: Dict[str, Any] = {"fingerprint": _fingerprint(path), "file_type": source.file_type}
+        try:
+            columns, start, end = shard_range(path, index - 1, count, source.sep)
+            accumulator = accumulate_csv_range(path, start, end, columns, chunksize or DEFAULT_CHUNKSIZE,
+                                               source.sep)
+            entry.update(pieces=[[start, end]], accumulator=accumulator.to_state())
+        except Exception as e:
+            entry.update(pieces=[], error=f"Failed to read {source.file_type} file: {str(e)}")
+        entries[path] = entry
+    return {
+        "format": STATE_FORMAT,
+        "state_version": STATE_VERSION,
+        "tool_version": __version__,
+        "inputs": list(files),
+        "schema": schema,
+        "shard_count": count,
+        "shards": [index],
+        "files": entries,
+    }
+
+
+def write_state(path: str, state: Dict[str, Any]) -> None:
+    """Write a partial state as gzip-compressed JSON."""
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        json.dump(state, f, separators=(",", ":"))
+
+
+def read_state(path: str) -> Dict[str, Any]:
+    """Read a partial state written by ``write_state``, checking its format and version."""
+    try:
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            state = json.load(f)
+    except (OSError, ValueError) as e:
+        raise ShardStateError(f"{path}: not a partial-state file ({e})") from None
+    if not isinstance(state, dict) or state.get("format") != STATE_FORMAT:
+        raise ShardStateError(f"{path}: not a partial-state file")
+    if state.get("state_version") != STATE_VERSION:
+        raise ShardStateError(f"{path}: unsupported state version {state.get('state_version')} "
+                              f"(expected {STATE_VERSION})")
+    return state
+
+
+def _merge_entry(path: str, left: Dict[str, Any], right: Dict[str, Any]) -> Dict[str, Any]:
+    if left["fingerprint"] != right["fingerprint"]:
+        raise ShardStateError(f"{path} changed between shards")
+    if "report" in left or "report" in right:
+        raise ShardStateError(f"{path} was validated by more than one shard")
+    # Merge in file order so columns keep the order a single pass would give.
+    if right["pieces"] and (not left["pieces"] or right["pieces"][0][0] < left["pieces"][0][0]):
+        left, right = right, left
+    merged = dict(left, pieces=sorted(left["pieces"] + right["pieces"]))
+    error = left.get("error") or right.get("error")
+    if error:
+        merged["error"] = error
+        merged.pop("accumulator", None)
+    else:
+        accumulator = CSVAccumulator.from_state(left["accumulator"])
+        accumulator.merge(CSVAccumulator.from_state(right["accumulator"]))
+        merged["accumulator"] = accumulator.to_state()
+    return merged
+
+
+def merge_states(left: Dict[str, Any], right: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Combine two partial states of the same run.
+
+    The operation is associative and commutative up to quantile-sketch
+    compaction, so shards may be merged pairwise, in a tree, or all at once.
+
+    Raises:
+        ShardStateError: If the states come from different runs, share a shard,
+            or saw different versions of a file
+    """
+    for key in ("inputs", "schema", "shard_count"):
+        if left[key] != right[key]:
+            raise ShardStateError(f"partial states come from different runs ({key} differs)")
+    overlap = set(left["shards"]) & set(right["shards"])
+    if overlap:
+        raise ShardStateError(f"shard(s) {', '.join(map(str, sorted(overlap)))} given more than once")
+    files = dict(left["files"])
+    for path, entry in right["files"].items():
+        files[path] = _merge_entry(path, files[path], entry) if path in files else entry
+    return dict(left, shards=sorted(left["shards"] + right["shards"]), files=files)
+
+
+def merge_all(states: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """Merge one or more partial states."""
+    merged = None
+    for state in states:
+        merged = state if merged is None else merge_states(merged, state)
+    if merged is None:
+        raise ShardStateError("no partial states to merge")
+    return merged
+
+
+def missing_shards(state: Dict[str, Any]) -> List[int]:
+    """Return the shards (1-based) not yet merged into ``state``."""
+    return sorted(set(range(1, state["shard_count"] + 1)) - set(state["shards"]))
+
+
+def final_report(state: Dict[str, Any]) -> Dict[str, dict]:
+    """
+    Return ``{path: report}`` for a state holding every shard, in input order.
+
+    Raises:
+        ShardStateError: If shards are missing
+    """
+    from .validators import _csv_report
+
+    missing = missing_shards(state)
+    if missing:
+        raise ShardStateError(f"missing shard(s) {', '.join(map(str, missing))} of {state['shard_count']}")
+    full_report = {}
+    for path in state["inputs"]:
+        entry = state["files"][path]
+        if "report" in entry:
+            full_report[path] = entry["report"]
+        elif "error" in entry:
+            full_report[path] = {
+                "error": entry["error"],
+                "summary": "File read error",
+                "status": "ERROR",
+                "file_type": entry["file_type"],
+            }
+        else:
+            accumulator = CSVAccumulator.from_state(entry["accumulator"])
+            full_report[path] = _csv_report(*accumulator.finalize(), file_type=entry["file_type"])
+    return full_report
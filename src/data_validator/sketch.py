@@ -0,0 +1,176 @@
+"""
+Bounded-memory, mergeable quantile sketch used for streaming IQR bounds.
+
+The sketch is a stack of KLL-style compactors. Level ``h`` holds items of
+weight ``2**h``; whenever a level grows past ``capacity`` items it is sorted
+and every other item is promoted to the next level with doubled weight.
+
+Error bound: while no more than ``capacity`` values have been added the sketch
+keeps every value and quantiles match ``np.percentile`` exactly. Once it has
+compacted, each compaction at level ``h`` moves the rank of any query point by
+at most ``2**h`` and level ``h`` compacts at most ``n / (capacity * 2**h)``
+times, so the rank error of any quantile is bounded by::
+
+    n * (log2(n / capacity) + 1) / capacity
+
+For the default capacity of 2048 that is under 1% of ``n`` for a billion
+values, and the alternating compaction offsets keep the typical error far
+below the worst case. Memory is ``O(capacity * log2(n / capacity))`` floats.
+
+The ``capacity`` smallest and largest values are also kept exactly, so
+``count_outside`` is exact whenever at most ``capacity`` values fall beyond
+each bound, which is the normal case for outlier fences.
+"""
+
+import numpy as np
+from typing import List, Sequence
+
+DEFAULT_CAPACITY = 2048
+
+
+class QuantileSketch:
+    """Mergeable quantile sketch with a documented rank-error bound."""
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        if capacity < 2:
+            raise ValueError("capacity must be at least 2")
+        self.capacity = capacity
+        self.count = 0
+        self.min = float('inf')
+        self.max = float('-inf')
+        self.levels: List[np.ndarray] = [np.empty(0, dtype=np.float64)]
+        self._offsets: List[int] = [0]
+        self.low = np.empty(0, dtype=np.float64)
+        self.high = np.empty(0, dtype=np.float64)
+
+    @property
+    def is_exact(self) -> bool:
+        """True while every value added is still held at weight one."""
+        return len(self.levels) == 1
+
+    def update(self, values: Sequence[float]) -> None:
+        """Add a batch of non-null numeric values."""
+        values = np.asarray(values, dtype=np.float64)
+        if values.size == 0:
+            return
+        self.count += int(values.size)
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self._update_tails(values, values)
+        self._compress()
+
+    def merge(self, other: "QuantileSketch") -> "QuantileSketch":
+        """Fold ``other`` into this sketch in place and return ``self``."""
+        if other.count == 0:
+            return self
+        self.count += other.count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        for h, items in enumerate(other.levels):
+            self._ensure_level(h)
+            self.levels[h] = np.concatenate([self.levels[h], items])
+        self._update_tails(other.low, other.high)
+        self._compress()
+        return self
+
+    def quantiles(self, qs: Sequence[float]) -> np.ndarray:
+        """Return the values at fractional ranks ``qs`` (0..1)."""
+        if self.count == 0:
+            raise ValueError("cannot compute quantiles of an empty sketch")
+        if self.is_exact:
+            return np.percentile(self.levels[0], [q * 100 for q in qs])
+
+        values, weights = self._weighted_items()
+        order = np.argsort(values, kind="mergesort")
+        values, cumulative = values[order], np.cumsum(weights[order])
+        ranks = np.asarray(qs, dtype=np.float64) * (self.count - 1)
+        idx = np.searchsorted(cumulative, ranks, side="right")
+        return values[np.minimum(idx, len(values) - 1)]
+
+    def count_outside(self, lower: float, upper: float) -> int:
+        """Count values strictly below ``lower`` or above ``upper``.
+
+        Exact whenever the retained extremes cover each bound, i.e. at most
+        ``capacity`` values lie beyond it; otherwise that side is estimated
+        within the rank-error bound.
+        """
+        if self.count == 0:
+            return 0
+        below_exact = self.is_exact or self.low.max() >= lower
+        above_exact = self.is_exact or self.high.min() <= upper
+        total = 0
+        if below_exact:
+            total += int((self.low < lower).sum())
+        if above_exact:
+            total += int((self.high > upper).sum())
+        if not (below_exact and above_exact):
+            values, weights = self._weighted_items()
+            if not below_exact:
+                total += int(weights[values < lower].sum())
+            if not above_exact:
+                total += int(weights[values > upper].sum())
+        return total
+
+    def to_state(self) -> dict:
+        """Return a JSON-serializable snapshot of the sketch."""
+        return {
+            "capacity": self.capacity,
+            "count": self.count,
+            "min": self.min,
+            "max": self.max,
+            "levels": [items.tolist() for items in self.levels],
+            "offsets": list(self._offsets),
+            "low": self.low.tolist(),
+            "high": self.high.tolist(),
+        }
+
+    @classmethod
+    def from_state(cls, state: dict) -> "QuantileSketch":
+        """Rebuild a sketch from ``to_state`` output."""
+        sketch = cls(state["capacity"])
+        sketch.count = state["count"]
+        sketch.min = state["min"]
+        sketch.max = state["max"]
+        sketch.levels = [np.asarray(items, dtype=np.float64) for items in state["levels"]]
+        sketch._offsets = list(state["offsets"])
+        sketch.low = np.asarray(state["low"], dtype=np.float64)
+        sketch.high = np.asarray(state["high"], dtype=np.float64)
+        return sketch
+
+    def _update_tails(self, low: np.ndarray, high: np.ndarray) -> None:
+        k = self.capacity
+        low = np.concatenate([self.low, low])
+        if len(low) > k:
+            low = np.partition(low, k - 1)[:k]
+        high = np.concatenate([self.high, high])
+        if len(high) > k:
+            high = np.partition(high, len(high) - k)[len(high) - k:]
+        self.low, self.high = low, high
+
+    def _weighted_items(self):
+        values = np.concatenate(self.levels)
+        weights = np.concatenate([
+            np.full(len(items), 2 ** h, dtype=np.int64) for h, items in enumerate(self.levels)
+        ])
+        return values, weights
+
+    def _ensure_level(self, h: int) -> None:
+        while len(self.levels) <= h:
+            self.levels.append(np.empty(0, dtype=np.float64))
+            self._offsets.append(0)
+
+    def _compress(self) -> None:
+        h = 0
+        while h < len(self.levels):
+            items = self.levels[h]
+            if len(items) > self.capacity:
+                items = np.sort(items)
+                paired = len(items) - len(items) % 2
+                offset = self._offsets[h]
+                self._offsets[h] = 1 - offset
+                promoted = items[offset:paired:2]
+                self.levels[h] = items[paired:]
+                self._ensure_level(h + 1)
+                self.levels[h + 1] = np.concatenate([self.levels[h + 1], promoted])
+            h += 1
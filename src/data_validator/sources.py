@@ -0,0 +1,228 @@
+"""
+Input detection and opening for compressed and delimited text files.
+
+Compression is recognised by magic bytes (gzip, bz2, xz, zstd), falling back
+to the ``.gz``/``.bz2``/``.xz``/``.zst`` suffix, so a ``.csv`` that is
+really gzip is still read correctly. The delimiter comes from the suffix
+under the compression suffix (``.csv``, ``.tsv``/``.tab``, ``.psv``); for
+``.txt`` files, or compressed files with no inner suffix such as
+``data.zst``, it is sniffed from the header line.
+
+Compressed files are decompressed by a background thread into a bounded queue
+of blocks, so decompression (zlib, bz2 and lzma release the GIL) overlaps with
+parsing while memory stays at a few blocks. Uncompressed files are handed to
+pandas by path with ``memory_map=True``.
+
+zstd needs the optional ``zstandard`` package.
+"""
+
+import bz2
+import gzip
+import io
+import lzma
+import os
+import queue
+import threading
+from contextlib import contextmanager
+from typing import Any, BinaryIO, Dict, Iterator, NamedTuple, Optional, Tuple
+
+_BLOCK_SIZE = 1 << 20
+# Decompressed blocks buffered ahead of the parser.
+_QUEUE_BLOCKS = 8
+
+COMPRESSION_SUFFIXES = {".gz": "gzip", ".bz2": "bz2", ".xz": "xz", ".zst": "zstd"}
+_MAGIC = (
+    (b"\x1f\x8b", "gzip"),
+    (b"BZh", "bz2"),
+    (b"\xfd7zXZ\x00", "xz"),
+    (b"\x28\xb5\x2f\xfd", "zstd"),
+)
+DELIMITER_SUFFIXES = {".csv": ",", ".tsv": "\t", ".tab": "\t", ".psv": "|"}
+# Suffixes whose delimiter is sniffed from the header line.
+_SNIFFED_SUFFIXES = ("", ".txt")
+_SNIFFED_DELIMITERS = ",\t|;"
+JSON_SUFFIXES = (".json", ".jsonl", ".ndjson")
+
+
+class TextSource(NamedTuple):
+    """A text input: its path, compression (or None) and, for tables, delimiter."""
+    path: str
+    compression: Optional[str] = None
+    sep: Optional[str] = None
+
+    @property
+    def is_delimited(self) -> bool:
+        return self.sep is not None
+
+    @property
+    def file_type(self) -> str:
+        if not self.is_delimited:
+            return "JSON"
+        return "TSV" if self.sep == "\t" else "CSV"
+
+
+def _magic_compression(path: str) -> Optional[str]:
+    try:
+        with open(path, "rb") as f:
+            head = f.read(6)
+    except OSError:
+        return None
+    for magic, compression in _MAGIC:
+        if head.startswith(magic):
+            return compression
+    return None
+
+
+def _sniff_delimiter(path: str, compression: Optional[str]) -> Optional[str]:
+    with open_binary(path, compression) as f:
+        header = f.readline(_BLOCK_SIZE)
+    if header.lstrip().startswith((b"{", b"[")):
+        return None  # JSON without a suffix to say so
+    counts = {sep: header.count(sep.encode()) for sep in _SNIFFED_DELIMITERS}
+    sep = max(counts, key=counts.get)
+    return sep if counts[sep] else None
+
+
+def inner_suffix(path: str) -> Tuple[str, Optional[str]]:
+    """Return the lower-cased suffix of ``path`` under any compression suffix, and that compression."""
+    stem, suffix = os.path.splitext(path.lower())
+    compression = COMPRESSION_SUFFIXES.get(suffix)
+    if compression is not None:
+        suffix = os.path.splitext(stem)[1]
+    return suffix, compression
+
+
+def detect_source(path: str) -> Optional[TextSource]:
+    """
+    Return how to read ``path`` as delimited text or JSON, or None for other files.
+
+    Args:
+        path: Path of the input file
+
+    Returns:
+        A ``TextSource``; ``sep`` is set for delimited tables and None for
+        JSON/NDJSON. Unknown suffixes give None.
+    """
+    suffix, compression = inner_suffix(path)
+    compression = _magic_compression(path) or compression
+
+    if suffix in JSON_SUFFIXES:
+        return TextSource(path, compression)
+    if suffix in DELIMITER_SUFFIXES:
+        return TextSource(path, compression, DELIMITER_SUFFIXES[suffix])
+    if suffix in _SNIFFED_SUFFIXES and (compression is not None or suffix):
+        sep = _sniff_delimiter(path, compression)
+        if sep is not None:
+            return TextSource(path, compression, sep)
+    return None
+
+
+def _open_zstd(path: str) -> BinaryIO:
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError("zstandard is required for .zst files: pip install zstandard") from None
+    return zstandard.ZstdDecompressor().stream_reader(open(path, "rb"), closefd=True)
+
+
+_OPENERS = {
+    "gzip": lambda path: gzip.open(path, "rb"),
+    "bz2": lambda path: bz2.open(path, "rb"),
+    "xz": lambda path: lzma.open(path, "rb"),
+    "zstd": _open_zstd,
+}
+
+
+class _PrefetchReader(io.RawIOBase):
+    """Read-only stream whose blocks are read from ``raw`` by a background thread."""
+
+    def __init__(self, raw: BinaryIO, block_size: int = _BLOCK_SIZE, depth: int = _QUEUE_BLOCKS):
+        self._raw = raw
+        self._block_size = block_size
+        self._queue: "queue.Queue[Any]" = queue.Queue(depth)
+        self._stop = threading.Event()
+        self._pending = memoryview(b"")
+        self._eof = False
+        self._thread = threading.Thread(target=self._fill, name="data-validator-decompress", daemon=True)
+        self._thread.start()
+
+    def _put(self, item: Any) -> bool:
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _fill(self) -> None:
+        try:
+            while True:
+                block = self._raw.read(self._block_size)
+                if not self._put(block) or not block:
+                    return
+        except BaseException as e:  # re-raised in the reading thread
+            self._put(e)
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        if not self._pending:
+            if self._eof:
+                return 0
+            item = self._queue.get()
+            if isinstance(item, BaseException):
+                self._eof = True
+                raise item
+            if not item:
+                self._eof = True
+                return 0
+            self._pending = memoryview(item)
+        n = min(len(buffer), len(self._pending))
+        buffer[:n] = self._pending[:n]
+        self._pending = self._pending[n:]
+        return n
+
+    def close(self) -> None:
+        if not self.closed:
+            self._stop.set()
+            while self._thread.is_alive():
+                try:
+                    self._queue.get(timeout=0.1)
+                except queue.Empty:
+                    pass
+            self._raw.close()
+        super().close()
+
+
+def open_binary(path: str, compression: Optional[str] = None) -> BinaryIO:
+    """Open ``path`` for reading decompressed bytes, decompressing in a background thread."""
+    if compression is None:
+        return open(path, "rb")
+    return io.BufferedReader(_PrefetchReader(_OPENERS[compression](path)), _BLOCK_SIZE)
+
+
+@contextmanager
+def csv_input(source: TextSource) -> Iterator[Tuple[Any, Dict[str, Any]]]:
+    """
+    Yield ``(filepath_or_buffer, read_csv_kwargs)`` for reading ``source`` with pandas.
+
+    Uncompressed files are memory-mapped by pandas; compressed files are
+    read from a prefetching decompression stream that is closed on exit.
+    """
+    if source.compression is None:
+        yield source.path, {"sep": source.sep, "memory_map": True}
+        return
+    with open_binary(source.path, source.compression) as handle:
+        yield handle, {"sep": source.sep}
+
+
+def open_output(path: str, compression: Optional[str]) -> BinaryIO:
+    """Open ``path`` for writing with the same compression as an input."""
+    if compression is None:
+        return open(path, "wb")
+    if compression == "zstd":
+        import zstandard
+        return zstandard.ZstdCompressor().stream_writer(open(path, "wb"), closefd=True)
+    return {"gzip": gzip.open, "bz2": bz2.open, "xz": lzma.open}[compression](path, "wb")
@@ -0,0 +1,68 @@
+"""
+Chunked CSV reading for files that do not fit comfortably in memory.
+
+Peak memory is bounded by one chunk of rows plus the per-column accumulators,
+independent of the file size.
+"""
+
+import pandas as pd
+from typing import Dict, Optional, Tuple
+
+from .accumulators import CSVAccumulator
+from .budget import ViolationBudget
+from .profiling import NULL_PROFILER
+from .sketch import DEFAULT_CAPACITY
+
+DEFAULT_CHUNKSIZE = 100_000
+
+
+def accumulate_csv(path, chunksize: int = DEFAULT_CHUNKSIZE,
+                   domain_ranges: Optional[Dict[str, Tuple[float, float]]] = None,
+                   iqr_multiplier: float = 2.5, capacity: int = DEFAULT_CAPACITY,
+                   profiler=NULL_PROFILER, budget: Optional[ViolationBudget] = None,
+                   **read_csv_kwargs) -> CSVAccumulator:
+    """
+    Stream a CSV file through a ``CSVAccumulator`` ``chunksize`` rows at a time.
+
+    Args:
+        path: Path or readable file object of the CSV data
+        chunksize: Number of rows parsed per chunk
+        domain_ranges: Optional domain ranges, as accepted by ``report_outliers``
+        iqr_multiplier: IQR multiplier for statistical outliers
+        capacity: Quantile sketch capacity per numeric column
+        profiler: Optional ``Profiler`` recording parse and per-column accumulate time
+        budget: Optional ``ViolationBudget``; reading stops after the chunk that
+            uses it up, and ``budget.truncated`` is set if rows were left unread
+        **read_csv_kwargs: Extra arguments forwarded to ``pd.read_csv``
+
+    Returns:
+        The populated accumulator; call ``finalize()`` for the report lists
+    """
+    if chunksize < 1:
+        raise ValueError("chunksize must be a positive integer")
+
+    accumulator = CSVAccumulator(domain_ranges, iqr_multiplier, capacity)
+    with pd.read_csv(path, chunksize=chunksize, **read_csv_kwargs) as reader:
+        chunks = iter(reader)
+        while True:
+            with profiler.stage("read_csv") as stage:
+                chunk = next(chunks, None)
+                if chunk is not None:
+                    stage.rows = len(chunk)
+            if chunk is None:
+                break
+            accumulator.update(chunk, profiler)
+            if budget is not None and budget.exhausted(accumulator.violation_counts()):
+                # A full chunk may still end the file; only a further chunk
+                # means rows were left unread.
+                budget.truncated = len(chunk) == chunksize and next(chunks, None) is not None
+                break
+    return accumulator
+
+
+def validate_csv_stream(path, chunksize: int = DEFAULT_CHUNKSIZE, profiler=NULL_PROFILER,
+                        **kwargs) -> Tuple[list, list, list]:
+    """Return ``(missing, outliers, type_errors)`` for a CSV read in chunks."""
+    accumulator = accumulate_csv(path, chunksize, profiler=profiler, **kwargs)
+    with profiler.stage("finalize", rows=accumulator.rows):
+        return accumulator.finalize()
@@ -0,0 +1,359 @@
+"""
+Memory-bounded duplicate detection for key columns.
+
+A schema declares its keys under ``unique_keys``: each entry is a column name
+or a list of names forming a composite key. Key values are compared as text,
+exactly as they appear in the file, and rows with a missing key component
+are left to the missing-value check.
+
+``UniqueKeyIndex`` first collapses each chunk to one ``(key, source, count)``
+entry per distinct key, so a key repeated a million times costs one entry
+per chunk, not a million. It buffers these entries in memory until their
+estimated size reaches ``memory_limit``; the buffer is then merged once more,
+and if that does not free enough room, everything buffered so far, and
+everything that follows, is hash-partitioned into spill files on disk (a
+grace hash join without the join). ``finalize`` counts each partition on its
+own, so memory holds one partition at a time; a partition that is still too
+large is split again with a different hash seed, and merged as it is read
+once no more splits are allowed. Equal keys always land in the same
+partition, so the per-partition counts add up to exact totals.
+
+Every key remembers which source (file) it came from, so one index can span
+several files and name the files behind each sampled duplicate.
+"""
+
+import os
+import pickle
+import shutil
+import tempfile
+from typing import Any, BinaryIO, Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .sources import TextSource, csv_input
+from .streaming import DEFAULT_CHUNKSIZE
+
+DEFAULT_MEMORY_LIMIT = 256 * 1024 * 1024
+DEFAULT_SAMPLE_KEYS = 10
+# Joins the parts of a composite key; a control character, so not in real data.
+_SEPARATOR = "\x1f"
+# Estimated bytes per buffered entry on top of its key's characters: the str
+# object header, the array slot, the source id and the count.
+_KEY_OVERHEAD = 72
+_FANOUT = 64
+_MAX_DEPTH = 4
+
+
+def key_label(columns: Sequence[str]) -> str:
+    """Return the report name of a key, e.g. ``sample_id+run``."""
+    return "+".join(columns)
+
+
+def encode_keys(frame: pd.DataFrame, columns: Sequence[str]) -> np.ndarray:
+    """Return the non-missing keys of ``frame`` as one string per row."""
+    key = frame[columns[0]].astype("string")
+    for col in columns[1:]:
+        key = key.str.cat(frame[col].astype("string"), sep=_SEPARATOR)
+    return key.dropna().to_numpy(dtype=object)
+
+
+def _key_bytes(keys: np.ndarray) -> np.ndarray:
+    return np.fromiter(map(len, keys), dtype=np.int64, count=len(keys)) + _KEY_OVERHEAD
+
+
+class _Entries(NamedTuple):
+    """Keys with the source they came from and how often they occur there."""
+
+    keys: np.ndarray
+    sources: np.ndarray
+    counts: np.ndarray
+
+    def take(self, rows: np.ndarray) -> "_Entries":
+        return _Entries(self.keys[rows], self.sources[rows], self.counts[rows])
+
+    def nbytes(self) -> int:
+        return int(_key_bytes(self.keys).sum())
+
+
+def _concat(pieces: Sequence[_Entries]) -> _Entries:
+    return _Entries(*(np.concatenate(arrays) for arrays in zip(*pieces)))
+
+
+def _combine(entries: _Entries) -> _Entries:
+    """Merge entries with the same key and source, summing their counts."""
+    codes, uniques = pd.factorize(entries.keys)
+    if len(uniques) == len(entries.keys):
+        return entries
+    pairs = codes.astype(np.int64) * (int(entries.sources.max()) + 1) + entries.sources
+    pairs, first, inverse = np.unique(pairs, return_index=True, return_inverse=True)
+    counts = np.bincount(inverse, weights=entries.counts, minlength=len(pairs)).astype(np.int64)
+    return _Entries(entries.keys[first], entries.sources[first], counts)
+
+
+def _partition_of(keys: np.ndarray, depth: int) -> np.ndarray:
+    # Most keys are distinct, so hashing them directly beats factorizing first.
+    hashed = pd.util.hash_array(keys, hash_key=f"uniqueness{depth:06d}", categorize=False)
+    return (hashed % np.uint64(_FANOUT)).astype(np.int64)
+
+
+class _Partitions:
+    """Append-only spill files, one per hash partition."""
+
+    def __init__(self, directory: str, depth: int):
+        self.directory = directory
+        self.depth = depth
+        self.rows = np.zeros(_FANOUT, dtype=np.int64)
+        self.bytes = np.zeros(_FANOUT, dtype=np.int64)
+        self._files: Dict[int, BinaryIO] = {}
+
+    def _path(self, i: int) -> str:
+        return os.path.join(self.directory, f"{self.depth}-{i}.pkl")
+
+    def add(self, entries: _Entries) -> None:
+        part = _partition_of(entries.keys, self.depth)
+        self.bytes += np.bincount(part, weights=_key_bytes(entries.keys), minlength=_FANOUT).astype(np.int64)
+        self.rows += np.bincount(part, minlength=_FANOUT)
+        order = np.argsort(part, kind="stable")
+        bounds = np.searchsorted(part[order], np.arange(_FANOUT + 1))
+        for i in range(_FANOUT):
+            rows = order[bounds[i]:bounds[i + 1]]
+            if len(rows):
+                if i not in self._files:
+                    self._files[i] = open(self._path(i), "wb")
+                pickle.dump(tuple(entries.take(rows)), self._files[i], protocol=pickle.HIGHEST_PROTOCOL)
+
+    def close(self) -> None:
+        for f in self._files.values():
+            f.close()
+
+    def read(self, i: int) -> Iterator[_Entries]:
+        with open(self._path(i), "rb") as f:
+            while True:
+                try:
+                    yield _Entries(*pickle.load(f))
+                except EOFError:
+                    return
+
+    def remove(self, i: int) -> None:
+        os.unlink(self._path(i))
+
+
+class UniqueKeyIndex:
+    """Count duplicate values of one (possibly composite) key within a memory limit."""
+
+    def __init__(self, columns: Sequence[str], memory_limit: int = DEFAULT_MEMORY_LIMIT,
+                 samples: int = DEFAULT_SAMPLE_KEYS, spill_dir: Optional[str] = None):
+        """
+        Args:
+            columns: Key column names (more than one for a composite key)
+            memory_limit: Estimated bytes of buffered keys before spilling to disk
+            samples: Number of duplicated keys to report, most frequent first
+            spill_dir: Parent directory for spill files (defaults to the system temp dir)
+        """
+        if memory_limit < 1:
+            raise ValueError("memory_limit must be a positive integer")
+        self.columns = list(columns)
+        self.memory_limit = memory_limit
+        self.samples = samples
+        self.spill_dir = spill_dir
+        self.rows = 0
+        self._buffer: List[_Entries] = []
+        self._buffered_bytes = 0
+        self._directory: Optional[str] = None
+        self._partitions: Optional[_Partitions] = None
+
+    @property
+    def spilled(self) -> bool:
+        return self._partitions is not None
+
+    def update(self, frame: pd.DataFrame, source: int = 0) -> None:
+        """Add the keys of one chunk of rows, read from source number ``source``."""
+        keys = encode_keys(frame, self.columns)
+        if not len(keys):
+            return
+        self.rows += len(keys)
+        entries = _combine(_Entries(keys, np.full(len(keys), source, dtype=np.int32),
+                                    np.ones(len(keys), dtype=np.int64)))
+        self._buffer.append(entries)
+        self._buffered_bytes += entries.nbytes()
+        if self._buffered_bytes >= self.memory_limit:
+            if self._partitions is None and len(self._buffer) > 1:
+                # Keys repeated across chunks merge into one entry; spill only
+                # if that does not free at least half the limit.
+                self._buffer = [_combine(_concat(self._buffer))]
+                self._buffered_bytes = self._buffer[0].nbytes()
+                if self._buffered_bytes < self.memory_limit // 2:
+                    return
+            self._spill()
+
+    def _spill(self) -> None:
+        if self._partitions is None:
+            self._directory = tempfile.mkdtemp(prefix="data-validator-keys-", dir=self.spill_dir)
+            self._partitions = _Partitions(self._directory, 0)
+        if self._buffer:
+            self._partitions.add(_concat(self._buffer))
+        self._buffer, self._buffered_bytes = [], 0
+
+    def _count(self, partitions: _Partitions) -> Iterator[Tuple[int, int, pd.DataFrame]]:
+        # Partitions hold disjoint keys, so small ones are counted together,
+        # up to the memory limit, instead of paying per-call overhead for each.
+        partitions.close()
+        batch: List[_Entries] = []
+        batch_bytes = 0
+        for i in range(_FANOUT):
+            if not partitions.rows[i]:
+                continue
+            if partitions.bytes[i] > self.memory_limit:
+                if partitions.depth + 1 < _MAX_DEPTH:
+                    # Too large to count in memory: split it again with another seed.
+                    nested = _Partitions(partitions.directory, partitions.depth + 1)
+                    for entries in partitions.read(i):
+                        nested.add(entries)
+                    partitions.remove(i)
+                    yield from self._count(nested)
+                else:
+                    yield _duplicates(self._merge_partition(partitions, i), self.samples)
+                continue
+            if batch and batch_bytes + partitions.bytes[i] > self.memory_limit:
+                yield _duplicates(_concat(batch), self.samples)
+                batch, batch_bytes = [], 0
+            batch.extend(partitions.read(i))
+            batch_bytes += partitions.bytes[i]
+            partitions.remove(i)
+        if batch:
+            yield _duplicates(_concat(batch), self.samples)
+
+    def _merge_partition(self, partitions: _Partitions, i: int) -> _Entries:
+        """Read a partition that splitting could not shrink, merging entries as they arrive."""
+        merged: List[_Entries] = []
+        merged_bytes = 0
+        for entries in partitions.read(i):
+            merged.append(entries)
+            merged_bytes += entries.nbytes()
+            if merged_bytes > self.memory_limit:
+                merged = [_combine(_concat(merged))]
+                merged_bytes = merged[0].nbytes()
+        partitions.remove(i)
+        return _concat(merged)
+
+    def finalize(self, sources: Optional[Sequence[str]] = None) -> Dict[str, Any]:
+        """
+        Return the duplicate counts, then release the buffered keys and spill files.
+
+        Args:
+            sources: Names of the sources, by number; if given, each sampled key
+                lists the sources it appears in
+
+        Returns:
+            ``{"rows", "duplicate_keys", "duplicate_rows", "spilled", "samples"}``:
+            ``duplicate_keys`` distinct values occur more than once, accounting for
+            ``duplicate_rows`` rows beyond their first occurrence
+        """
+        spilled = self.spilled
+        try:
+            if spilled:
+                self._spill()
+                results = list(self._count(self._partitions))
+            elif self._buffer:
+                results = [_duplicates(_concat(self._buffer), self.samples)]
+            else:
+                results = []
+        finally:
+            self.close()
+
+        duplicate_keys = sum(keys for keys, _, _ in results)
+        duplicate_rows = sum(rows for _, rows, _ in results)
+        top = pd.concat([frame for _, _, frame in results]) if results else _EMPTY_SAMPLES
+        top = top.sort_values(["count", "key"], ascending=[False, True]).head(self.samples)
+        samples = []
+        for key, count, key_sources in top.itertuples(index=False):
+            parts = key.split(_SEPARATOR)
+            sample: Dict[str, Any] = {"key": parts if len(self.columns) > 1 else parts[0], "count": int(count)}
+            if sources is not None:
+                sample["sources"] = [sources[i] for i in key_sources]
+            samples.append(sample)
+        return {
+            "rows": self.rows,
+            "duplicate_keys": duplicate_keys,
+            "duplicate_rows": duplicate_rows,
+            "spilled": spilled,
+            "samples": samples,
+        }
+
+    def close(self) -> None:
+        """Drop buffered keys and delete any spill files."""
+        self._buffer, self._buffered_bytes = [], 0
+        if self._partitions is not None:
+            self._partitions.close()
+            self._partitions = None
+        if self._directory is not None:
+            shutil.rmtree(self._directory, ignore_errors=True)
+            self._directory = None
+
+
+_EMPTY_SAMPLES = pd.DataFrame({"key": pd.Series(dtype=object), "count": pd.Series(dtype=np.int64),
+                               "sources": pd.Series(dtype=object)})
+
+
+def _duplicates(entries: _Entries, samples: int) -> Tuple[int, int, pd.DataFrame]:
+    """Count the duplicated keys in one batch and pick the ``samples`` most frequent."""
+    codes, uniques = pd.factorize(entries.keys)
+    counts = np.bincount(codes, weights=entries.counts, minlength=len(uniques)).astype(np.int64)
+    repeated = np.flatnonzero(counts > 1)
+    if not len(repeated):
+        return 0, 0, _EMPTY_SAMPLES
+    top = pd.DataFrame({"key": uniques[repeated], "count": counts[repeated], "code": repeated})
+    top = top.sort_values(["count", "key"], ascending=[False, True]).head(samples)
+    wanted = np.isin(codes, top["code"].to_numpy())
+    found = pd.DataFrame({"code": codes[wanted], "source": entries.sources[wanted]}).drop_duplicates()
+    by_code = found.sort_values("source").groupby("code")["source"].apply(list)
+    top["sources"] = [by_code[code] for code in top["code"]]
+    return len(repeated), int((counts[repeated] - 1).sum()), top.drop(columns="code")
+
+
+def key_frames(source: TextSource, columns: Sequence[str],
+               chunksize: Optional[int] = None) -> Iterator[pd.DataFrame]:
+    """Yield the ``columns`` of a delimited file (those it has) as text, in chunks."""
+    wanted = set(columns)
+    with csv_input(source) as (data, read_kwargs):
+        yield from pd.read_csv(data, usecols=lambda col: col in wanted, dtype=str,
+                               chunksize=chunksize or DEFAULT_CHUNKSIZE, **read_kwargs)
+
+
+def check_unique_keys(frames: Iterator[Tuple[int, pd.DataFrame]], keys: Sequence[Sequence[str]],
+                      memory_limit: int = DEFAULT_MEMORY_LIMIT, samples: int = DEFAULT_SAMPLE_KEYS,
+                      sources: Optional[Sequence[str]] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Count duplicates of every key over a stream of ``(source, chunk)`` pairs.
+
+    Args:
+        frames: Chunks holding (at least) the key columns, with their source numbers
+        keys: Key column lists
+        memory_limit: Memory limit shared by all keys
+        samples: Duplicated keys to report per key
+        sources: Source names, by number, for the samples
+
+    Returns:
+        ``UniqueKeyIndex.finalize`` results by ``key_label``; keys whose columns
+        are missing from a chunk get ``{"missing_columns": [...]}`` instead
+    """
+    per_key = max(1, memory_limit // max(len(keys), 1))
+    indexes = {key_label(columns): UniqueKeyIndex(columns, per_key, samples) for columns in keys}
+    missing: Dict[str, List[str]] = {}
+    try:
+        for source, frame in frames:
+            for label, index in indexes.items():
+                absent = [col for col in index.columns if col not in frame.columns]
+                if absent:
+                    missing.setdefault(label, [])
+                    missing[label].extend(col for col in absent if col not in missing[label])
+                elif label not in missing:
+                    index.update(frame, source)
+        return {
+            label: {"missing_columns": missing[label]} if label in missing else index.finalize(sources)
+            for label, index in indexes.items()
+        }
+    finally:
+        for index in indexes.values():
+            index.close()
@@ -1,8 +1,11 @@
 import pandas as pd
 import numpy as np
 import re
+import time
 from datetime import datetime
 from typing import Dict, List, Tuple, Any, Optional
+from .rules import matrix_outliers
+from .schema import DEFAULT_SCHEMA, compile_schema
 
 def report_missing(df: pd.DataFrame) -> list:
     missing = []
@@ -12,152 +15,268 @@ def report_missing(df: pd.DataFrame) -> list:
             missing.append((col, int(null_count)))
     return missing
 
+DEFAULT_DOMAIN_RANGES: Dict[str, Tuple[float, float]] = {
+    'age': (0, 120),
+    'cholesterol': (100, 400),
+    'expression': (0, float('inf')),
+    'temperature': (35, 42),
+    'heart_rate': (40, 200),
+    'blood_pressure': (60, 200)
+}
+
+def _resolve_domain_range(col: Any, ranges: Dict[str, Tuple[float, float]]) -> Optional[Tuple[float, float]]:
+    col_lower = str(col).lower()
+    for domain_key, bounds in ranges.items():
+        if domain_key in col_lower:
+            return bounds
+    return None
+
 def report_outliers(df: pd.DataFrame, domain_ranges: Optional[Dict[str, Tuple[float, float]]] = None, iqr_multiplier: float = 2.5) -> list:
-    out = []
+    # Column-to-range resolution is compiled once per header; the domain and
+    # IQR checks run over the whole numeric block at once (see ``rules``).
+    ranges = domain_ranges or DEFAULT_DOMAIN_RANGES
+    per_column = matrix_outliers(df, ranges, iqr_multiplier)
+    return [entry for entries in per_column.values() for entry in entries]
+
+def _is_date_column(col: Any) -> bool:
+    col_lower = str(col).lower()
+    return 'date' in col_lower or 'time' in col_lower
+
+_SCI_NOTATION = re.compile(r'^-?\d*\.?\d+[eE][+-]?\d+$')
+
+# ASCII characters that can appear in something float() accepts; any other
+# ASCII character rules a string out without calling float() on it.
+_FLOAT_CHARS = np.zeros(128, dtype=bool)
+_FLOAT_CHARS[[ord(c) for c in "0123456789.+-_eEiInNfFtTyYaA \t\n\r\x0b\x0c"]] = True
+_CHAR_BLOCK = 1 << 16
+
+# Bulk date formats, tried starting with the one detected for the column. Each
+# layout is matched character by character ('YYYY' year >= 1, 'hh' <= 23,
+# 'mm'/'ss' <= 59) so anything the bulk parser accepts is also accepted by the
+# per-value cascade in ``_is_valid_date``.
+_DATE_FORMATS = [
+    ('YYYY-MM-DD', '%Y-%m-%d'),
+    ('MM/DD/YYYY', '%m/%d/%Y'),
+    ('YYYY-MM-DDThh:mm:ss', '%Y-%m-%dT%H:%M:%S'),
+    ('YYYY-MM-DD hh:mm:ss', '%Y-%m-%d %H:%M:%S'),
+]
+_FIELD_LIMITS = {'Y': (1, 9999), 'h': (0, 23), 'm': (0, 59), 's': (0, 59)}
+
+def _is_numeric_string(value: str) -> bool:
+    try:
+        float(value)
+        return True
+    except ValueError:
+        return bool(_SCI_NOTATION.match(value))
+
+def _is_valid_date(value: str) -> bool:
+    try:
+        datetime.fromisoformat(value.replace('Z', '+00:00'))
+        return True
+    except ValueError:
+        pass
+    for fmt in ('%Y-%m-%d', '%m/%d/%Y'):
+        try:
+            datetime.strptime(value, fmt)
+            return True
+        except ValueError:
+            pass
+    return False
+
+def _char_codes(values: np.ndarray, width: int) -> np.ndarray:
+    """Return an (n, width) matrix of code points, zero-padded."""
+    return np.asarray(values, dtype=f"<U{width}").view(np.uint32).reshape(len(values), width)
+
+def _str_lengths(values: np.ndarray) -> np.ndarray:
+    return np.fromiter(map(len, values), dtype=np.int64, count=len(values))
+
+def _may_be_float(values: np.ndarray) -> np.ndarray:
+    lengths = _str_lengths(values)
+    possible = np.ones(len(values), dtype=bool)
+    for start in range(0, len(values), _CHAR_BLOCK):
+        block = slice(start, start + _CHAR_BLOCK)
+        width = int(lengths[block].max())
+        if width == 0 or width > 64:  # long strings go straight to float()
+            continue
+        codes = _char_codes(values[block], width)
+        ascii_codes = np.where((codes < 128) & (codes > 0), codes, ord('0'))
+        possible[block] = _FLOAT_CHARS[ascii_codes].all(axis=1)
+    return possible
+
+def _match_layout(values: np.ndarray, layout: str) -> np.ndarray:
+    matched = _str_lengths(values) == len(layout)
+    candidates = np.flatnonzero(matched)
+    if len(candidates) == 0:
+        return matched
     
-    default_ranges = {
-        'age': (0, 120),
-        'cholesterol': (100, 400),
-        'expression': (0, float('inf')),
-        'temperature': (35, 42),
-        'heart_rate': (40, 200),
-        'blood_pressure': (60, 200)
-    }
+    digits = _char_codes(values[candidates], len(layout)).astype(np.int64) - ord('0')
+    ok = np.ones(len(candidates), dtype=bool)
+    fields: Dict[str, np.ndarray] = {}
+    for pos, char in enumerate(layout):
+        if char.isalpha():
+            ok &= (digits[:, pos] >= 0) & (digits[:, pos] <= 9)
+            fields[char] = fields.get(char, 0) * 10 + digits[:, pos]
+        else:
+            ok &= digits[:, pos] == ord(char) - ord('0')
+    for char, (low, high) in _FIELD_LIMITS.items():
+        if char in fields:
+            ok &= (fields[char] >= low) & (fields[char] <= high)
+    matched[candidates] = ok
+    return matched
+
+def _is_bool_values(values: pd.Series) -> bool:
+    """True if the non-null ``values`` are all bools.
     
-    ranges = domain_ranges or default_ranges
+    pandas reads such a column as ``bool`` when it has no blanks and as
+    ``object`` holding ``True``/``False`` when it has, so a chunk is judged by
+    its values rather than its dtype.
+    """
+    if pd.api.types.is_bool_dtype(values.dtype):
+        return True
+    return (values.dtype == object and len(values) > 0
+            and pd.api.types.infer_dtype(values, skipna=True) == "boolean")
+
+def _classify_values(series: pd.Series) -> Tuple[Optional[np.ndarray], np.ndarray, np.ndarray]:
+    """Classify non-null values by Python type.
     
-    for col in df.select_dtypes(include=[np.number]):
-        series = df[col].dropna()
-        
-        domain_violations = 0
-        col_lower = str(col).lower()
-        for domain_key, (min_val, max_val) in ranges.items():
-            if domain_key in col_lower:
-                domain_mask = (series < min_val) | (series > max_val)
-                domain_violations = int(domain_mask.sum())
-                if domain_violations > 0:
-                    out.append((f"{col}_domain_range", domain_violations))
-                break
-        
-        if len(series) >= 4:  # Need at least 4 values for meaningful IQR
-            q1, q3 = np.percentile(series, [25, 75])
-            iqr = q3 - q1
-            if iqr > 0:  # Avoid division by zero
-                lower, upper = q1 - iqr_multiplier * iqr, q3 + iqr_multiplier * iqr
-                mask = (series < lower) | (series > upper)
-                statistical_outliers = int(mask.sum())
-                if statistical_outliers > 0 and domain_violations == 0:  # Don't double-count
-                    out.append((f"{col}_statistical", statistical_outliers))
+    Returns:
+        ``(values, is_string, is_numeric)``: the values as an object array (None
+        for numeric and bool columns, whose values are all numeric) and per-value
+        masks. Bools are numeric, as in a ``bool`` column; strings are not parsed.
+    """
+    n = len(series)
+    if pd.api.types.is_numeric_dtype(series.dtype) or pd.api.types.is_bool_dtype(series.dtype):
+        return None, np.zeros(n, dtype=bool), np.ones(n, dtype=bool)
+    
+    values = series.to_numpy(dtype=object)
+    if pd.api.types.infer_dtype(values, skipna=False) == "string":
+        return values, np.ones(n, dtype=bool), np.zeros(n, dtype=bool)
+    
+    kinds = {}
+    for value_type in set(map(type, values)):
+        if issubclass(value_type, str):
+            kinds[value_type] = 0
+        elif issubclass(value_type, (int, float, np.number)):
+            kinds[value_type] = 1
+        else:
+            kinds[value_type] = 2
+    kind = np.fromiter((kinds[type(value)] for value in values), dtype=np.int8, count=n)
+    return values, kind == 0, kind == 1
+
+def _value_kinds(series: pd.Series) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Classify non-null values per value, as ``_count_value_types`` counts them.
+    
+    Returns:
+        ``(is_numeric, is_string, codes, uniques)``: per-value masks, and the
+        factorization of the string values for the date check
+    """
+    values, is_string, is_numeric = _classify_values(series)
+    if values is None:
+        return is_numeric, is_string, np.empty(0, dtype=np.int64), np.empty(0, dtype=object)
     
-    return out
+    codes, uniques = pd.factorize(pd.Series(values[is_string], dtype=object))
+    uniques = np.asarray(uniques, dtype=object)
+    is_numeric[is_string] = _numeric_string_mask(uniques)[codes]
+    return is_numeric, is_string, codes, uniques
 
-def report_type_errors(df: pd.DataFrame) -> list:
+def _split_strings(series: pd.Series) -> Tuple[pd.Series, int, int]:
+    """Split non-null values into (string values, numeric count, other count)."""
+    values, is_string, is_numeric = _classify_values(series)
+    if values is None:
+        return series.iloc[:0], len(series), 0
+    strings = values if is_string.all() else values[is_string]
+    return pd.Series(strings, dtype=object), int(is_numeric.sum()), int((~is_string & ~is_numeric).sum())
+
+def _string_uniques(series: pd.Series) -> Tuple[np.ndarray, np.ndarray, int, int]:
+    """Return (distinct strings, their frequencies, numeric count, other count) for non-null values."""
+    strings, numeric_count, other_count = _split_strings(series)
+    if len(strings) == 0:
+        return np.empty(0, dtype=object), np.empty(0, dtype=np.int64), numeric_count, other_count
+    codes, uniques = pd.factorize(strings)
+    frequency = np.bincount(codes, minlength=len(uniques))
+    return np.asarray(uniques, dtype=object), frequency, numeric_count, other_count
+
+def _numeric_string_mask(uniques: np.ndarray) -> np.ndarray:
+    # Values with a character float() never accepts are ruled out up front; the
+    # rest are parsed in bulk, and whatever the bulk parser rejects ("nan",
+    # "1_000", ...) falls back to the exact per-value rules.
+    is_numeric = np.zeros(len(uniques), dtype=bool)
+    possible = np.flatnonzero(_may_be_float(uniques))
+    if len(possible):
+        parsed = pd.to_numeric(pd.Series(uniques[possible], dtype=object), errors="coerce")
+        is_numeric[possible] = parsed.notna().to_numpy()
+        for i in possible[~is_numeric[possible]]:
+            is_numeric[i] = _is_numeric_string(uniques[i])
+    return is_numeric
+
+def _numeric_string_count(uniques: np.ndarray, frequency: np.ndarray) -> int:
+    return int(frequency[_numeric_string_mask(uniques)].sum())
+
+def _valid_date_mask(uniques: np.ndarray) -> np.ndarray:
+    valid = np.zeros(len(uniques), dtype=bool)
+    if len(uniques) == 0:
+        return valid
+    
+    # Detect the column's format from its first value, then parse in bulk,
+    # cascading through the other formats for whatever is left.
+    first = uniques[:1]
+    formats = sorted(_DATE_FORMATS, key=lambda item: not _match_layout(first, item[0])[0])
+    for layout, fmt in formats:
+        pending = np.flatnonzero(~valid)
+        if len(pending) == 0:
+            return valid
+        matched = _match_layout(uniques[pending], layout)
+        if matched.any():
+            parsed = pd.to_datetime(pd.Series(uniques[pending[matched]], dtype=object), format=fmt, errors="coerce")
+            valid[pending[matched]] = parsed.notna().to_numpy()
+    
+    for i in np.flatnonzero(~valid):
+        valid[i] = _is_valid_date(uniques[i])
+    
+    return valid
+
+def _invalid_date_count(uniques: np.ndarray, frequency: np.ndarray) -> int:
+    return int(frequency[~_valid_date_mask(uniques)].sum())
+
+def _count_value_types(series: pd.Series) -> Tuple[int, int]:
+    # Each distinct string is classified once and weighted by its frequency.
+    uniques, frequency, numeric_count, string_count = _string_uniques(series)
+    numeric_strings = _numeric_string_count(uniques, frequency)
+    return numeric_count + numeric_strings, string_count + int(frequency.sum()) - numeric_strings
+
+def _count_invalid_dates(series: pd.Series) -> int:
+    uniques, frequency, _, _ = _string_uniques(series)
+    return _invalid_date_count(uniques, frequency)
+
+def report_type_errors(df: pd.DataFrame, timings: Optional[Dict[Any, float]] = None) -> list:
+    """Report mixed-type columns and invalid dates.
+    
+    If ``timings`` is given it is filled with the seconds spent per column.
+    """
     errors = []
     
     for col in df.columns:
+        start = time.perf_counter()
         series = df[col].dropna()
         if len(series) == 0:
+            if timings is not None:
+                timings[col] = time.perf_counter() - start
             continue
-            
-        numeric_count = 0
-        string_count = 0
         
-        for value in series:
-            if isinstance(value, (int, float, np.number)):
-                numeric_count += 1
-            elif isinstance(value, str):
-                try:
-                    float(value)
-                    numeric_count += 1
-                except ValueError:
-                    if re.match(r'^-?\d*\.?\d+[eE][+-]?\d+$', str(value)):
-                        numeric_count += 1
-                    else:
-                        string_count += 1
-            else:
-                string_count += 1
+        numeric_count, string_count = _count_value_types(series)
         
         if numeric_count > 0 and string_count > 0:
             errors.append((col, f"Mixed types: {numeric_count} numeric, {string_count} non-numeric"))
         
-        if 'date' in str(col).lower() or 'time' in str(col).lower():
-            invalid_dates = 0
-            for value in series:
-                if isinstance(value, str):
-                    try:
-                        datetime.fromisoformat(value.replace('Z', '+00:00'))
-                    except ValueError:
-                        try:
-                            datetime.strptime(value, '%Y-%m-%d')
-                        except ValueError:
-                            try:
-                                datetime.strptime(value, '%m/%d/%Y')
-                            except ValueError:
-                                invalid_dates += 1
-            
+        if _is_date_column(col):
+            invalid_dates = _count_invalid_dates(series)
             if invalid_dates > 0:
                 errors.append((f"{col}_date_format", f"{invalid_dates} invalid date formats"))
+        
+        if timings is not None:
+            timings[col] = time.perf_counter() - start
     
     return errors
 
 def report_format_errors(data: dict, schema: Optional[Dict[str, Any]] = None) -> list:
-    errors = []
-    
-    default_schema = {
-        'required_fields': ['id'],
-        'field_types': {
-            'id': (int, str),
-            'age': (int, float),
-            'expression_level': (int, float),
-            'gene_name': str,
-            'sample_id': (int, str)
-        },
-        'field_ranges': {
-            'age': (0, 120),
-            'expression_level': (0, float('inf'))
-        }
-    }
-    
-    schema = schema or default_schema
-    
-    if 'required_fields' in schema:
-        for field in schema['required_fields']:
-            if field not in data:
-                errors.append(f"Missing required field: {field}")
-    
-    if 'field_types' in schema:
-        for field, expected_types in schema['field_types'].items():
-            if field in data:
-                value = data[field]
-                if not isinstance(expected_types, tuple):
-                    expected_types = (expected_types,)
-                
-                if not isinstance(value, expected_types):
-                    errors.append(f"Field '{field}' has incorrect type: expected {expected_types}, got {type(value)}")
-    
-    if 'field_ranges' in schema:
-        for field, (min_val, max_val) in schema['field_ranges'].items():
-            if field in data:
-                value = data[field]
-                if isinstance(value, (int, float)):
-                    if value < min_val or value > max_val:
-                        errors.append(f"Field '{field}' value {value} outside valid range [{min_val}, {max_val}]")
-    
-    if isinstance(data, dict):
-        for key, value in data.items():
-            if isinstance(value, list):
-                if len(value) > 1:
-                    first_item_type = type(value[0])
-                    if isinstance(value[0], dict):
-                        first_keys = set(value[0].keys())
-                        for i, item in enumerate(value[1:], 1):
-                            if not isinstance(item, dict):
-                                errors.append(f"Inconsistent list item type in '{key}' at index {i}")
-                            elif set(item.keys()) != first_keys:
-                                errors.append(f"Inconsistent object structure in '{key}' at index {i}")
-                    else:
-                        for i, item in enumerate(value[1:], 1):
-                            if type(item) != first_item_type:
-                                errors.append(f"Inconsistent list item type in '{key}' at index {i}")
-    
-    return errors
+    return compile_schema(schema).validate(data)
@@ -1,59 +1,276 @@
-import pandas as pd
+import io
 import json
-from .utils import report_missing, report_outliers, report_format_errors, report_type_errors
+from .scanner import read_csv_with_hints, scan_frame
+from .streaming import DEFAULT_CHUNKSIZE, validate_csv_stream
+from .parallel import validate_csv_parallel
+from .incremental import validate_csv_incremental
+from .columnar import PARQUET_SUFFIXES, is_columnar_path, validate_columnar
+from .json_stream import ndjson_format_errors, stream_format_errors
+from .sampling import DEFAULT_TOLERANCE, validate_csv_sampled
+from .budget import BUDGET_CHUNKSIZE, ViolationBudget
+from .rowindex import index_csv, quarantine_csv, row_id_report
+from .profiling import NULL_PROFILER, Profiler
+from .schema import compile_schema
+from .sources import TextSource, csv_input, detect_source, inner_suffix, open_binary
+from .uniqueness import DEFAULT_MEMORY_LIMIT, check_unique_keys, key_frames
 from typing import Optional
 
-def validate_file(path: str, schema: Optional[dict] = None) -> dict:
+def _csv_report(missing: list, outliers: list, type_errors: list, file_type: str = "CSV") -> dict:
+    total_issues = len(missing) + len(outliers) + len(type_errors)
+    
+    return {
+        "missing": missing,
+        "outliers": outliers,
+        "type_errors": type_errors,
+        "total_issues": total_issues,
+        "summary": f"{len(missing)} missing, {len(outliers)} outlier(s), {len(type_errors)} type error(s)",
+        "status": "PASS" if total_issues == 0 else "FAIL",
+        "file_type": file_type
+    }
+
+def _sampled_report(report: dict, sampling: dict) -> dict:
+    report["sampling"] = sampling
+    estimated = sum(1 for estimate in sampling["estimates"] if estimate["sample_violations"])
+    if estimated:
+        report["summary"] += f" ({estimated} estimated from a {sampling['rows_sampled']}-row sample)"
+    return report
+
+def _budgeted_report(report: dict, budget: ViolationBudget) -> dict:
+    report["truncated"] = budget.truncated
+    if budget.truncated:
+        report["summary"] += " (stopped early: violation budget used up)"
+    return report
+
+def _unique_report(report: dict, source: TextSource, keys: list, chunksize: Optional[int],
+                   memory_limit: int, profiler) -> dict:
+    columns = sorted({col for key in keys for col in key})
+    with profiler.stage("unique_keys"):
+        results = check_unique_keys(((0, frame) for frame in key_frames(source, columns, chunksize)),
+                                    keys, memory_limit)
+    duplicates = [(label, result["duplicate_rows"]) for label, result in results.items()
+                  if result.get("duplicate_rows")]
+    report["duplicates"] = duplicates
+    report["unique_keys"] = results
+    if duplicates:
+        report["total_issues"] += len(duplicates)
+        report["status"] = "FAIL"
+    report["summary"] += f", {len(duplicates)} duplicated key(s)"
+    return report
+
+def _row_report(source: TextSource, chunksize: Optional[int], profiler, row_ids: Optional[int],
+                quarantine_out: Optional[str], clean_out: Optional[str]) -> dict:
+    with profiler.stage("row_index"), csv_input(source) as (data, read_kwargs):
+        index = index_csv(data, chunksize, **read_kwargs)
+    report = _csv_report(*index.finalize(), file_type=source.file_type)
+    if row_ids:
+        report["row_ids"] = row_id_report(index.row_sets(), row_ids)
+    if quarantine_out or clean_out:
+        with profiler.stage("split", rows=index.rows):
+            rejected, clean = quarantine_csv(source.path, index.rejected(), quarantine_out, clean_out,
+                                             source.compression)
+        report["quarantine"] = {
+            "rejected_rows": rejected,
+            "clean_rows": clean,
+            "quarantine_out": quarantine_out,
+            "clean_out": clean_out,
+        }
+    return report
+
+def validate_file(path: str, schema: Optional[dict] = None, chunksize: Optional[int] = None,
+                  workers: Optional[int] = None, incremental: bool = False,
+                  state_dir: Optional[str] = None, profiler: Optional[Profiler] = None,
+                  sample_rows: Optional[int] = None, sample_method: str = "block",
+                  escalate: bool = True, sample_tolerance: float = DEFAULT_TOLERANCE, fail_fast: bool = False,
+                  max_violations: Optional[int] = None, max_violations_per_check: Optional[int] = None,
+                  row_ids: Optional[int] = None, quarantine_out: Optional[str] = None,
+                  clean_out: Optional[str] = None, unique_memory: int = DEFAULT_MEMORY_LIMIT) -> dict:
     """
     Validate a data file for missing values, data type errors, outliers, and format consistency.
     
+    Delimited text (``.csv``, ``.tsv``, ``.psv``, sniffed ``.txt``) and JSON/NDJSON
+    may be gzip, bz2, xz or zstd compressed (see ``data_validator.sources``).
+    Compressed files are streamed through a background decompression thread;
+    they cannot be split into byte ranges, so ``workers`` and ``incremental``
+    stream them in chunks instead and block sampling becomes reservoir sampling.
+    
     Args:
         path: Path to the file to validate
         schema: Optional schema for JSON validation or custom validation rules
+        chunksize: If set, stream CSV files in chunks of this many rows instead of
+            loading them whole. Peak memory stays flat; all counts are exact except
+            statistical outliers on columns larger than the quantile sketch capacity
+            (see ``data_validator.sketch`` for the error bound).
+        workers: If greater than 1, split CSV files into record-aligned byte ranges
+            and validate them in this many processes, merging the partial results
+        incremental: If True, resume CSV validation from the state saved by the
+            previous incremental run and parse only the bytes appended since then
+        state_dir: Directory for incremental state (defaults to the cache directory)
+        profiler: If given, stage and per-column timings are recorded on it and
+            added to the report under ``metrics``
+        sample_rows: If set, validate CSV files from a sample of about this many
+            rows first (see ``data_validator.sampling``). Counts for columns the
+            sample settles are estimates, listed under ``sampling``; other
+            columns are escalated to exact validation
+        sample_method: ``"block"`` or ``"reservoir"``
+        escalate: If False, report sample estimates only, without exact escalation
+        sample_tolerance: Accept a column without escalation when no violation was
+            sampled and the upper confidence bounds of its rates are at most this
+            (0 escalates every such column)
+        fail_fast: Stop reading CSV and NDJSON files at the first violation
+        max_violations: Stop once this many violations are found in total
+        max_violations_per_check: Stop once one check (a column's missing values,
+            domain range, types or dates, or one kind of format error) reaches
+            this many violations. A budgeted CSV file is streamed in chunks
+            (``chunksize`` or 10,000 rows); when reading stops before the end of
+            the file the report has ``truncated: True`` and its counts cover only
+            the rows read
+        row_ids: If set, list up to this many flagged row ids (0-based data rows)
+            per check in the report under ``row_ids``
+        quarantine_out: Write the CSV rows flagged by any check to this file
+        clean_out: Write the other CSV rows to this file. Row tracking reads the
+            file whole (or in ``chunksize`` chunks) and takes precedence over
+            sampling, budgets, ``workers`` and ``incremental``
+        unique_memory: Bytes of key values held in memory by the ``unique_keys``
+            check before it spills hash partitions to disk. The check reads every
+            row of the key columns, whatever the other options; it is skipped
+            when a violation budget stops reading early
         
     Returns:
         Dictionary containing validation results and summary
     """
-    if path.lower().endswith(".csv"):
+    sample = None
+    if sample_rows:
+        sample = {"sample_rows": sample_rows, "method": sample_method, "escalate": escalate,
+                  "tolerance": sample_tolerance}
+    budget = None
+    if fail_fast:
+        budget = ViolationBudget.fail_fast()
+    elif max_violations or max_violations_per_check:
+        budget = ViolationBudget(max_violations, max_violations_per_check)
+    rows = None
+    if row_ids or quarantine_out or clean_out:
+        rows = {"row_ids": row_ids, "quarantine_out": quarantine_out, "clean_out": clean_out}
+    if profiler is None:
+        return _validate_file(path, schema, chunksize, workers, incremental, state_dir, NULL_PROFILER,
+                              sample, budget, rows, unique_memory)
+    
+    with profiler.stage("validate_file"):
+        report = _validate_file(path, schema, chunksize, workers, incremental, state_dir, profiler,
+                                sample, budget, rows, unique_memory)
+    report["metrics"] = profiler.to_dict()
+    return report
+
+def _open_text(source: TextSource):
+    if source.compression is None:
+        return open(source.path, 'r')
+    return io.TextIOWrapper(open_binary(source.path, source.compression))
+
+def _delimited_report(source: TextSource, schema: Optional[dict], chunksize: Optional[int],
+                      workers: Optional[int], incremental: bool, state_dir: Optional[str], profiler,
+                      sample: Optional[dict], budget: Optional[ViolationBudget], rows: Optional[dict]) -> dict:
+    path, sep, file_type = source.path, source.sep, source.file_type
+    if rows:
+        return _row_report(source, chunksize, profiler, **rows)
+    
+    # Compressed files cannot be split or resumed at byte offsets, so they
+    # are streamed from the start instead.
+    seekable = source.compression is None
+    if incremental and seekable:
+        with profiler.stage("incremental"):
+            return _csv_report(*validate_csv_incremental(path, state_dir, chunksize=chunksize or DEFAULT_CHUNKSIZE,
+                                                         sep=sep), file_type=file_type)
+    
+    if sample:
+        with profiler.stage("sampled"):
+            *lists, sampling = validate_csv_sampled(path, chunksize=chunksize, sep=sep,
+                                                    compression=source.compression, **sample)
+        return _sampled_report(_csv_report(*lists, file_type=file_type), sampling)
+    
+    if workers and workers > 1 and seekable and budget is None:
+        with profiler.stage("parallel"):
+            return _csv_report(*validate_csv_parallel(path, workers, chunksize=chunksize or DEFAULT_CHUNKSIZE,
+                                                      sep=sep), file_type=file_type)
+    if (workers and workers > 1) or incremental:
+        chunksize = chunksize or DEFAULT_CHUNKSIZE
+    
+    with csv_input(source) as (data, read_kwargs):
+        if budget is not None:
+            lists = validate_csv_stream(data, chunksize or BUDGET_CHUNKSIZE, profiler=profiler, budget=budget,
+                                        **read_kwargs)
+            return _budgeted_report(_csv_report(*lists, file_type=file_type), budget)
+        
+        if chunksize:
+            return _csv_report(*validate_csv_stream(data, chunksize, profiler=profiler, **read_kwargs),
+                               file_type=file_type)
+        
+        with profiler.stage("read_csv") as stage:
+            df = read_csv_with_hints(data, schema, reopen=lambda: open_binary(source.path, source.compression),
+                                      **read_kwargs)
+            stage.rows = len(df)
+    return _csv_report(*scan_frame(df, profiler=profiler), file_type=file_type)
+
+def _validate_file(path: str, schema: Optional[dict], chunksize: Optional[int], workers: Optional[int],
+                   incremental: bool, state_dir: Optional[str], profiler,
+                   sample: Optional[dict] = None, budget: Optional[ViolationBudget] = None,
+                   rows: Optional[dict] = None, unique_memory: int = DEFAULT_MEMORY_LIMIT) -> dict:
+    try:
+        source = detect_source(path)
+    except Exception as e:
+        return {
+            "error": f"Failed to read file: {str(e)}",
+            "summary": "File read error",
+            "status": "ERROR",
+            "file_type": "UNKNOWN"
+        }
+    
+    if source is not None and source.is_delimited:
+        file_type = source.file_type
         try:
-            df = pd.read_csv(path)
-            missing = report_missing(df)
-            outliers = report_outliers(df)
-            type_errors = report_type_errors(df)
-            
-            total_issues = len(missing) + len(outliers) + len(type_errors)
-            
+            report = _delimited_report(source, schema, chunksize, workers, incremental, state_dir, profiler,
+                                       sample, budget, rows)
+            keys = compile_schema(schema).unique_keys if schema else []
+            if keys and not report.get("truncated"):
+                report = _unique_report(report, source, keys, chunksize, unique_memory, profiler)
+            return report
+        except Exception as e:
             return {
-                "missing": missing,
-                "outliers": outliers,
-                "type_errors": type_errors,
-                "total_issues": total_issues,
-                "summary": f"{len(missing)} missing, {len(outliers)} outlier(s), {len(type_errors)} type error(s)",
-                "status": "PASS" if total_issues == 0 else "FAIL",
-                "file_type": "CSV"
+                "error": f"Failed to read {file_type} file: {str(e)}",
+                "summary": "File read error",
+                "status": "ERROR",
+                "file_type": file_type
             }
+            
+    elif is_columnar_path(path):
+        file_type = "PARQUET" if path.lower().endswith(PARQUET_SUFFIXES) else "ARROW"
+        try:
+            with profiler.stage("columnar"):
+                return _csv_report(*validate_columnar(path), file_type=file_type)
         except Exception as e:
             return {
-                "error": f"Failed to read CSV file: {str(e)}",
+                "error": f"Failed to read {file_type.title()} file: {str(e)}",
                 "summary": "File read error",
                 "status": "ERROR",
-                "file_type": "CSV"
+                "file_type": file_type
             }
             
-    elif path.lower().endswith(".json"):
+    elif source is not None:
         try:
-            with open(path, 'r') as f:
-                data = json.load(f)
+            with _open_text(source) as f:
+                if inner_suffix(path)[0] == ".json":
+                    with profiler.stage("json_stream"):
+                        fmt_errors = stream_format_errors(f, schema)
+                else:
+                    with profiler.stage("ndjson"):
+                        fmt_errors = ndjson_format_errors(f, schema, profiler=profiler, budget=budget)
             
-            fmt_errors = report_format_errors(data, schema)
-            
-            return {
+            report = {
                 "format_errors": fmt_errors,
                 "total_issues": len(fmt_errors),
                 "summary": f"{len(fmt_errors)} format error(s)",
                 "status": "PASS" if len(fmt_errors) == 0 else "FAIL",
                 "file_type": "JSON"
             }
+            return report if budget is None else _budgeted_report(report, budget)
         except json.JSONDecodeError as e:
             return {
                 "error": f"Invalid JSON format: {str(e)}",
@@ -71,7 +288,7 @@ def validate_file(path: str, schema: Optional[dict] = None) -> dict:
     else:
         return {
             "error": "Unsupported file type",
-            "summary": "Unsupported file type - only CSV and JSON are supported",
+            "summary": "Unsupported file type - only CSV/TSV (optionally compressed), JSON, NDJSON, Parquet and Arrow are supported",
             "status": "ERROR",
             "file_type": "UNKNOWN"
         }
@@ -0,0 +1,346 @@
+"""
+Watch mode: validate files as they land in a directory.
+
+``DirectoryPoller`` lists the directory every ``interval`` seconds (plain
+``os.scandir``, so no inotify or other service is needed) and reports a file
+once it is finished: its size and modification time have not changed for
+``settle`` seconds. Hidden files, common partial-upload names (``*.part``,
+``*.tmp``, ``*.crdownload``) and unsupported file types are ignored, so
+writers that rename on completion are picked up at once.
+
+``Watcher`` puts finished files on a bounded queue that a pool of worker
+processes drains. When the queue is full it stops taking files from the
+poller, which leaves them in the directory to be found again on a later
+poll: backpressure costs a rescan, never memory. Each result is written to
+``<reports_dir>/<file name>.json``, and the file is optionally moved into a
+pass or fail directory. When files are moved, a later file with the same
+name gets a numbered name (``batch.1.csv``) for both the moved file and its
+report, so nothing earlier is overwritten; the report records both paths. ``WatchStats`` counts files and bytes for throughput
+(over the run and since the last snapshot) and tracks queue depth; the CLI
+prints it and writes it to ``stats.json``.
+
+A file is validated again only if it changes. Without moves, a restarted
+watcher skips files whose report is newer than the file.
+"""
+
+import json
+import os
+import shutil
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from .cache import _atomic_write
+from .cli import _error_report, _validate_path
+from .columnar import is_columnar_path
+from .sources import DELIMITER_SUFFIXES, JSON_SUFFIXES, inner_suffix
+
+DEFAULT_SETTLE = 2.0
+DEFAULT_INTERVAL = 1.0
+DEFAULT_QUEUE_SIZE = 64
+_PARTIAL_SUFFIXES = (".part", ".partial", ".tmp", ".crdownload", ".filepart")
+
+Signature = Tuple[int, int]
+
+
+def is_supported(path: str) -> bool:
+    """Return True if ``path`` looks like a file ``validate_file`` can read."""
+    suffix, compression = inner_suffix(path)
+    return (suffix in DELIMITER_SUFFIXES or suffix in JSON_SUFFIXES or suffix == ".txt"
+            or (compression is not None and not suffix) or is_columnar_path(path))
+
+
+def _signature(st: os.stat_result) -> Signature:
+    return st.st_size, st.st_mtime_ns
+
+
+def _free_name(name: str, places: List[Tuple[str, str]]) -> str:
+    """Return ``name``, or ``<stem>.<n>.<suffixes>`` with the smallest free ``n``.
+
+    A name is free if no ``directory/<name><extension>`` exists for any
+    ``(directory, extension)`` in ``places``.
+    """
+    stem, dot, suffixes = name.partition(".")
+    candidate, n = name, 0
+    while any(os.path.exists(os.path.join(directory, candidate + extension)) for directory, extension in places):
+        n += 1
+        candidate = f"{stem}.{n}{dot}{suffixes}"
+    return candidate
+
+
+class DirectoryPoller:
+    """Find files in ``directory`` whose size and mtime have been stable for ``settle`` seconds."""
+
+    def __init__(self, directory: str, settle: float = DEFAULT_SETTLE, reports_dir: Optional[str] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        self.directory = directory
+        self.settle = settle
+        self.reports_dir = reports_dir
+        self._clock = clock
+        # path -> (signature, time it was first seen with that signature)
+        self._pending: Dict[str, Tuple[Signature, float]] = {}
+        # path -> signature it was handed out with
+        self._done: Dict[str, Signature] = {}
+
+    @staticmethod
+    def ignored(name: str) -> bool:
+        """Return True for hidden, partial-upload and unsupported file names."""
+        return (name.startswith(".") or name.endswith("~") or name.lower().endswith(_PARTIAL_SUFFIXES)
+                or not is_supported(name))
+
+    def _has_current_report(self, name: str, st: os.stat_result) -> bool:
+        if self.reports_dir is None:
+            return False
+        try:
+            return os.stat(os.path.join(self.reports_dir, name + ".json")).st_mtime_ns >= st.st_mtime_ns
+        except OSError:
+            return False
+
+    def poll(self) -> List[str]:
+        """Return the files that are newly finished, oldest first."""
+        now = self._clock()
+        seen = set()
+        ready = []
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if self.ignored(entry.name):
+                    continue
+                try:
+                    if not entry.is_file():
+                        continue
+                    st = entry.stat()
+                except OSError:
+                    continue  # removed while listing
+                path = entry.path
+                seen.add(path)
+                signature = _signature(st)
+                if self._done.get(path) == signature:
+                    continue
+                previous = self._pending.get(path)
+                if previous is None or previous[0] != signature:
+                    self._pending[path] = (signature, now)
+                    if previous is None and path not in self._done and self._has_current_report(entry.name, st):
+                        self._done[path] = signature
+                        del self._pending[path]
+                    continue
+                if now - previous[1] >= self.settle:
+                    ready.append((previous[1], path))
+        for path in list(self._pending):
+            if path not in seen:
+                del self._pending[path]
+        for path in list(self._done):
+            if path not in seen:
+                del self._done[path]
+        return [path for _, path in sorted(ready)]
+
+    def claim(self, path: str) -> None:
+        """Mark ``path`` as taken, so it is not returned again until it changes."""
+        signature, _ = self._pending.pop(path)
+        self._done[path] = signature
+
+    def pending(self) -> int:
+        return len(self._pending)
+
+
+class WatchStats:
+    """Counters for a watch run, with throughput over the run and since the last snapshot."""
+
+    def __init__(self, queue_size: int):
+        self.started = time.time()
+        self.queue_size = queue_size
+        self.queue_depth = 0
+        self.max_queue_depth = 0
+        self.in_flight = 0
+        self.queued = 0
+        self.validated = 0
+        self.passed = 0
+        self.failed = 0
+        self.errors = 0
+        self.bytes_validated = 0
+        self.backpressure_polls = 0
+        self._checkpoint = (self.started, 0, 0)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the counters and rates; the ``recent_*`` rates restart from here."""
+        now = time.time()
+        elapsed = max(now - self.started, 1e-9)
+        since, validated, validated_bytes = self._checkpoint
+        window = max(now - since, 1e-9)
+        self._checkpoint = (now, self.validated, self.bytes_validated)
+        return {
+            "uptime_seconds": round(elapsed, 3),
+            "queued": self.queued,
+            "validated": self.validated,
+            "passed": self.passed,
+            "failed": self.failed,
+            "errors": self.errors,
+            "bytes_validated": self.bytes_validated,
+            "files_per_second": round(self.validated / elapsed, 3),
+            "bytes_per_second": round(self.bytes_validated / elapsed, 1),
+            "recent_files_per_second": round((self.validated - validated) / window, 3),
+            "recent_bytes_per_second": round((self.bytes_validated - validated_bytes) / window, 1),
+            "queue_depth": self.queue_depth,
+            "queue_size": self.queue_size,
+            "max_queue_depth": self.max_queue_depth,
+            "in_flight": self.in_flight,
+            "backpressure_polls": self.backpressure_polls,
+        }
+
+    @staticmethod
+    def summary(stats: Dict[str, Any]) -> str:
+        """Format a ``snapshot`` as one status line."""
+        return (f"{stats['validated']} validated ({stats['failed']} failed, {stats['errors']} error(s)), "
+                f"{stats['recent_files_per_second']:.2f} files/s, "
+                f"{stats['recent_bytes_per_second'] / 1e6:.2f} MB/s, "
+                f"queue {stats['queue_depth']}/{stats['queue_size']}, {stats['in_flight']} in flight")
+
+
+class Watcher:
+    """Validate finished files from a directory on a bounded queue and a worker pool."""
+
+    def __init__(self, directory: str, reports_dir: Optional[str] = None, pass_dir: Optional[str] = None,
+                 fail_dir: Optional[str] = None, settle: float = DEFAULT_SETTLE,
+                 interval: float = DEFAULT_INTERVAL, workers: Optional[int] = None,
+                 queue_size: int = DEFAULT_QUEUE_SIZE, schema: Optional[dict] = None,
+                 chunksize: Optional[int] = None, extra: Optional[dict] = None,
+                 on_report: Optional[Callable[[str, dict], None]] = None):
+        """
+        Args:
+            directory: Directory to watch (top level only)
+            reports_dir: Where per-file JSON reports go (default ``<directory>/reports``)
+            pass_dir: If set, passing files are moved here
+            fail_dir: If set, failing files (and files that could not be read) are moved here
+            settle: Seconds a file's size and mtime must stay unchanged
+            interval: Seconds between polls
+            workers: Worker processes (defaults to the CPU count)
+            queue_size: Files waiting for a worker before the poller is held back
+            schema: Optional validation schema
+            chunksize: Optional CSV chunk size
+            extra: Further ``validate_file`` options, as for ``cli._validate_path``
+            on_report: Called with ``(path, report)`` after each file
+        """
+        if queue_size < 1:
+            raise ValueError("queue_size must be a positive integer")
+        self.directory = directory
+        self.reports_dir = reports_dir or os.path.join(directory, "reports")
+        self.pass_dir = pass_dir
+        self.fail_dir = fail_dir
+        for target in (self.reports_dir, pass_dir, fail_dir):
+            if target:
+                os.makedirs(target, exist_ok=True)
+        self.interval = interval
+        self.workers = workers or os.cpu_count() or 1
+        self.schema = schema
+        self.chunksize = chunksize
+        self.extra = extra
+        self.on_report = on_report
+        self.poller = DirectoryPoller(directory, settle, None if pass_dir or fail_dir else self.reports_dir)
+        self.queue: Deque[str] = deque()
+        self.queue_size = queue_size
+        self.stats = WatchStats(queue_size)
+        self.stop = threading.Event()
+        self._in_flight: Dict[Any, Tuple[str, int]] = {}
+
+    def _enqueue(self) -> None:
+        for path in self.poller.poll():
+            if len(self.queue) >= self.queue_size:
+                self.stats.backpressure_polls += 1
+                break
+            self.poller.claim(path)
+            self.queue.append(path)
+            self.stats.queued += 1
+        self.stats.queue_depth = len(self.queue)
+        self.stats.max_queue_depth = max(self.stats.max_queue_depth, len(self.queue))
+
+    def _dispatch(self, executor) -> None:
+        while self.queue and len(self._in_flight) < self.workers:
+            path = self.queue.popleft()
+            try:
+                size = os.path.getsize(path)
+            except OSError:
+                continue  # removed after it settled
+            future = executor.submit(_validate_path, path, self.schema, self.chunksize, extra=self.extra)
+            self._in_flight[future] = (path, size)
+        self.stats.queue_depth = len(self.queue)
+        self.stats.in_flight = len(self._in_flight)
+
+    def _finish(self, future) -> None:
+        path, size = self._in_flight.pop(future)
+        try:
+            report = future.result()
+        except Exception as e:  # e.g. a worker process died
+            report = _error_report(e)
+        self.stats.validated += 1
+        self.stats.bytes_validated += size
+        status = report.get("status")
+        if status == "PASS":
+            self.stats.passed += 1
+        else:
+            self.stats.failed += 1
+            self.stats.errors += status == "ERROR"
+        self.stats.in_flight = len(self._in_flight)
+
+        name = os.path.basename(path)
+        target = self.pass_dir if status == "PASS" else self.fail_dir
+        moved_to = None
+        if target:
+            # An earlier file of the same name may already sit in the target or
+            # have a report; never overwrite either. Without moves the report
+            # describes whatever is now at ``path``, so it is replaced.
+            name = _free_name(name, [(target, ""), (self.reports_dir, ".json")])
+            moved_to = os.path.join(target, name)
+            try:
+                shutil.move(path, moved_to)
+            except OSError as e:
+                report = dict(report, move_error=str(e))
+                moved_to = None
+        report_path = os.path.join(self.reports_dir, name + ".json")
+        record = dict(report, path=path, moved_to=moved_to, report_path=report_path)
+        try:
+            _atomic_write(report_path, json.dumps(record, indent=2, default=str).encode())
+        except OSError:
+            pass
+        if self.on_report is not None:
+            self.on_report(path, record)
+
+    def step(self, executor, timeout: float) -> None:
+        """Poll once, start queued files, then collect results for up to ``timeout`` seconds."""
+        if not self.stop.is_set():
+            self._enqueue()
+            self._dispatch(executor)
+        if self._in_flight:
+            done, _ = wait(list(self._in_flight), timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                self._finish(future)
+            if not self.stop.is_set():
+                self._dispatch(executor)
+        elif timeout:
+            self.stop.wait(timeout)
+
+    def idle(self) -> bool:
+        return not self.queue and not self._in_flight and not self.poller.pending()
+
+    def run(self, until_idle: bool = False, on_tick: Optional[Callable[["Watcher"], None]] = None,
+            tick_seconds: float = 10.0) -> WatchStats:
+        """
+        Watch until ``stop`` is set (or, with ``until_idle``, until nothing is left to do).
+
+        Files already running when ``stop`` is set are finished; queued files
+        are left in the directory for the next run.
+        """
+        last_tick = time.monotonic()
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            while not self.stop.is_set() or self._in_flight:
+                self.step(executor, self.interval)
+                if on_tick is not None and time.monotonic() - last_tick >= tick_seconds:
+                    on_tick(self)
+                    last_tick = time.monotonic()
+                if until_idle and self.idle():
+                    break
+        self.queue.clear()
+        self.stats.queue_depth = 0
+        if on_tick is not None:
+            on_tick(self)
+        return self.stats
@@ -0,0 +1,54 @@
+import pytest
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'benchmarks'))
+
+from generate import generate_csv, generate_json
+from run import compare
+from data_validator.validators import validate_file
+
+class TestBenchmarkSuite:
+
+    @pytest.mark.parametrize("chunk_rows", [700, 2500, 1_000_000])
+    def test_generator_is_deterministic(self, tmp_path, chunk_rows):
+        """Test the same seed and chunk size write the same bytes, and another seed does not"""
+        a = generate_csv(str(tmp_path / "a.csv"), 2500, seed=7, chunk_rows=chunk_rows, missing_rate=0.05)
+        b = generate_csv(str(tmp_path / "b.csv"), 2500, seed=7, chunk_rows=chunk_rows, missing_rate=0.05)
+        c = generate_csv(str(tmp_path / "c.csv"), 2500, seed=8, chunk_rows=chunk_rows, missing_rate=0.05)
+        with open(a) as fa, open(b) as fb, open(c) as fc:
+            assert fa.read() == fb.read() != fc.read()
+
+    @pytest.mark.parametrize("table", ["health", "genomics"])
+    def test_injected_errors_are_detected(self, tmp_path, table):
+        """Test each injection rate shows up in the validator report"""
+        clean = validate_file(generate_csv(str(tmp_path / "clean.csv"), 2000, table))
+        assert clean["status"] == "PASS"
+
+        report = validate_file(generate_csv(
+            str(tmp_path / "dirty.csv"), 2000, table, chunk_rows=700,
+            missing_rate=0.01, mixed_rate=0.01, bad_date_rate=0.05,
+        ))
+        assert report["missing"] and report["type_errors"]
+        assert any(name.endswith("_date_format") for name, _ in report["type_errors"])
+
+        # Mixed tokens make a column non-numeric, so outliers are checked alone.
+        report = validate_file(generate_csv(str(tmp_path / "outliers.csv"), 2000, table, outlier_rate=0.01))
+        assert any(name == "age_domain_range" for name, _ in report["outliers"])
+
+    @pytest.mark.parametrize("ndjson", [False, True])
+    def test_json_records(self, tmp_path, ndjson):
+        """Test generated JSON and NDJSON parse and carry the injected missing ids"""
+        path = generate_json(str(tmp_path / ("r.jsonl" if ndjson else "r.json")), 300, ndjson=ndjson, missing_rate=0.1)
+        report = validate_file(path)
+        assert report["status"] == "FAIL"
+        assert any("Missing required field: id" in error for error in report["format_errors"])
+
+    def test_compare_flags_regressions(self):
+        """Test speed and memory regressions beyond the thresholds are reported"""
+        baseline = {"results": [{"case": "cli", "rows": 10, "rows_per_sec": 100.0, "peak_rss_mib": 50.0}]}
+        current = {"results": [{"case": "cli", "rows": 10, "rows_per_sec": 70.0, "peak_rss_mib": 70.0}]}
+        assert len(compare(current, baseline, 0.25, 0.25)) == 2
+        assert compare(current, baseline, 0.5, 0.5) == []
@@ -0,0 +1,93 @@
+import pytest
+import json
+import os
+import sys
+
+import pandas as pd
+from click.testing import CliRunner
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from data_validator.budget import ViolationBudget
+from data_validator.cli import cli
+from data_validator.streaming import accumulate_csv
+from data_validator.validators import validate_file
+
+def _write_csv(path, rows, bad_rows=()):
+    age = [30 + i % 40 for i in range(rows)]
+    for i in bad_rows:
+        age[i] = 500
+    pd.DataFrame({"id": range(rows), "age": age}).to_csv(path, index=False)
+    return str(path)
+
+class TestViolationBudget:
+
+    def test_exhausted(self):
+        """Test the overall and per-check limits"""
+        assert ViolationBudget.fail_fast().exhausted({"age": 1})
+        assert not ViolationBudget(max_violations=5).exhausted({"age": 2, "bmi": 2})
+        assert ViolationBudget(max_violations=5).exhausted({"age": 3, "bmi": 2})
+        assert not ViolationBudget(max_per_check=3).exhausted({"age": 2, "bmi": 2})
+        assert ViolationBudget(max_per_check=3).exhausted_by_messages(["Line 1: Missing x", "Line 2: Missing x",
+                                                                      "Line 9: Missing x"])
+        with pytest.raises(ValueError):
+            ViolationBudget(max_violations=0)
+
+    def test_stream_stops_after_exhausting_chunk(self, tmp_path):
+        """Test reading stops at the chunk holding the first violation"""
+        path = _write_csv(tmp_path / "data.csv", 10_000, bad_rows=[150])
+        budget = ViolationBudget.fail_fast()
+        acc = accumulate_csv(path, chunksize=100, budget=budget)
+        assert acc.rows == 200
+        assert budget.truncated
+
+    def test_last_full_chunk_is_not_truncated(self, tmp_path):
+        """Test a budget used up by a full final chunk leaves the file whole"""
+        path = _write_csv(tmp_path / "data.csv", 300, bad_rows=[250])
+        budget = ViolationBudget.fail_fast()
+        acc = accumulate_csv(path, chunksize=100, budget=budget)
+        assert acc.rows == 300
+        assert not budget.truncated
+
+        path = tmp_path / "data.jsonl"
+        path.write_text("".join(json.dumps({"id": i} if i != 3 else {}) + "\n" for i in range(1024)) + "\n")
+        report = validate_file(str(path), schema={"required_fields": ["id"]}, fail_fast=True)
+        assert report["truncated"] is False
+
+    def test_validate_file_truncates(self, tmp_path):
+        """Test a budgeted report is marked truncated and still fails"""
+        path = _write_csv(tmp_path / "data.csv", 50_000, bad_rows=range(0, 50_000, 10))
+        report = validate_file(path, max_violations_per_check=100, chunksize=1000)
+        assert report["truncated"] is True
+        assert report["status"] == "FAIL"
+        assert report["outliers"] == [("age_domain_range", 100)]
+        assert "stopped early" in report["summary"]
+
+    def test_clean_file_is_not_truncated(self, tmp_path):
+        """Test a file within budget is read to the end"""
+        path = _write_csv(tmp_path / "data.csv", 5_000)
+        report = validate_file(path, fail_fast=True, chunksize=1000)
+        assert report["truncated"] is False
+        assert report["status"] == "PASS"
+
+    def test_ndjson_fail_fast(self, tmp_path):
+        """Test NDJSON reading stops after the batch with the first error"""
+        path = tmp_path / "data.jsonl"
+        path.write_text("".join(json.dumps({"id": i} if i != 3 else {}) + "\n" for i in range(5000)))
+        report = validate_file(str(path), schema={"required_fields": ["id"]}, fail_fast=True)
+        assert report["truncated"] is True
+        assert report["format_errors"] == ["Line 4: Missing required field: id"]
+
+    def test_cli_stop_on_failure(self, tmp_path):
+        """Test files after the first failure are skipped"""
+        bad = _write_csv(tmp_path / "bad.csv", 100, bad_rows=[1])
+        good = _write_csv(tmp_path / "good.csv", 100)
+        out = str(tmp_path / "report.json")
+        result = CliRunner().invoke(cli, ["validate", bad, good, "--fail-fast", "--stop-on-failure", "--no-daemon",
+                                          "--no-cache", "--jobs", "1", "-j", out])
+        assert result.exit_code == 0
+        assert "1 file(s) skipped" in result.output
+        with open(out) as f:
+            report = json.load(f)
+        assert report[good]["status"] == "SKIPPED"
+        assert report[bad]["status"] == "FAIL"
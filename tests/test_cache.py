@@ -0,0 +1,127 @@
+import pytest
+import json
+import os
+import shutil
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from click.testing import CliRunner
+
+from data_validator.cache import ResultCache
+from data_validator.cli import cli
+from data_validator.validators import validate_file
+
+class TestResultCache:
+
+    def test_hit_returns_stored_report(self, tmp_path):
+        """Test an unchanged file is served from the cache"""
+        path = shutil.copy("sample_data/invalid_example.csv", str(tmp_path / "data.csv"))
+        cache = ResultCache(str(tmp_path / "cache"))
+        assert cache.get(path) is None
+        report = validate_file(path)
+        cache.put(path, None, report)
+        assert cache.get(path) == json.loads(json.dumps(report))
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_key_covers_content_schema_and_options(self, tmp_path):
+        """Test changed bytes, schemas or options miss the cache"""
+        path = tmp_path / "data.json"
+        path.write_text('{"id": 1}')
+        cache = ResultCache(str(tmp_path / "cache"))
+        cache.put(str(path), None, validate_file(str(path)))
+
+        assert cache.get(str(path), {"required_fields": ["name"]}) is None
+        assert cache.get(str(path), chunksize=10) is None
+        path.write_text('{"id": "abcdef"}')
+        assert cache.get(str(path)) is None
+        assert cache.hits == 0
+
+    def test_index_survives_reopen(self, tmp_path):
+        """Test a new cache instance reuses the saved mtime/size index"""
+        path = shutil.copy("sample_data/valid_example.csv", str(tmp_path / "data.csv"))
+        cache = ResultCache(str(tmp_path / "cache"))
+        cache.put(path, None, validate_file(path))
+        cache.save()
+
+        reopened = ResultCache(str(tmp_path / "cache"))
+        assert os.path.realpath(path) in reopened._index
+        assert reopened.get(path) == json.loads(json.dumps(validate_file(path)))
+
+    def test_error_reports_not_cached(self, tmp_path):
+        """Test ERROR reports are always recomputed"""
+        path = tmp_path / "broken.json"
+        path.write_text("{not json")
+        cache = ResultCache(str(tmp_path / "cache"))
+        cache.put(str(path), None, validate_file(str(path)))
+        assert cache.get(str(path)) is None
+
+    def test_lru_eviction(self, tmp_path):
+        """Test the entries directory stays under max_bytes, oldest first"""
+        cache = ResultCache(str(tmp_path / "cache"), max_bytes=1)
+        paths = []
+        for i in range(3):
+            path = tmp_path / f"data{i}.json"
+            path.write_text(json.dumps({"id": i}))
+            paths.append(str(path))
+            cache.put(str(path), None, validate_file(str(path)))
+        assert cache.evictions == 3
+        assert not os.listdir(tmp_path / "cache" / "entries")
+
+    def test_put_tracks_size_without_rescanning(self, tmp_path, monkeypatch):
+        """Test puts keep a running size and evict the least recently used entry"""
+        paths = []
+        for i in range(3):
+            paths.append(str(tmp_path / f"data{i}.json"))
+            with open(paths[-1], "w") as f:
+                json.dump({"id": i}, f)
+        reports = [validate_file(path) for path in paths]
+        cache = ResultCache(str(tmp_path / "cache"))
+        cache.put(paths[0], None, reports[0])
+        cache.max_bytes = 2 * cache._bytes
+        monkeypatch.setattr(os, "scandir", None)
+        cache.put(paths[1], None, reports[1])
+        assert cache.get(paths[0]) is not None
+        cache.put(paths[2], None, reports[2])
+        assert cache.evictions == 1
+        assert cache.get(paths[1]) is None and cache.get(paths[0]) is not None
+        cache.save()
+        monkeypatch.undo()
+        reopened = ResultCache(str(tmp_path / "cache"))
+        assert list(reopened._lru) == list(cache._lru) and reopened._bytes == cache._bytes
+
+    def test_old_pickle_entries_are_dropped(self, tmp_path):
+        """Test entries from the pickle format are deleted and never loaded"""
+        entries = tmp_path / "cache" / "entries"
+        entries.mkdir(parents=True)
+        (entries / "stale.pkl").write_bytes(b"not a report")
+        (tmp_path / "cache" / "index.json").write_text("{}")
+        cache = ResultCache(str(tmp_path / "cache"))
+        assert not os.listdir(entries) and cache._bytes == 0
+
+    def test_cli_reports_hits_and_misses(self, tmp_path):
+        """Test the second CLI run is served from the cache and says so"""
+        files = ["sample_data/invalid_example.csv", "sample_data/valid_example.csv"]
+        args = ["validate", *files, "--jobs", "1", "--no-daemon", "--cache-dir", str(tmp_path / "cache")]
+        outputs = []
+        for run in range(2):
+            out = tmp_path / f"report_{run}.json"
+            result = CliRunner().invoke(cli, [*args, "-j", str(out)])
+            assert result.exit_code == 0
+            outputs.append((result.output, json.loads(out.read_text())))
+        assert "Cache: 0 hit(s), 2 miss(es)" in outputs[0][0]
+        assert "Cache: 2 hit(s), 0 miss(es)" in outputs[1][0]
+        assert outputs[0][1] == outputs[1][1]
+
+        result = CliRunner().invoke(cli, [*args, "--no-cache"])
+        assert "Cache:" not in result.output
+
+    def test_incremental_bypasses_cache(self, tmp_path):
+        """Test --incremental neither reads nor writes cached reports"""
+        path = shutil.copy("sample_data/valid_example.csv", str(tmp_path / "data.csv"))
+        args = ["validate", path, "--incremental", "--no-daemon", "--cache-dir", str(tmp_path / "cache")]
+        for run in range(2):
+            result = CliRunner().invoke(cli, args)
+            assert result.exit_code == 0
+            assert "Cache:" not in result.output
+        assert not os.path.exists(tmp_path / "cache" / "entries") or not os.listdir(tmp_path / "cache" / "entries")
@@ -13,3 +13,26 @@ def test_report_outliers():
     out = dict(report_outliers(df))
     # 100 is an outlier
     assert out["x_statistical"] == 1
+
+def test_validate_jobs_matches_serial(tmp_path):
+    import json
+    from click.testing import CliRunner
+    from data_validator.cli import cli
+
+    files = ["sample_data/invalid_example.csv", "sample_data/valid_example.csv"]
+    broken = tmp_path / "broken.json"
+    broken.write_text("{not json")
+    files.append(str(broken))
+
+    reports = {}
+    for jobs in ("1", "2"):
+        out = tmp_path / f"report_{jobs}.json"
+        result = CliRunner().invoke(cli, ["validate", *files, "--jobs", jobs, "--no-cache", "--no-daemon",
+                                          "-j", str(out)])
+        assert result.exit_code == 0
+        # Output stays in argument order regardless of completion order
+        positions = [result.output.index(f"File: {path}") for path in files]
+        assert positions == sorted(positions)
+        reports[jobs] = json.loads(out.read_text())
+    assert reports["1"] == reports["2"]
+    assert reports["2"][str(broken)]["status"] == "ERROR"
@@ -0,0 +1,99 @@
+import pytest
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+feather = pytest.importorskip("pyarrow.feather")
+
+from data_validator import columnar
+from data_validator.utils import report_missing, report_outliers, report_type_errors
+from data_validator.validators import validate_file
+
+def _frame(n=1000, seed=0):
+    rng = np.random.default_rng(seed)
+    age = rng.integers(0, 100, n).astype(float)
+    age[rng.choice(n, 20, replace=False)] = np.nan
+    return pd.DataFrame({
+        "patient_id": np.arange(n),
+        "age": pd.array(age, dtype="Int64"),
+        "heart_rate": rng.integers(50, 120, n),
+        "expression_level": np.where(rng.random(n) < 0.05, np.nan, rng.normal(size=n)),
+        "gene_name": np.where(rng.random(n) < 0.02, "12", "BRCA1"),
+        "collection_date": np.where(rng.random(n) < 0.01, "bad", "2024-01-05"),
+        "is_control": rng.random(n) < 0.5,
+        "visit_time": pd.Timestamp("2024-01-01") + pd.to_timedelta(rng.integers(0, 1000, n), unit="D"),
+    })
+
+def _expected(df):
+    return report_missing(df), report_outliers(df), report_type_errors(df)
+
+class TestColumnar:
+
+    @pytest.mark.parametrize("suffix", [".parquet", ".arrow", ".feather"])
+    def test_matches_in_memory_report(self, tmp_path, suffix):
+        """Test the columnar report equals the report_* functions on the loaded frame"""
+        df = _frame()
+        df.loc[700, "heart_rate"] = 500
+        path = str(tmp_path / f"data{suffix}")
+        if suffix == ".parquet":
+            df.to_parquet(path, row_group_size=128)
+            loaded = pd.read_parquet(path)
+        else:
+            feather.write_feather(pa.Table.from_pandas(df, preserve_index=False), path, chunksize=128)
+            loaded = pd.read_feather(path)
+
+        assert columnar.validate_columnar(path) == _expected(loaded)
+        report = validate_file(path)
+        assert report["file_type"] == ("PARQUET" if suffix == ".parquet" else "ARROW")
+        assert dict(report["outliers"])["heart_rate_domain_range"] == 1
+
+    def test_statistics_skip_clean_row_groups(self, tmp_path, monkeypatch):
+        """Test only the row group holding a violation is decoded for missing and domain checks"""
+        df = _frame()[["patient_id", "heart_rate", "is_control", "visit_time"]]
+        df.loc[[5, 900], "heart_rate"] = [500, 1]
+        path = str(tmp_path / "data.parquet")
+        df.to_parquet(path, row_group_size=100)
+
+        reads = []
+        original = columnar._ParquetSource.read
+        monkeypatch.setattr(columnar._ParquetSource, "read",
+                            lambda self, name, chunks=None: reads.append((name, chunks)) or original(self, name, chunks))
+        missing, outliers, type_errors = columnar.validate_columnar(path)
+
+        assert (missing, outliers, type_errors) == _expected(pd.read_parquet(path))
+        assert dict(outliers)["heart_rate_domain_range"] == 2
+        # patient_id needs every value for its IQR check; the other columns
+        # are settled by statistics except the two row groups with violations.
+        assert reads == [("patient_id", None), ("heart_rate", [0, 9])]
+
+    @pytest.mark.filterwarnings("ignore:Feather V1:DeprecationWarning")
+    @pytest.mark.parametrize("options", [{"compression": "lz4", "chunksize": 4096},
+                                         {"compression": "zstd", "chunksize": 4096}, {"version": 1}])
+    def test_feather_reads_one_column_at_a_time(self, tmp_path, options):
+        """Test compressed (and V1) Feather files match pandas and decode only the column being read"""
+        df = _frame(20_000)
+        df[[f"extra_{i}" for i in range(8)]] = np.random.default_rng(1).normal(size=(len(df), 8))
+        path = str(tmp_path / "data.feather")
+        feather.write_feather(df, path, **options)
+        assert columnar.validate_columnar(path) == _expected(pd.read_feather(path))
+
+        if "compression" in options:
+            before = pa.total_allocated_bytes()
+            source = columnar._ArrowSource(path)
+            column = source.read("extra_0")
+            # One float64 column, not the whole table.
+            assert pa.total_allocated_bytes() - before < 2 * len(df) * 8
+            assert column.to_numpy().tolist() == df["extra_0"].tolist()
+
+    def test_index_columns_are_skipped(self, tmp_path):
+        """Test a stored pandas index is not validated as data"""
+        df = _frame(50).set_index("gene_name")
+        path = str(tmp_path / "data.parquet")
+        df.to_parquet(path)
+        assert columnar.validate_columnar(path) == _expected(pd.read_parquet(path))
@@ -0,0 +1,128 @@
+import pytest
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from click.testing import CliRunner
+
+from data_validator.cli import cli
+from data_validator.client import DaemonClient, parse_address
+from data_validator.server import ValidationServer
+from data_validator.validators import validate_file
+
+SRC = os.path.join(os.path.dirname(__file__), '..', 'src')
+
+
+@pytest.fixture
+def daemon(tmp_path):
+    """Run a daemon on a temporary socket for the duration of a test"""
+    address = str(tmp_path / "daemon.sock")
+    server = ValidationServer(workers=1, cache_dir=str(tmp_path / "cache"))
+    thread = threading.Thread(target=server.run, args=(address,), daemon=True)
+    thread.start()
+    deadline = time.time() + 30
+    while DaemonClient.connect(address) is None:
+        assert time.time() < deadline, "daemon did not start"
+        time.sleep(0.05)
+    yield address
+    with DaemonClient(address) as client:
+        client.shutdown()
+    thread.join(10)
+
+
+class TestClient:
+
+    def test_parse_address(self):
+        """Test socket paths, host:port and bare ports are told apart"""
+        assert parse_address("/run/dv.sock") == "/run/dv.sock"
+        assert parse_address("localhost:9000") == ("localhost", 9000)
+        assert parse_address("9000") == ("127.0.0.1", 9000)
+
+    def test_connect_without_daemon(self, tmp_path):
+        """Test connect returns None when nothing is listening"""
+        assert DaemonClient.connect(str(tmp_path / "missing.sock")) is None
+
+    def test_cli_import_skips_pandas(self):
+        """Test the CLI and client modules load without importing pandas"""
+        code = "import sys, data_validator.cli; print('pandas' in sys.modules)"
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                                env=dict(os.environ, PYTHONPATH=SRC))
+        assert result.stdout.strip() == "False"
+
+
+class TestDaemon:
+
+    def test_ping_and_stats(self, daemon):
+        """Test the daemon answers ping and stats requests"""
+        with DaemonClient(daemon) as client:
+            assert client.ping()["pid"] == os.getpid()
+            assert client.request("stats")["requests"] == 0
+
+    def test_reports_match_local_validation(self, daemon):
+        """Test reports from the daemon equal in-process reports"""
+        paths = ["sample_data/invalid_example.csv", "sample_data/valid_example.csv"]
+        with DaemonClient(daemon) as client:
+            results = list(client.validate(paths))
+            again = list(client.validate(paths))
+        assert [path for path, _, _ in results] == paths
+        for path, report, cached in results:
+            assert not cached
+            assert report == json.loads(json.dumps(validate_file(path)))
+        assert all(cached for _, _, cached in again)
+
+    def test_incremental_requests_skip_cache(self, daemon, tmp_path):
+        """Test requests with a state_dir are never served from the result cache"""
+        paths = ["sample_data/valid_example.csv"]
+        with DaemonClient(daemon) as client:
+            for run in range(2):
+                results = list(client.validate(paths, state_dir=str(tmp_path / "state")))
+                assert not results[0][2]
+            assert client.request("stats")["cache_misses"] == 0
+
+    def test_schema_errors_are_reported(self, daemon):
+        """Test the daemon checks schemas before validating"""
+        with DaemonClient(daemon) as client:
+            assert client.check_schema({"required_fields": ["id"]}) is None
+            assert client.check_schema({"field_types": {"id": "nonsense"}})
+
+    def test_unknown_op_is_an_error(self, daemon):
+        """Test a bad request gets an error response without stopping the daemon"""
+        with DaemonClient(daemon) as client:
+            with pytest.raises(RuntimeError, match="unknown op"):
+                client.request("explode")
+            assert client.ping()
+
+    def test_cli_uses_daemon(self, daemon, tmp_path):
+        """Test validate routes files through the daemon and matches local output"""
+        runner = CliRunner()
+        args = ["validate", "-v", "--no-cache", "sample_data/invalid_example.csv"]
+        remote = runner.invoke(cli, args + ["--daemon", daemon])
+        local = runner.invoke(cli, args + ["--no-daemon"])
+        assert remote.exit_code == 0
+        assert remote.output == local.output
+        with DaemonClient(daemon) as client:
+            assert client.request("stats")["requests"] == 1
+
+    def test_cli_falls_back_without_daemon(self, tmp_path):
+        """Test an unreachable --daemon address falls back to local validation"""
+        runner = CliRunner()
+        result = runner.invoke(cli, ["validate", "--no-cache", "--daemon", str(tmp_path / "none.sock"),
+                                     "sample_data/valid_example.csv"])
+        assert result.exit_code == 0
+        assert "All files passed" in result.output
+
+    def test_cli_skips_daemon_of_another_version(self, daemon, monkeypatch):
+        """Test validate ignores a daemon running a different version and validates locally"""
+        monkeypatch.setattr("data_validator.server.__version__", "0.0.0-stale")
+        runner = CliRunner()
+        result = runner.invoke(cli, ["validate", "--no-cache", "--daemon", daemon, "sample_data/valid_example.csv"])
+        assert result.exit_code == 0
+        assert "runs data-validator 0.0.0-stale" in result.output
+        assert "All files passed" in result.output
+        with DaemonClient(daemon) as client:
+            assert client.request("stats")["requests"] == 0
@@ -0,0 +1,109 @@
+import pytest
+import json
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from data_validator import incremental
+from data_validator.accumulators import CSVAccumulator
+from data_validator.incremental import accumulate_csv_incremental
+from data_validator.validators import validate_file
+
+def _rows(start, stop):
+    rng = np.random.default_rng(start)
+    return pd.DataFrame({
+        "patient_id": range(start, stop),
+        "age": rng.integers(0, 140, stop - start),
+        "collection_date": ["2024-01-05"] * (stop - start),
+        "note": ['has "quotes",\nand newline'] * (stop - start),
+    })
+
+def _report_lists(report):
+    return report["missing"], report["outliers"], report["type_errors"]
+
+class TestIncremental:
+
+    def _append(self, path, df, header=False):
+        df.to_csv(path, mode='a', header=header, index=False)
+
+    def test_append_parses_only_new_bytes(self, tmp_path, monkeypatch):
+        """Test appended rows are merged into saved state and match a full run"""
+        path = str(tmp_path / "data.csv")
+        state_dir = str(tmp_path / "state")
+        self._append(path, _rows(0, 500), header=True)
+        acc, resumed = accumulate_csv_incremental(path, state_dir, chunksize=64)
+        assert not resumed
+        assert acc.finalize() == _report_lists(validate_file(path))
+
+        size = os.path.getsize(path)
+        self._append(path, _rows(500, 520))
+        ranges = []
+        original = incremental.accumulate_csv_range
+        monkeypatch.setattr(incremental, "accumulate_csv_range",
+                            lambda p, start, end, *a, **k: ranges.append((start, end)) or original(p, start, end, *a, **k))
+        acc, resumed = accumulate_csv_incremental(path, state_dir, chunksize=64)
+        assert resumed
+        assert ranges == [(size, os.path.getsize(path))]
+        assert acc.rows == 520
+        assert acc.finalize() == _report_lists(validate_file(path))
+
+    def test_report_matches_full_validation(self, tmp_path):
+        """Test validate_file(incremental=True) matches a plain run after appends"""
+        path = str(tmp_path / "data.csv")
+        with open("sample_data/invalid_example.csv") as src:
+            lines = src.readlines()
+        for end in (4, 6, len(lines)):
+            with open(path, "w") as dst:
+                dst.writelines(lines[:end])
+            report = validate_file(path, incremental=True, state_dir=str(tmp_path / "state"))
+            assert report == validate_file(path)
+
+    def test_partial_trailing_record(self, tmp_path):
+        """Test an unterminated last row is reported but re-read once complete"""
+        path = str(tmp_path / "data.csv")
+        state_dir = str(tmp_path / "state")
+        with open(path, "w") as f:
+            f.write("age,heart_rate\n30,70\n40,7")
+        acc, _ = accumulate_csv_incremental(path, state_dir)
+        assert acc.rows == 2
+        with open(path, "a") as f:
+            f.write("00\n")
+        acc, resumed = accumulate_csv_incremental(path, state_dir)
+        assert resumed and acc.rows == 2
+        assert acc.finalize() == _report_lists(validate_file(path))
+        assert dict(acc.finalize()[1]) == {"heart_rate_domain_range": 1}
+
+    @pytest.mark.parametrize("rewrite", ["truncate", "edit_header", "edit_body"])
+    def test_rewrite_falls_back_to_full_run(self, tmp_path, rewrite):
+        """Test truncated or rewritten files are validated from scratch"""
+        path = str(tmp_path / "data.csv")
+        state_dir = str(tmp_path / "state")
+        _rows(0, 300).to_csv(path, index=False)
+        accumulate_csv_incremental(path, state_dir)
+
+        if rewrite == "truncate":
+            _rows(0, 100).to_csv(path, index=False)
+        elif rewrite == "edit_header":
+            _rows(0, 400).rename(columns={"age": "weight"}).to_csv(path, index=False)
+        else:
+            df = _rows(0, 400)
+            df.loc[299, "age"] = -5
+            df.to_csv(path, index=False)
+        acc, resumed = accumulate_csv_incremental(path, state_dir)
+        assert not resumed
+        assert acc.finalize() == _report_lists(validate_file(path))
+
+    def test_accumulator_state_round_trip(self):
+        """Test to_state/from_state survives JSON and keeps merging"""
+        df = pd.DataFrame({"age": [25, None, 150, 40], "x": np.arange(4.0), "d": ["2024-01-01", "bad", None, "x"]})
+        acc = CSVAccumulator(capacity=2)
+        acc.update(df)
+        restored = CSVAccumulator.from_state(json.loads(json.dumps(acc.to_state())))
+        assert restored.finalize() == acc.finalize()
+        restored.update(df)
+        acc.update(df)
+        assert restored.finalize() == acc.finalize()
@@ -0,0 +1,62 @@
+import pytest
+import io
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import data_validator.json_stream as json_stream
+from data_validator.json_stream import stream_format_errors, ndjson_format_errors
+from data_validator.validators import validate_file
+from data_validator.utils import report_format_errors
+
+DOCUMENTS = [
+    {"id": 1, "age": 25, "gene_name": "BRCA1", "expression_level": 5.2},
+    {"age": 150, "gene_name": 123, "expression_level": -5},
+    {"id": "s1", "records": [{"a": 1, "b": 2}, {"a": 3}, [1], {"b": 2, "a": 1}], "values": [1, 2.5, "x", 3]},
+    {"id": 1, "sample_id": [1, 2], "nested": {"items": [1, "a"]}, "age": 1e3},
+    ["x", {"id": 1}],
+    [],
+    {},
+]
+
+class TestJSONStream:
+
+    @pytest.mark.parametrize("read_size", [1, 3, 65536])
+    @pytest.mark.parametrize("document", DOCUMENTS)
+    def test_matches_report_format_errors(self, monkeypatch, read_size, document):
+        """Test streamed validation gives the same messages as loading the whole document"""
+        monkeypatch.setattr(json_stream, "_READ_SIZE", read_size)
+        text = json.dumps(document, indent=1)
+        assert stream_format_errors(io.StringIO(text)) == report_format_errors(json.loads(text))
+
+    def test_custom_schema(self):
+        """Test streamed validation honours a custom schema"""
+        schema = {"required_fields": ["sample_id"], "field_types": {"count": int}, "field_ranges": {"count": (0, 10)}}
+        text = json.dumps({"count": 11, "rows": [1, 2]})
+        assert stream_format_errors(io.StringIO(text), schema) == report_format_errors(json.loads(text), schema)
+
+    @pytest.mark.parametrize("text", ['{"a": 1', '{"a": 1}x', '[1,]', '{"a": [1, 2}', '{"a": 1,}'])
+    def test_invalid_json_errors_match(self, monkeypatch, text):
+        """Test syntax errors report the same message and position as json.loads"""
+        monkeypatch.setattr(json_stream, "_READ_SIZE", 2)
+        with pytest.raises(json.JSONDecodeError) as expected:
+            json.loads(text)
+        with pytest.raises(json.JSONDecodeError) as actual:
+            stream_format_errors(io.StringIO(text))
+        assert str(actual.value) == str(expected.value)
+
+    def test_ndjson(self, tmp_path):
+        """Test newline-delimited records are validated one line at a time"""
+        path = tmp_path / "records.ndjson"
+        path.write_text('{"id": 1, "age": 30}\n\n{"age": 130}\n')
+        errors = ndjson_format_errors(io.StringIO(path.read_text()))
+        assert errors == [
+            "Line 3: Missing required field: id",
+            "Line 3: Field 'age' value 130 outside valid range [0, 120]",
+        ]
+
+        result = validate_file(str(path))
+        assert result["status"] == "FAIL"
+        assert result["format_errors"] == errors
@@ -0,0 +1,50 @@
+import pytest
+import io
+import pandas as pd
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from data_validator.validators import validate_file
+from data_validator.accumulators import CSVAccumulator
+from data_validator.parallel import split_csv, accumulate_csv_range
+
+class TestParallel:
+
+    def test_split_respects_quoted_newlines(self, tmp_path):
+        """Test byte ranges never cut a quoted field containing newlines"""
+        path = tmp_path / "quoted.csv"
+        rows = ['id,note,age']
+        for i in range(50):
+            rows.append(f'{i},"line one\nline ""two"", with comma\n",{20 + i}')
+        path.write_text("\n".join(rows) + "\n")
+
+        expected = pd.read_csv(path)
+        for parts in (2, 3, 7, 40):
+            columns, ranges = split_csv(str(path), parts)
+            assert columns == ["id", "note", "age"]
+            assert ranges[0][0] == len("id,note,age\n")
+            assert ranges[-1][1] == os.path.getsize(path)
+
+            frames = []
+            with open(path, 'rb') as f:
+                for start, end in ranges:
+                    f.seek(start)
+                    frames.append(pd.read_csv(io.BytesIO(f.read(end - start)), header=None, names=columns))
+            assert pd.concat(frames, ignore_index=True).equals(expected)
+
+    def test_range_accumulators_merge(self, tmp_path):
+        """Test merging per-range accumulators counts every row once"""
+        columns, ranges = split_csv("sample_data/invalid_example.csv", 5)
+        total = CSVAccumulator()
+        for start, end in ranges:
+            total.merge(accumulate_csv_range("sample_data/invalid_example.csv", start, end, columns, chunksize=8))
+        assert total.rows == 100
+        assert total.finalize()[0] == validate_file("sample_data/invalid_example.csv")["missing"]
+
+    @pytest.mark.parametrize("workers", [2, 4])
+    def test_parallel_matches_in_memory(self, workers):
+        """Test multi-process validation of one file reproduces the in-memory report"""
+        for path in ("sample_data/valid_example.csv", "sample_data/invalid_example.csv"):
+            assert validate_file(path, workers=workers) == validate_file(path)
@@ -0,0 +1,82 @@
+import pytest
+import json
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from click.testing import CliRunner
+
+from data_validator.cli import cli
+from data_validator.profiling import NULL_PROFILER, Profiler
+from data_validator.validators import validate_file
+
+class TestProfiler:
+
+    def test_stages_are_summed_and_forwarded(self):
+        """Test repeated stages accumulate and callbacks see each run"""
+        seen = []
+        profiler = Profiler(callbacks=[seen.append])
+        for _ in range(3):
+            with profiler.stage("parse") as stage:
+                stage.rows = 10
+        with profiler.stage("check", column="age", rows=5):
+            pass
+        profiler.close()
+
+        metrics = profiler.to_dict()
+        assert [(s["stage"], s["rows"]) for s in metrics["stages"]] == [("parse", 30)]
+        assert metrics["columns"]["age"][0]["stage"] == "check"
+        assert [m.stage for m in seen] == ["parse"] * 3 + ["check"]
+
+    def test_nested_peak_memory(self):
+        """Test an allocation inside a nested stage counts toward the outer peak"""
+        profiler = Profiler()
+        with profiler.stage("outer"):
+            with profiler.stage("inner"):
+                block = np.ones(1 << 20)
+                del block
+        profiler.close()
+        peaks = {s["stage"]: s["peak_memory_bytes"] for s in profiler.to_dict()["stages"]}
+        assert peaks["inner"] >= 8 << 20
+        assert peaks["outer"] >= peaks["inner"]
+
+    def test_null_profiler_is_inert(self):
+        """Test the disabled profiler shares one stage and ignores rows"""
+        stage = NULL_PROFILER.stage("parse")
+        with stage as entered:
+            entered.rows = 5
+        assert NULL_PROFILER.stage("other") is stage
+        assert stage.rows is None
+
+    @pytest.mark.parametrize("kwargs", [{}, {"chunksize": 30}])
+    def test_validate_file_metrics(self, kwargs):
+        """Test reports gain a metrics key only when profiled, with per-column stages"""
+        path = "sample_data/invalid_example.csv"
+        plain = validate_file(path, **kwargs)
+        profiler = Profiler(trace_memory=False)
+        profiled = validate_file(path, profiler=profiler, **kwargs)
+        metrics = profiled.pop("metrics")
+        assert "metrics" not in plain and profiled == plain
+
+        stages = {s["stage"]: s for s in metrics["stages"]}
+        assert stages["read_csv"]["rows"] == 100
+        assert "validate_file" in stages
+        assert "age" in metrics["columns"]
+
+    def test_cli_profile(self, tmp_path):
+        """Test --profile adds per-file metrics and an aggregate block"""
+        out = tmp_path / "report.json"
+        files = ["sample_data/valid_example.csv", "sample_data/invalid_example.csv"]
+        result = CliRunner().invoke(cli, ["validate", *files, "--profile", "--jobs", "1", "--no-daemon",
+                                          "-j", str(out)])
+        assert result.exit_code == 0
+        assert "Profile: read_csv" in result.output
+        assert "Profile: json_write" in result.output
+        report = json.loads(out.read_text())
+        assert report["_metrics"]["files"] == 2
+        read = next(s for s in report["_metrics"]["stages"] if s["stage"] == "read_csv")
+        assert read["rows"] == 200
+        assert all("metrics" in report[path] for path in files)
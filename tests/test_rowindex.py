@@ -0,0 +1,116 @@
+import pytest
+import json
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+from click.testing import CliRunner
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from data_validator.cli import cli
+from data_validator.rowindex import RowSet, index_csv, quarantine_csv
+from data_validator.scanner import scan_frame
+from data_validator.streaming import validate_csv_stream
+from data_validator.validators import validate_file
+
+SAMPLE = os.path.join(os.path.dirname(__file__), '..', 'sample_data', 'invalid_example.csv')
+
+def _write(path):
+    df = pd.DataFrame({
+        "id": range(10),
+        "age": [30, None, 200, 40, 41, 42, 43, 44, 45, 46],
+        "heart_rate": ["70", "71", "high", "72", "73", "74", None, "75", "76", "77"],
+        "visit_date": ["2024-01-01"] * 9 + ["2024-13-01"],
+        "note": ['a', 'b', 'multi\nline "x"', 'd', 'e', 'f', 'g', 'h', 'i', 'j'],
+    })
+    df.to_csv(path, index=False)
+    return str(path)
+
+class TestRowSet:
+
+    def test_runs(self):
+        """Test masks and ids become runs and convert back"""
+        mask = np.zeros(1_000_000, dtype=bool)
+        mask[10:500_000] = True
+        mask[999_999] = True
+        rows = RowSet.from_mask(mask)
+        assert len(rows) == 499_991
+        assert rows.nbytes == 32
+        assert np.array_equal(rows.to_mask(len(mask)), mask)
+        assert rows == RowSet.from_ids(np.flatnonzero(mask)[::-1])
+        assert 10 in rows and 9 not in rows and 999_999 in rows
+        assert rows.first(3) == [10, 11, 12]
+
+    def test_union(self):
+        """Test unions merge overlapping and touching runs"""
+        union = RowSet.from_ids([1, 2, 3, 10]) | RowSet.from_ids([4, 9, 20])
+        assert list(union) == [1, 2, 3, 4, 9, 10, 20]
+        assert len(union.starts) == 3
+        assert RowSet.from_state(union.to_state()) == union
+
+class TestRowIndex:
+
+    @pytest.mark.parametrize("chunksize", [None, 3])
+    def test_counts_match_report(self, tmp_path, chunksize):
+        """Test the row index reproduces the in-memory and chunked reports"""
+        for path in (SAMPLE, _write(tmp_path / "data.csv")):
+            index = index_csv(path, chunksize)
+            if chunksize:
+                assert index.finalize() == validate_csv_stream(path, chunksize)
+            else:
+                assert index.finalize() == scan_frame(pd.read_csv(path))
+            missing, outliers, _ = index.finalize()
+            sets = index.row_sets()
+            assert {name: len(sets["missing"][name]) for name, _ in missing} == dict(missing)
+            assert all(rows is None or len(rows) == count
+                       for name, count in outliers for rows in [sets["outliers"][name]])
+
+    def test_rows_per_check(self, tmp_path):
+        """Test each check flags the right rows"""
+        sets = index_csv(_write(tmp_path / "data.csv")).row_sets()
+        assert list(sets["missing"]["age"]) == [1]
+        assert list(sets["missing"]["heart_rate"]) == [6]
+        assert list(sets["outliers"]["age_domain_range"]) == [2]
+        assert list(sets["type_errors"]["heart_rate"]) == [2]
+        assert list(sets["type_errors"]["visit_date_date_format"]) == [9]
+
+    @pytest.mark.parametrize("chunksize", [1, 2])
+    def test_bool_chunks(self, tmp_path, chunksize):
+        """Test bool chunks with blanks flag no rows, and bool chunks of a date column flag their rows"""
+        flags = tmp_path / "flags.csv"
+        flags.write_text("id,is_control\n1,True\n2,False\n3,\n4,True\n5,False\n6,True\n")
+        sets = index_csv(str(flags), chunksize).row_sets()
+        assert sets["type_errors"] == {} and list(sets["missing"]["is_control"]) == [2]
+        dates = tmp_path / "dates.csv"
+        dates.write_text("id,flag_date\n1,True\n2,2020-01-01\n3,2020-01-02\n")
+        sets = index_csv(str(dates), chunksize).row_sets()
+        assert list(sets["type_errors"]["flag_date_date_format"]) == [0]
+
+    def test_split_keeps_original_records(self, tmp_path):
+        """Test quarantine and clean files partition the original records"""
+        path = _write(tmp_path / "data.csv")
+        bad, good = str(tmp_path / "bad.csv"), str(tmp_path / "good.csv")
+        assert quarantine_csv(path, index_csv(path).rejected(), bad, good) == (4, 6)
+        assert list(pd.read_csv(bad)["id"]) == [1, 2, 6, 9]
+        assert list(pd.read_csv(good)["id"]) == [0, 3, 4, 5, 7, 8]
+        assert pd.read_csv(bad)["note"][1] == 'multi\nline "x"'
+
+    def test_validate_file_row_ids(self):
+        """Test row ids are listed per check, capped at N"""
+        report = validate_file(SAMPLE, row_ids=2)
+        assert report["row_ids"]["outliers"]["age_domain_range"] == [0, 19]
+        assert report["row_ids"]["missing"]["blood_sugar"] == [51, 55]
+
+    def test_cli_quarantine(self, tmp_path):
+        """Test --quarantine-out and --clean-out write one file each per input"""
+        path = _write(tmp_path / "data.csv")
+        out = str(tmp_path / "report.json")
+        result = CliRunner().invoke(cli, ["validate", path, "--row-ids", "5", "-j", out, "--no-daemon",
+                                          "--quarantine-out", str(tmp_path / "bad"), "--clean-out", str(tmp_path / "good")])
+        assert result.exit_code == 0
+        assert "Quarantine: 4 rejected row(s), 6 clean row(s)" in result.output
+        assert len(pd.read_csv(tmp_path / "bad" / "data.csv")) == 4
+        with open(out) as f:
+            assert json.load(f)[path]["row_ids"]["missing"]["age"] == [1]
@@ -0,0 +1,76 @@
+import pytest
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from data_validator.rules import _quartiles, compile_rules, matrix_outliers
+from data_validator.utils import DEFAULT_DOMAIN_RANGES, report_outliers
+
+def _reference_outliers(df, ranges, iqr_multiplier):
+    """Per-column outlier checks, one Series at a time."""
+    out = []
+    for col in df.select_dtypes(include=[np.number]):
+        series = df[col].dropna()
+        bounds = next((b for key, b in ranges.items() if key in str(col).lower()), None)
+        domain = 0 if bounds is None else int(((series < bounds[0]) | (series > bounds[1])).sum())
+        if domain:
+            out.append((f"{col}_domain_range", domain))
+        elif len(series) >= 4:
+            q1, q3 = np.percentile(series, [25, 75])
+            iqr = q3 - q1
+            count = int(((series < q1 - iqr_multiplier * iqr) | (series > q3 + iqr_multiplier * iqr)).sum())
+            if iqr > 0 and count:
+                out.append((f"{col}_statistical", count))
+    return out
+
+class TestRules:
+
+    def test_plan_resolves_first_matching_key_and_is_cached(self):
+        """Test each column gets the first contained range key, once per header"""
+        columns = ["Patient_Age", "heart_rate_age", "expression_7", "note"]
+        plan = compile_rules(columns, DEFAULT_DOMAIN_RANGES)
+        assert plan.bounds(0) == (0, 120)
+        assert plan.bounds(1) == (0, 120)  # 'age' comes before 'heart_rate'
+        assert plan.bounds(2) == (0, float('inf'))
+        assert plan.bounds(3) is None
+        assert compile_rules(list(columns), dict(DEFAULT_DOMAIN_RANGES)) is plan
+
+    def test_quartiles_match_nanpercentile(self):
+        """Test the sorted-block quartiles equal np.nanpercentile per column"""
+        rng = np.random.default_rng(3)
+        block = rng.normal(size=(57, 40))
+        block[rng.random(block.shape) < 0.3] = np.nan
+        counts = (~np.isnan(block)).sum(axis=0)
+        q1, q3 = _quartiles(block, counts)
+        assert np.array_equal(q1, np.nanpercentile(block, 25, axis=0))
+        assert np.array_equal(q3, np.nanpercentile(block, 75, axis=0))
+
+    @pytest.mark.parametrize("seed", range(10))
+    def test_matrix_matches_per_column_checks(self, seed):
+        """Test the matrix checks equal per-column checks, NaNs and mixed dtypes included"""
+        rng = np.random.default_rng(seed)
+        rows = int(rng.integers(1, 60))
+        df = pd.DataFrame({
+            f"{name}_{i}": np.where(rng.random(rows) < 0.2, np.nan, rng.normal(60, 30, rows).round())
+            for i, name in enumerate(["age", "temperature", "gene", "expression", "value"])
+        })
+        df["count"] = rng.integers(0, 10, rows)
+        df["flag"] = rng.random(rows) < 0.5
+        df["label"] = "x"
+        for multiplier in (1.5, 2.5):
+            expected = _reference_outliers(df, DEFAULT_DOMAIN_RANGES, multiplier)
+            assert report_outliers(df, None, multiplier) == expected
+
+    def test_wide_table_in_slabs(self, monkeypatch):
+        """Test slab-wise conversion gives the same result as one block"""
+        rng = np.random.default_rng(0)
+        df = pd.DataFrame(rng.lognormal(5, 1, (30, 500)), columns=[f"expression_{i}" for i in range(500)])
+        df.iloc[3, ::7] = -1.0
+        whole = matrix_outliers(df, DEFAULT_DOMAIN_RANGES)
+        monkeypatch.setattr("data_validator.rules._SLAB_CELLS", 30 * 17)
+        assert matrix_outliers(df, DEFAULT_DOMAIN_RANGES) == whole
+        assert whole["expression_0"] == [("expression_0_domain_range", 1)]
@@ -0,0 +1,123 @@
+import pytest
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+from click.testing import CliRunner
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from data_validator.cli import cli
+from data_validator.sampling import block_sample_csv, reservoir_sample_csv, validate_csv_sampled, wilson_interval
+from data_validator.validators import validate_file
+
+def _write(path, rows, bad_every=0):
+    rng = np.random.default_rng(0)
+    age = rng.integers(20, 80, rows).astype(object)
+    if bad_every:
+        age[::bad_every] = "unknown"
+    pd.DataFrame({
+        "id": np.arange(rows),
+        "age": age,
+        "score": rng.normal(50, 5, rows).round(2),
+        "visit_date": ["2024-03-01"] * rows,
+    }).to_csv(path, index=False)
+    return str(path)
+
+class TestSampling:
+
+    def test_wilson_interval(self):
+        """Test the Wilson interval brackets the observed rate and is never empty at zero"""
+        low, high = wilson_interval(10, 1000)
+        assert low < 0.01 < high
+        low, high = wilson_interval(0, 10000)
+        assert low == 0.0 and 0.0003 < high < 0.0004
+        with pytest.raises(ValueError):
+            wilson_interval(1, 10, confidence=0.5)
+
+    def test_samplers(self, tmp_path):
+        """Test both samplers return about the requested rows and the file's row count"""
+        path = _write(tmp_path / "data.csv", 50_000)
+        sample, total, covers_file, skipped = block_sample_csv(path, 2000, seed=1)
+        assert not covers_file and skipped == 0
+        assert 1500 < len(sample) < 2500
+        assert abs(total - 50_000) < 2500
+        assert sample["id"].is_unique
+
+        sample, total = reservoir_sample_csv(path, 2000, chunksize=7000, seed=1)
+        assert len(sample) == 2000 and total == 50_000
+        assert sample["id"].is_unique
+
+    def test_blocks_respect_quoted_newlines(self, tmp_path):
+        """Test blocks never start inside a quoted field that holds record-like lines"""
+        path = tmp_path / "quoted.csv"
+        with open(path, "w") as f:
+            f.write("id,age,note\n")
+            for i in range(60_000):
+                note = '"first line\n7,150,z\nlast"' if i % 3 == 0 else "plain"
+                f.write(f"{i},{20 + i % 60},{note}\n")
+        sample, _, covers_file, skipped = block_sample_csv(str(path), 2000, seed=1)
+        assert not covers_file and skipped == 0
+        assert sample["age"].max() < 80 and sample["id"].is_unique
+        assert validate_file(str(path), sample_rows=2000)["status"] == "PASS"
+
+    def test_small_file_is_exact(self, tmp_path):
+        """Test a file smaller than the sample is validated whole with no estimates"""
+        path = _write(tmp_path / "data.csv", 500, bad_every=50)
+        report = validate_file(path, sample_rows=10_000)
+        assert report["sampling"]["estimates"] == []
+        assert report["type_errors"] == validate_file(path)["type_errors"]
+
+    @pytest.mark.parametrize("method", ["block", "reservoir"])
+    def test_found_violation_is_estimated_and_clean_columns_escalate(self, tmp_path, method):
+        """Test a column with sampled violations is estimated and clean columns are checked exactly"""
+        path = _write(tmp_path / "data.csv", 40_000, bad_every=100)
+        exact = validate_file(path)
+        missing, outliers, type_errors, sampling = validate_csv_sampled(path, 2000, method=method, chunksize=5000)
+
+        assert "age" not in sampling["escalated_columns"]
+        assert {"id", "score", "visit_date"} <= set(sampling["escalated_columns"])
+        estimate = next(e for e in sampling["estimates"] if e["column"] == "age" and e["check"] == "mixed_types")
+        low, high = estimate["count_interval"]
+        assert low <= 400 <= high
+        assert type_errors[0][0] == "age"
+        assert [e for e in exact["outliers"] if not e[0].startswith("age")] == outliers
+
+    def test_default_tolerance_scales_with_sample(self, tmp_path):
+        """Test a clean 10,000-row sample is accepted by default, a 2,000-row one is escalated"""
+        path = _write(tmp_path / "data.csv", 100_000)
+        report = validate_file(path, sample_rows=10_000)
+        assert report["status"] == "PASS" and report["sampling"]["escalated_columns"] == []
+        report = validate_file(path, sample_rows=2000)
+        assert set(report["sampling"]["escalated_columns"]) == {"id", "age", "score", "visit_date"}
+        report = validate_file(path, sample_rows=10_000, sample_tolerance=0)
+        assert len(report["sampling"]["escalated_columns"]) == 4
+
+    def test_statistical_hits_do_not_settle_a_column(self, tmp_path):
+        """Test sampled IQR outliers are estimates but leave the column to the exact pass"""
+        path = _write(tmp_path / "data.csv", 40_000)
+        df = pd.read_csv(path)
+        df.loc[::50, "score"] = 500.0
+        df.to_csv(path, index=False)
+        _, outliers, _, sampling = validate_csv_sampled(path, 2000, chunksize=5000)
+        assert "score" in sampling["escalated_columns"]
+        assert [e for e in outliers if e[0] == "score_statistical"] == \
+            [e for e in validate_file(path)["outliers"] if e[0] == "score_statistical"]
+
+    def test_tolerance_accepts_clean_columns(self, tmp_path):
+        """Test a tolerance above the upper bound leaves clean columns as estimates"""
+        path = _write(tmp_path / "data.csv", 40_000)
+        report = validate_file(path, sample_rows=2000, sample_tolerance=0.01)
+        assert report["status"] == "PASS"
+        assert report["sampling"]["escalated_columns"] == []
+        assert all(e["sample_violations"] == 0 for e in report["sampling"]["estimates"])
+
+    def test_cli_sample(self, tmp_path):
+        """Test --sample prints the sample line and reports estimates"""
+        path = _write(tmp_path / "data.csv", 40_000, bad_every=100)
+        result = CliRunner().invoke(cli, ["validate", path, "--sample", "2000", "--no-cache", "--no-daemon",
+                                          "--verbose"])
+        assert result.exit_code == 0
+        assert "Sample: " in result.output
+        assert "~ age mixed_types: estimated" in result.output
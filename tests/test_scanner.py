@@ -0,0 +1,83 @@
+import pytest
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from data_validator.scanner import csv_read_hints, read_csv_with_hints, scan_frame
+from data_validator.utils import report_missing, report_outliers, report_type_errors
+
+class TestScanner:
+
+    def _frames(self):
+        rng = np.random.default_rng(0)
+        n = 500
+        yield pd.read_csv("sample_data/valid_example.csv")
+        yield pd.read_csv("sample_data/invalid_example.csv")
+        yield pd.DataFrame({
+            "age": np.where(rng.random(n) < 0.1, np.nan, rng.integers(-5, 130, n)),
+            "heart_rate": rng.integers(60, 100, n),
+            "score": np.append(rng.normal(size=n - 3), [50.0, 60.0, -70.0]),
+            "flag": rng.random(n) < 0.5,
+            "mixed": np.where(rng.random(n) < 0.2, "abc", "1.5"),
+            "event_date": np.where(rng.random(n) < 0.1, "2024-13-01", "2024-01-01"),
+            "empty": [None] * n,
+        })
+
+    def test_matches_separate_reports(self):
+        """Test the fused scan equals report_missing, report_outliers and report_type_errors"""
+        for df in self._frames():
+            assert scan_frame(df) == (report_missing(df), report_outliers(df), report_type_errors(df))
+            ranges = {"score": (-1, 1)}
+            assert scan_frame(df, ranges, 1.5)[1] == report_outliers(df, ranges, 1.5)
+
+    def test_timings(self):
+        """Test per-column timings are recorded"""
+        df = pd.read_csv("sample_data/invalid_example.csv")
+        timings = {}
+        scan_frame(df, timings=timings)
+        assert list(timings) == list(df.columns)
+
+    def test_schema_hints(self):
+        """Test numeric field types become dtype hints and columns become usecols"""
+        schema = {"field_types": {"age": "number", "name": "string", "flag": "bool"}, "columns": ["age", "name"]}
+        assert csv_read_hints(schema) == {"dtype": {"age": "float64"}, "usecols": ["age", "name"]}
+        assert csv_read_hints(None) == {}
+        assert csv_read_hints({"type": "object", "properties": {"age": {"type": "number"}}}) == {}
+
+    def test_read_with_hints(self, tmp_path):
+        """Test hinted reads, missing declared columns and the fallback for stray tokens"""
+        path = tmp_path / "data.csv"
+        path.write_text("age,name,heart_rate\n30,a,70\n40,b,80\n")
+        schema = {"field_types": {"age": int}, "columns": ["age", "weight"]}
+        df = read_csv_with_hints(str(path), schema)
+        assert list(df.columns) == ["age"]
+        assert df["age"].dtype == np.float64
+
+        path.write_text("age,name,heart_rate\n30,a,70\nabc,b,80\n")
+        df = read_csv_with_hints(str(path), schema)
+        assert df["age"].tolist() == ["30", "abc"]
+
+    def test_read_stream_with_hints(self, tmp_path):
+        """Test a stream is reopened for the retry, and read without dtype hints if it cannot be"""
+        path = tmp_path / "data.csv"
+        path.write_bytes(b"age,name\n30,a\nabc,b\n")
+        schema = {"field_types": {"age": int}}
+        opened = []
+
+        def reopen():
+            opened.append(path)
+            return open(path, "rb")
+
+        with open(path, "rb") as stream:
+            df = read_csv_with_hints(stream, schema, reopen=reopen)
+        assert df["age"].tolist() == ["30", "abc"]
+        assert len(opened) == 1
+
+        path.write_bytes(b"age,name\n30,a\n40,b\n")
+        with open(path, "rb") as stream:
+            df = read_csv_with_hints(stream, schema)
+        assert df["age"].tolist() == [30, 40]
@@ -0,0 +1,71 @@
+import pytest
+import json
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from data_validator.schema import SchemaError, compile_schema
+from data_validator.utils import report_format_errors
+from data_validator.validators import validate_file
+
+class TestSchemaPlan:
+
+    def test_default_plan_is_cached(self):
+        """Test the default schema and equal custom schemas compile once"""
+        assert compile_schema() is compile_schema(None)
+        schema = {"required_fields": ["id"], "field_types": {"age": int}}
+        assert compile_schema(schema) is compile_schema(dict(schema))
+
+    def test_batch_matches_single_record(self):
+        """Test columnar batch validation gives the same messages as per-record checks"""
+        rng = random.Random(0)
+        values = [1, -4, 2.5, 150, 10**30, "x", None, True, [1, "a"], [{"a": 1}, {"b": 2}], {"k": 1}]
+        fields = ["id", "age", "gene_name", "expression_level", "sample_id", "extra"]
+        records = [
+            {field: rng.choice(values) for field in rng.sample(fields, rng.randint(0, len(fields)))}
+            for _ in range(300)
+        ]
+        plan = compile_schema()
+        assert plan.validate_batch(records) == [report_format_errors(record) for record in records]
+
+    def test_type_names_from_schema_file(self, tmp_path):
+        """Test a JSON --schema file can name types instead of using Python types"""
+        schema = {
+            "required_fields": ["sample_id"],
+            "field_types": {"sample_id": "string", "count": ["int", "null"], "score": "number"},
+            "field_ranges": {"count": [0, 10]}
+        }
+        plan = compile_schema(json.loads(json.dumps(schema)))
+        assert plan.validate({"sample_id": "s1", "count": None, "score": 1.5}) == []
+        errors = plan.validate({"sample_id": 7, "count": 11, "score": "high"})
+        assert len(errors) == 3
+        assert "outside valid range [0, 10]" in errors[-1]
+
+    def test_unknown_type_name(self):
+        """Test unknown type names are rejected when compiling"""
+        with pytest.raises(SchemaError):
+            compile_schema({"field_types": {"x": "decimal"}})
+
+    def test_json_schema_document(self, tmp_path):
+        """Test full JSON Schema documents are validated with jsonschema"""
+        schema = {
+            "$schema": "https://json-schema.org/draft/2020-12/schema",
+            "type": "object",
+            "required": ["id"],
+            "properties": {"age": {"type": "number", "minimum": 0, "maximum": 120}}
+        }
+        plan = compile_schema(schema)
+        assert plan.validate({"id": 1, "age": 30}) == []
+        errors = plan.validate({"age": 130})
+        assert len(errors) == 2
+        assert all(error.startswith("Schema violation at '$") for error in errors)
+
+        path = tmp_path / "record.json"
+        path.write_text(json.dumps({"age": -1}))
+        result = validate_file(str(path), schema)
+        assert result["status"] == "FAIL"
+
+        with pytest.raises(SchemaError):
+            compile_schema({"type": "object", "properties": {"age": {"type": 12}}})
@@ -0,0 +1,119 @@
+import pytest
+import gzip
+import json
+import os
+import shutil
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from click.testing import CliRunner
+
+from data_validator.cli import cli
+from data_validator.parallel import shard_range
+from data_validator.shards import (ShardStateError, final_report, merge_all, merge_states, parse_shard,
+                                   read_state, validate_shard, write_state)
+from data_validator.validators import validate_file
+
+SAMPLE_DIR = os.path.join(os.path.dirname(__file__), '..', 'sample_data')
+
+
+def _inputs(tmp_path):
+    files = []
+    for name in ("invalid_example.csv", "valid_example.csv"):
+        shutil.copy(os.path.join(SAMPLE_DIR, name), tmp_path / name)
+        files.append(str(tmp_path / name))
+    with open(os.path.join(SAMPLE_DIR, "invalid_example.csv"), "rb") as f, \
+            gzip.open(tmp_path / "archive.csv.gz", "wb") as g:
+        g.write(f.read())
+    (tmp_path / "records.ndjson").write_text('{"id": 1}\n{"name": "x"}\n')
+    return files + [str(tmp_path / "archive.csv.gz"), str(tmp_path / "records.ndjson")]
+
+
+def _plain(report):
+    return json.loads(json.dumps(report))
+
+
+class TestShardRange:
+
+    def test_ranges_cover_every_row_once(self, tmp_path):
+        """Test independent shard ranges tile the data rows, quoted newlines included"""
+        path = tmp_path / "quoted.csv"
+        path.write_text("id,note\n" + "".join(f'{i},"line one\nline {i}"\n' for i in range(50)))
+        for count in (1, 4, 9, 200):
+            ranges = [shard_range(str(path), i, count)[1:] for i in range(count)]
+            assert ranges[0][0] == len("id,note\n")
+            assert ranges[-1][1] == os.path.getsize(path)
+            assert all(end == start for (_, end), (start, _) in zip(ranges, ranges[1:]))
+
+    def test_parse_shard(self):
+        """Test shard specs are 1-based i/N"""
+        assert parse_shard("2/5") == (2, 5)
+        for text in ("0/5", "6/5", "x", "1/0"):
+            with pytest.raises(ValueError):
+                parse_shard(text)
+
+
+class TestMerge:
+
+    @pytest.mark.parametrize("count", [2, 3, 6])
+    def test_matches_single_node_in_any_grouping(self, tmp_path, count):
+        """Test merged shards give the single-node report, however they are grouped"""
+        files = _inputs(tmp_path)
+        states = [validate_shard(files, i, count) for i in range(1, count + 1)]
+        expected = {path: _plain(validate_file(path)) for path in files}
+        assert _plain(final_report(merge_all(states))) == expected
+        tree = merge_states(merge_all(states[count // 2:]), merge_all(reversed(states[:count // 2])))
+        assert _plain(final_report(tree)) == expected
+
+    def test_state_round_trip(self, tmp_path):
+        """Test partial states survive writing and reading"""
+        files = _inputs(tmp_path)
+        state = validate_shard(files, 1, 2)
+        write_state(str(tmp_path / "p.state"), state)
+        assert read_state(str(tmp_path / "p.state")) == _plain(state)
+        write_state(str(tmp_path / "old.state"), dict(state, state_version=0))
+        with pytest.raises(ShardStateError):
+            read_state(str(tmp_path / "old.state"))
+
+    def test_rejects_incompatible_states(self, tmp_path):
+        """Test repeated shards, other runs and missing shards are refused"""
+        files = _inputs(tmp_path)
+        first = validate_shard(files, 1, 2)
+        with pytest.raises(ShardStateError):
+            merge_states(first, first)
+        with pytest.raises(ShardStateError):
+            merge_states(first, validate_shard(files[:2], 2, 2))
+        with pytest.raises(ShardStateError):
+            final_report(first)
+
+
+class TestCli:
+
+    def test_shard_and_merge(self, tmp_path):
+        """Test validate --shard writes partial states that merge into the validate report"""
+        files = _inputs(tmp_path)
+        runner = CliRunner()
+        states = []
+        for i in (1, 2, 3):
+            states.append(str(tmp_path / f"partial_{i}.state"))
+            result = runner.invoke(cli, ["validate", *files, "--shard", f"{i}/3", "--shard-out", states[-1]])
+            assert result.exit_code == 0
+        result = runner.invoke(cli, ["merge", states[0], states[1], "-o", str(tmp_path / "left.state")])
+        assert result.exit_code == 0 and "Still missing shard(s) 3 of 3" in result.output
+        result = runner.invoke(cli, ["merge", states[0], states[1]])
+        assert result.exit_code != 0
+        result = runner.invoke(cli, ["merge", str(tmp_path / "left.state"), states[2],
+                                     "-j", str(tmp_path / "merged.json")])
+        assert result.exit_code == 0
+        result = runner.invoke(cli, ["validate", *files, "--no-daemon", "--no-cache",
+                                     "-j", str(tmp_path / "single.json")])
+        with open(tmp_path / "merged.json") as f, open(tmp_path / "single.json") as g:
+            assert json.load(f) == json.load(g)
+
+    def test_shard_rejects_row_options(self, tmp_path):
+        """Test options that need the whole file are refused with --shard"""
+        files = _inputs(tmp_path)
+        result = CliRunner().invoke(cli, ["validate", *files, "--shard", "1/2", "--fail-fast"])
+        assert result.exit_code != 0
+        assert "--fail-fast" in result.output
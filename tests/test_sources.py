@@ -0,0 +1,128 @@
+import pytest
+import bz2
+import gzip
+import io
+import lzma
+import os
+import sys
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from data_validator.sources import TextSource, _PrefetchReader, detect_source, open_binary
+from data_validator.validators import validate_file
+
+SAMPLE = os.path.join(os.path.dirname(__file__), '..', 'sample_data', 'invalid_example.csv')
+OPENERS = {"gz": gzip.open, "bz2": bz2.open, "xz": lzma.open}
+
+
+def _compress(path, data, suffix):
+    with OPENERS[suffix](path, "wb") as f:
+        f.write(data)
+    return str(path)
+
+
+def _without_file_type(report):
+    return {key: value for key, value in report.items() if key != "file_type"}
+
+
+class TestDetectSource:
+
+    def test_suffixes(self, tmp_path):
+        """Test the delimiter and compression are read from the suffixes"""
+        raw = open(SAMPLE, "rb").read()
+        tsv = tmp_path / "data.tsv"
+        tsv.write_bytes(raw)
+        assert detect_source(str(tsv)) == TextSource(str(tsv), None, "\t")
+        gz = _compress(tmp_path / "data.csv.gz", raw, "gz")
+        assert detect_source(gz) == TextSource(gz, "gzip", ",")
+        ndjson = _compress(tmp_path / "records.ndjson.xz", b'{"id": 1}\n', "xz")
+        assert detect_source(ndjson) == TextSource(ndjson, "xz", None)
+
+    def test_magic_bytes_and_sniffing(self, tmp_path):
+        """Test misnamed archives are detected and bare archives are sniffed"""
+        disguised = _compress(tmp_path / "data.csv", b"a,b\n1,2\n", "gz")
+        assert detect_source(disguised).compression == "gzip"
+        bare = _compress(tmp_path / "data.bz2", b"a\tb\n1\t2\n", "bz2")
+        assert detect_source(bare) == TextSource(bare, "bz2", "\t")
+        text = tmp_path / "notes.txt"
+        text.write_text("no delimiters here\n")
+        assert detect_source(str(text)) is None
+
+
+class TestPrefetchReader:
+
+    def test_reads_everything(self):
+        """Test every byte arrives, in order, through the bounded queue"""
+        data = bytes(range(256)) * 5000
+        with io.BufferedReader(_PrefetchReader(io.BytesIO(data), block_size=1000, depth=2)) as reader:
+            assert reader.read() == data
+
+    def test_errors_reach_the_reader(self, tmp_path):
+        """Test a decompression error is raised in the reading thread"""
+        path = tmp_path / "broken.csv.gz"
+        data = os.urandom(100000).hex().encode()
+        path.write_bytes(gzip.compress(data)[:50000])
+        with open_binary(str(path), "gzip") as f:
+            with pytest.raises(EOFError):
+                f.read()
+
+    def test_close_before_end(self, tmp_path):
+        """Test closing early stops the background thread"""
+        path = _compress(tmp_path / "big.csv.gz", b"a,b\n" * 1000000, "gz")
+        f = open_binary(path, "gzip")
+        f.read(10)
+        f.close()
+        assert f.closed
+
+
+class TestCompressedValidation:
+
+    @pytest.mark.parametrize("suffix", ["gz", "bz2", "xz"])
+    @pytest.mark.parametrize("options", [{}, {"chunksize": 7}, {"workers": 2}, {"fail_fast": True},
+                                         {"row_ids": 3}])
+    def test_matches_uncompressed(self, tmp_path, suffix, options):
+        """Test compressed files give the same report in every mode"""
+        path = _compress(tmp_path / f"data.csv.{suffix}", open(SAMPLE, "rb").read(), suffix)
+        assert validate_file(path, **options) == validate_file(SAMPLE, **options)
+
+    def test_tsv(self, tmp_path):
+        """Test tab-separated files are validated like the CSV they mirror"""
+        path = tmp_path / "data.tsv.gz"
+        with gzip.open(path, "wt") as f:
+            pd.read_csv(SAMPLE).to_csv(f, sep="\t", index=False)
+        report = validate_file(str(path))
+        assert report["file_type"] == "TSV"
+        assert _without_file_type(report) == _without_file_type(validate_file(SAMPLE))
+
+    def test_block_sample_falls_back_to_reservoir(self, tmp_path):
+        """Test sampling a compressed file uses a reservoir sample"""
+        path = _compress(tmp_path / "data.csv.gz", open(SAMPLE, "rb").read(), "gz")
+        report = validate_file(path, sample_rows=20, sample_method="block")
+        assert report["sampling"]["method"] == "reservoir"
+
+    def test_quarantine_keeps_compression(self, tmp_path):
+        """Test quarantine and clean outputs are compressed like the input"""
+        path = _compress(tmp_path / "data.csv.gz", open(SAMPLE, "rb").read(), "gz")
+        report = validate_file(path, quarantine_out=str(tmp_path / "q.csv.gz"),
+                               clean_out=str(tmp_path / "c.csv.gz"))
+        rejected = pd.read_csv(tmp_path / "q.csv.gz")
+        clean = pd.read_csv(tmp_path / "c.csv.gz")
+        assert (len(rejected), len(clean)) == (report["quarantine"]["rejected_rows"],
+                                               report["quarantine"]["clean_rows"])
+        assert len(rejected) + len(clean) == len(pd.read_csv(SAMPLE))
+
+    def test_compressed_ndjson(self, tmp_path):
+        """Test NDJSON records are read through the decompressor"""
+        path = _compress(tmp_path / "records.ndjson.gz", b'{"id": 1}\n{"name": "x"}\n', "gz")
+        plain = tmp_path / "records.ndjson"
+        plain.write_bytes(b'{"id": 1}\n{"name": "x"}\n')
+        assert validate_file(path) == validate_file(str(plain))
+
+    def test_zstd(self, tmp_path):
+        """Test zstd files are read when zstandard is installed"""
+        zstandard = pytest.importorskip("zstandard")
+        path = tmp_path / "data.csv.zst"
+        path.write_bytes(zstandard.ZstdCompressor().compress(open(SAMPLE, "rb").read()))
+        assert validate_file(str(path)) == validate_file(SAMPLE)
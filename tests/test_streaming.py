@@ -0,0 +1,114 @@
+import pytest
+import numpy as np
+import pandas as pd
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from data_validator.validators import validate_file
+from data_validator.accumulators import CSVAccumulator
+from data_validator.sketch import QuantileSketch
+from data_validator.streaming import accumulate_csv
+
+class TestStreaming:
+
+    @pytest.mark.parametrize("chunksize", [1, 7, 33, 1000])
+    def test_chunked_matches_in_memory(self, chunksize):
+        """Test chunked validation reproduces the in-memory report"""
+        for path in ("sample_data/valid_example.csv", "sample_data/invalid_example.csv"):
+            assert validate_file(path, chunksize=chunksize) == validate_file(path)
+
+    def test_mixed_column_across_chunks(self):
+        """Test a stray token in one chunk turns the whole column non-numeric"""
+        df = pd.DataFrame({
+            "heart_rate": [70, 80, 90, 500, "abc", 75],
+            "event_time": ["2024-01-01", "2024-01-02", "bad", "2024-01-04", "2024-01-05", "2024-01-06"]
+        })
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
+            df.to_csv(f.name, index=False)
+            expected = validate_file(f.name)
+            actual = validate_file(f.name, chunksize=2)
+
+        os.unlink(f.name)
+
+        assert actual == expected
+        assert not actual["outliers"]
+
+    @pytest.mark.parametrize("content", [
+        "id,is_control\n1,True\n2,False\n3,\n4,True\n5,False\n6,True\n",
+        "id,flag_date\n1,True\n2,2020-01-01\n3,2020-01-02\n",
+        "id,flag_date\n1,True\n2,\n3,False\n",
+    ])
+    @pytest.mark.parametrize("options", [{"chunksize": 1}, {"chunksize": 2}, {"workers": 2},
+                                         {"max_violations_per_check": 5}])
+    def test_bool_chunks_match_in_memory(self, tmp_path, content, options):
+        """Test bool chunks with blanks, and bool chunks of a date column, match the whole-file report"""
+        path = tmp_path / "flags.csv"
+        path.write_text(content)
+        expected = validate_file(str(path))
+        actual = validate_file(str(path), **options)
+        actual.pop("truncated", None)
+        assert actual == expected
+
+    def test_accumulator_merge(self):
+        """Test merging two accumulators equals accumulating both chunks"""
+        df = pd.DataFrame({"age": [25, None, 150, 40], "x": [1.0, 2.0, 3.0, 100.0]})
+        whole = CSVAccumulator()
+        whole.update(df)
+        left, right = CSVAccumulator(), CSVAccumulator()
+        left.update(df.iloc[:2])
+        right.update(df.iloc[2:])
+        assert left.merge(right).finalize() == whole.finalize()
+
+    def test_accumulate_csv_rejects_bad_chunksize(self):
+        """Test chunksize must be positive"""
+        with pytest.raises(ValueError):
+            accumulate_csv("sample_data/valid_example.csv", chunksize=0)
+
+class TestQuantileSketch:
+
+    def test_exact_below_capacity(self):
+        """Test the sketch matches np.percentile while it holds every value"""
+        values = np.random.default_rng(0).normal(size=500)
+        sketch = QuantileSketch(capacity=1024)
+        sketch.update(values)
+        assert sketch.is_exact
+        assert np.allclose(sketch.quantiles([0.25, 0.75]), np.percentile(values, [25, 75]))
+
+    def test_error_bound_and_memory(self):
+        """Test rank error stays within the documented bound with bounded memory"""
+        rng = np.random.default_rng(1)
+        capacity = 256
+        sketch = QuantileSketch(capacity=capacity)
+        chunks = [rng.normal(size=10_000) for _ in range(20)]
+        for chunk in chunks:
+            sketch.update(chunk)
+        values = np.sort(np.concatenate(chunks))
+        n = len(values)
+        bound = n * (np.log2(n / capacity) + 1) / capacity
+        for q, estimate in zip([0.25, 0.5, 0.75], sketch.quantiles([0.25, 0.5, 0.75])):
+            rank = np.searchsorted(values, estimate)
+            assert abs(rank - q * n) <= bound
+        assert sum(len(level) for level in sketch.levels) <= capacity * len(sketch.levels)
+
+    def test_count_outside_exact_tails(self):
+        """Test outlier counts stay exact after compaction when tails are small"""
+        rng = np.random.default_rng(2)
+        values = np.concatenate([rng.normal(size=50_000), np.full(40, 50.0), np.full(3, -50.0)])
+        sketch = QuantileSketch(capacity=128)
+        for chunk in np.array_split(values, 10):
+            sketch.update(chunk)
+        assert not sketch.is_exact
+        assert sketch.count_outside(-10, 10) == 43
+
+    def test_merge(self):
+        """Test merged sketches keep the total count and extremes"""
+        a, b = QuantileSketch(capacity=64), QuantileSketch(capacity=64)
+        a.update(np.arange(1000))
+        b.update(np.arange(1000, 3000))
+        a.merge(b)
+        assert a.count == 3000
+        assert (a.min, a.max) == (0, 2999)
+        assert a.count_outside(-1, 3000) == 0
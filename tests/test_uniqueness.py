@@ -0,0 +1,117 @@
+import pytest
+import json
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from click.testing import CliRunner
+
+from data_validator.cli import cli
+from data_validator.schema import SchemaError, compile_schema
+from data_validator.uniqueness import UniqueKeyIndex
+from data_validator.validators import validate_file
+
+
+def _keys(n, distinct, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({"id": rng.integers(0, distinct, n).astype(str),
+                         "run": rng.choice(["a", "b"], n)})
+
+
+def _index(frame, columns, memory_limit, chunks=10):
+    index = UniqueKeyIndex(columns, memory_limit, samples=5)
+    size = -(-len(frame) // chunks)
+    for i in range(chunks):
+        index.update(frame.iloc[i * size:(i + 1) * size], i)
+    return index
+
+
+class TestUniqueKeyIndex:
+
+    def test_counts_match_value_counts(self):
+        """Test duplicate counts are exact"""
+        frame = _keys(5000, 2000)
+        result = _index(frame, ["id"], 10 ** 9).finalize()
+        counts = frame["id"].value_counts()
+        assert result["rows"] == 5000
+        assert result["duplicate_keys"] == (counts > 1).sum()
+        assert result["duplicate_rows"] == (counts - 1).sum()
+        assert result["samples"][0] == {"key": counts.index[0], "count": counts.iloc[0]}
+        assert not result["spilled"]
+
+    @pytest.mark.parametrize("columns", [["id"], ["id", "run"]])
+    def test_spilling_gives_the_same_result(self, columns):
+        """Test a tiny memory limit spills (and re-splits) partitions without changing the result"""
+        frame = _keys(20000, 8000)
+        in_memory = _index(frame, columns, 10 ** 9).finalize(sources=list("abcdefghij"))
+        spilled_index = _index(frame, columns, 20000)
+        spilled = spilled_index.finalize(sources=list("abcdefghij"))
+        assert spilled.pop("spilled") and not in_memory.pop("spilled")
+        assert spilled == in_memory
+        assert spilled_index._directory is None
+
+    def test_dominant_key_stays_within_the_limit(self, monkeypatch):
+        """Test a key filling most of the file costs one entry per chunk, in memory and spilled"""
+        frame = _keys(40000, 10 ** 9)
+        frame.loc[frame.index % 4 != 0, "id"] = "X"
+        from data_validator import uniqueness
+        sizes = []
+        original = uniqueness._duplicates
+        monkeypatch.setattr(uniqueness, "_duplicates", lambda entries, samples: sizes.append(len(entries.keys))
+                            or original(entries, samples))
+        spilled_index = _index(frame, ["id"], 20000)
+        spilled = spilled_index.finalize()
+        counts = frame["id"].value_counts()
+        assert spilled["spilled"]
+        assert spilled["samples"][0] == {"key": "X", "count": counts["X"]}
+        assert spilled["duplicate_rows"] == (counts - 1).sum()
+        assert max(sizes) < 2000
+
+    def test_missing_key_parts_are_skipped(self):
+        """Test rows with any missing key part are not compared"""
+        frame = pd.DataFrame({"id": ["1", "1", None, None], "run": ["a", None, "b", "b"]})
+        result = _index(frame, ["id", "run"], 10 ** 9, chunks=1).finalize()
+        assert (result["rows"], result["duplicate_rows"]) == (1, 0)
+
+
+class TestValidateFile:
+
+    def test_duplicates_fail_the_file(self, tmp_path):
+        """Test duplicated keys are reported per key and fail the file"""
+        path = tmp_path / "samples.csv"
+        path.write_text("sample_id,run,age\nS1,1,30\nS2,1,40\nS2,2,50\nS2,2,60\n")
+        schema = {"unique_keys": ["sample_id", ["sample_id", "run"], "missing_col"]}
+        report = validate_file(str(path), schema, unique_memory=100)
+        assert report["status"] == "FAIL"
+        assert report["duplicates"] == [("sample_id", 2), ("sample_id+run", 1)]
+        assert report["unique_keys"]["sample_id+run"]["samples"] == [{"key": ["S2", "2"], "count": 2}]
+        assert report["unique_keys"]["missing_col"] == {"missing_columns": ["missing_col"]}
+        assert report["total_issues"] == 2
+
+    def test_invalid_spec(self):
+        """Test malformed unique_keys are rejected when the schema is compiled"""
+        with pytest.raises(SchemaError):
+            compile_schema({"unique_keys": [["id", 3]]})
+
+
+class TestCli:
+
+    def test_unique_across_files(self, tmp_path):
+        """Test keys are checked over all files together"""
+        (tmp_path / "a.csv").write_text("id\n1\n2\n")
+        (tmp_path / "b.csv").write_text("id\n2\n3\n")
+        (tmp_path / "schema.json").write_text(json.dumps({"unique_keys": ["id"]}))
+        files = [str(tmp_path / "a.csv"), str(tmp_path / "b.csv")]
+        result = CliRunner().invoke(cli, ["validate", *files, "-s", str(tmp_path / "schema.json"),
+                                          "--unique-across-files", "--no-daemon", "--no-cache",
+                                          "-j", str(tmp_path / "out.json")])
+        assert result.exit_code == 0
+        assert "All files passed" in result.output
+        with open(tmp_path / "out.json") as f:
+            across = json.load(f)["_unique_keys"]["id"]
+        assert across["duplicate_rows"] == 1
+        assert across["samples"] == [{"key": "2", "count": 2, "sources": files}]
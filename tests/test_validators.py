@@ -43,6 +43,19 @@ class TestValidators:
         assert "Mixed types" in type_errors["mixed_col"]
         assert "numeric_col" not in type_errors
 
+    def test_report_type_errors_edge_values(self):
+        """Test vectorized type and date checks keep the per-value parsing rules"""
+        df = pd.DataFrame({
+            "mixed_col": ["1", "nan", "1_000", "1e5", "abc", "", " 3 "],
+            "sample_date": ["2024-01-01", "2024-02-30", "01/31/2024", "0000-01-01",
+                            "2024-01-01T10:00:00Z", "2024-01-01 23:59:60", "2024-01-01"]
+        })
+        timings = {}
+        type_errors = dict(report_type_errors(df, timings))
+        assert type_errors["mixed_col"] == "Mixed types: 5 numeric, 2 non-numeric"
+        assert type_errors["sample_date_date_format"] == "3 invalid date formats"
+        assert set(timings) == {"mixed_col", "sample_date"}
+
     def test_report_format_errors_json(self):
         """Test JSON format validation"""
         data = {"age": 25}  # missing required 'id' field
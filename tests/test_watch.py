@@ -0,0 +1,140 @@
+import pytest
+import json
+import os
+import shutil
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from click.testing import CliRunner
+
+from data_validator.cli import cli
+from data_validator.watch import DirectoryPoller, Watcher
+
+SAMPLE_DIR = os.path.join(os.path.dirname(__file__), '..', 'sample_data')
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestDirectoryPoller:
+
+    def test_waits_for_settle_time(self, tmp_path):
+        """Test a file is reported only after it stops changing for the settle time"""
+        clock = FakeClock()
+        poller = DirectoryPoller(str(tmp_path), settle=2.0, clock=clock)
+        path = tmp_path / "data.csv"
+        path.write_text("a,b\n1,2\n")
+        assert poller.poll() == []
+        clock.now = 1.0
+        with open(path, "a") as f:
+            f.write("3,4\n")
+        assert poller.poll() == []
+        clock.now = 2.5
+        assert poller.poll() == []
+        clock.now = 3.0
+        assert poller.poll() == [str(path)]
+
+    def test_claimed_files_return_only_when_changed(self, tmp_path):
+        """Test a claimed file is not reported again until it is rewritten"""
+        clock = FakeClock()
+        poller = DirectoryPoller(str(tmp_path), settle=0.0, clock=clock)
+        path = tmp_path / "data.csv"
+        path.write_text("a\n1\n")
+        poller.poll()
+        [ready] = poller.poll()
+        poller.claim(ready)
+        assert poller.poll() == []
+        path.write_text("a\n1\n2\n")
+        poller.poll()
+        assert poller.poll() == [str(path)]
+
+    def test_ignores_partial_hidden_and_unsupported_files(self, tmp_path):
+        """Test uploads in progress and marker files are never reported"""
+        poller = DirectoryPoller(str(tmp_path), settle=0.0)
+        for name in ("data.csv.part", ".hidden.csv", "_SUCCESS", "notes.doc"):
+            (tmp_path / name).write_text("a\n1\n")
+        poller.poll()
+        assert poller.poll() == []
+
+    def test_skips_files_with_current_reports(self, tmp_path):
+        """Test a restarted watcher does not revalidate files it already reported"""
+        reports = tmp_path / "reports"
+        reports.mkdir()
+        (tmp_path / "data.csv").write_text("a\n1\n")
+        (reports / "data.csv.json").write_text("{}")
+        poller = DirectoryPoller(str(tmp_path), settle=0.0, reports_dir=str(reports))
+        poller.poll()
+        assert poller.poll() == []
+
+
+class TestWatcher:
+
+    def _landing(self, tmp_path):
+        landing = tmp_path / "landing"
+        landing.mkdir()
+        for name in ("valid_example.csv", "invalid_example.csv"):
+            shutil.copy(os.path.join(SAMPLE_DIR, name), landing / name)
+        return landing
+
+    def test_reports_and_moves(self, tmp_path):
+        """Test files are validated, reported and moved by status"""
+        landing = self._landing(tmp_path)
+        watcher = Watcher(str(landing), pass_dir=str(tmp_path / "ok"), fail_dir=str(tmp_path / "bad"),
+                          settle=0.0, interval=0.01, workers=1)
+        stats = watcher.run(until_idle=True)
+        assert (stats.validated, stats.passed, stats.failed) == (2, 1, 1)
+        assert os.listdir(tmp_path / "ok") == ["valid_example.csv"]
+        assert os.listdir(tmp_path / "bad") == ["invalid_example.csv"]
+        with open(landing / "reports" / "invalid_example.csv.json") as f:
+            report = json.load(f)
+        assert report["status"] == "FAIL"
+        assert report["moved_to"] == str(tmp_path / "bad" / "invalid_example.csv")
+
+    def test_same_name_never_overwrites(self, tmp_path):
+        """Test a later file with an earlier file's name gets its own moved file and report"""
+        landing = tmp_path / "landing"
+        landing.mkdir()
+        watcher = Watcher(str(landing), pass_dir=str(tmp_path / "ok"), fail_dir=str(tmp_path / "bad"),
+                          settle=0.0, interval=0.01, workers=1)
+        for sample in ("valid_example.csv", "invalid_example.csv", "valid_example.csv"):
+            shutil.copy(os.path.join(SAMPLE_DIR, sample), landing / "batch.csv")
+            watcher.run(until_idle=True)
+        assert sorted(os.listdir(tmp_path / "ok")) == ["batch.2.csv", "batch.csv"]
+        assert os.listdir(tmp_path / "bad") == ["batch.1.csv"]
+        reports = {}
+        for name in ("batch.csv", "batch.1.csv", "batch.2.csv"):
+            with open(landing / "reports" / f"{name}.json") as f:
+                reports[name] = json.load(f)
+        assert [report["status"] for report in reports.values()] == ["PASS", "FAIL", "PASS"]
+        assert reports["batch.1.csv"]["moved_to"] == str(tmp_path / "bad" / "batch.1.csv")
+        assert reports["batch.2.csv"]["report_path"] == str(landing / "reports" / "batch.2.csv.json")
+
+    def test_backpressure(self, tmp_path):
+        """Test a full queue leaves files in the directory for a later poll"""
+        landing = self._landing(tmp_path)
+        watcher = Watcher(str(landing), settle=0.0, interval=0.01, workers=1, queue_size=1)
+        watcher.poller.poll()
+        watcher._enqueue()
+        assert len(watcher.queue) == 1
+        assert watcher.stats.backpressure_polls == 1
+        stats = watcher.run(until_idle=True)
+        assert stats.validated == 2
+        assert stats.max_queue_depth == 1
+
+    def test_cli_once(self, tmp_path):
+        """Test watch --once validates the landing directory and writes stats"""
+        landing = self._landing(tmp_path)
+        result = CliRunner().invoke(cli, ["watch", str(landing), "--once", "--move", "--settle", "0",
+                                          "--interval", "0.01", "-w", "1", "-v"])
+        assert result.exit_code == 0
+        assert "PASS: " in result.output and "FAIL: " in result.output
+        assert sorted(os.listdir(landing)) == ["failed", "passed", "reports"]
+        with open(landing / "reports" / "stats.json") as f:
+            assert json.load(f)["validated"] == 2